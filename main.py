@@ -11,19 +11,118 @@ import sys
 
 from src.config import Config
 from src.logging_setup import setup_logging
-from src.runner import (
-    run_master,
-    run_process_new_releases,
-    run_health_check,
-    run_audit_report,
-    run_certify_template,
-    run_certify_all,
-    run_inspect_template,
-    run_scan_template,
-    run_list_new_releases,
-    run_sync_drive_folders,
-    release_lock,
-)
+
+
+# ── Command handlers ──
+# Each handler imports from src.runner itself: src.runner pulls in gspread,
+# the Google API client, python-docx and pdfplumber, which --help and
+# argument errors never need.
+
+def _cmd_run(cfg, args):
+    from src.runner import run_master
+    run_master(
+        cfg,
+        community_filter=args.community,
+        homesite_filter=args.homesite,
+        floorplan_filter=args.floorplan,
+        overwrite_existing_override=args.overwrite_existing,
+        once=args.once,
+    )
+
+
+def _cmd_health_check(cfg, args):
+    from src.runner import run_health_check
+    ok = run_health_check(cfg)
+    sys.exit(0 if ok else 1)
+
+
+def _cmd_process_new_releases(cfg, args):
+    from src.runner import run_process_new_releases
+    run_process_new_releases(
+        cfg,
+        community_filter=args.community,
+        homesite_filter=args.homesite,
+        floorplan_filter=args.floorplan,
+        overwrite_existing_override=args.overwrite_existing,
+        once=args.once,
+    )
+
+
+def _cmd_list_new_releases(cfg, args):
+    from src.runner import run_list_new_releases
+    run_list_new_releases(cfg)
+
+
+def _cmd_certify_all(cfg, args):
+    from src.runner import run_certify_all
+    ok, total, passed, failed = run_certify_all(cfg)
+    print(f"\nDone: {passed}/{total} passed, {failed} failed.")
+    sys.exit(0 if ok else 1)
+
+
+def _cmd_certify_template(cfg, args):
+    if not args.community or not args.floorplan:
+        print("ERROR: --certify-template requires --community and --floorplan")
+        sys.exit(1)
+    from src.runner import run_certify_template
+    ok = run_certify_template(cfg, args.community, args.floorplan)
+    sys.exit(0 if ok else 1)
+
+
+def _cmd_inspect_template_drive(cfg, args):
+    if not args.community or not args.floorplan:
+        print("ERROR: --inspect-template-drive requires --community and --floorplan")
+        sys.exit(1)
+    from src.runner import run_inspect_template
+    run_inspect_template(cfg, args.community, args.floorplan)
+
+
+def _cmd_scan_template_drive(cfg, args):
+    if not args.file_name:
+        print("ERROR: --scan-template-drive requires --file_name")
+        sys.exit(1)
+    from src.runner import run_scan_template
+    run_scan_template(cfg, args.file_name)
+
+
+def _cmd_sync_drive_folders(cfg, args):
+    from src.runner import run_sync_drive_folders
+    run_sync_drive_folders(cfg)
+
+
+def _cmd_audit_report(cfg, args):
+    from src.runner import run_audit_report
+    run_audit_report(cfg)
+
+
+def _cmd_force_lock_reset(cfg, args):
+    from src.runner import release_lock
+    release_lock()
+    print("Process lock cleared.")
+
+
+# (flag, help, handler) - the flag's dest becomes args.cmd
+COMMANDS = [
+    ("--run", "Run the full pipeline (default)", _cmd_run),
+    ("--health-check", "Verify all connections", _cmd_health_check),
+    ("--process-new-releases", "Process PDFs only", _cmd_process_new_releases),
+    ("--list-new-releases", "List PDFs in New Releases", _cmd_list_new_releases),
+    ("--certify-all", "Certify ALL templates", _cmd_certify_all),
+    ("--certify-template", "Certify one template", _cmd_certify_template),
+    ("--inspect-template-drive", "Inspect a template", _cmd_inspect_template_drive),
+    ("--scan-template-drive", "Scan template for markers", _cmd_scan_template_drive),
+    ("--sync-drive-folders", "Cache folder IDs", _cmd_sync_drive_folders),
+    ("--audit-report", "Print audit info", _cmd_audit_report),
+    ("--force-lock-reset", "Clear stuck lock", _cmd_force_lock_reset),
+]
+
+
+# Commands that need no config, logging or secrets; run before Config.load
+NO_CONFIG_COMMANDS = {_cmd_force_lock_reset}
+
+# Read-only local commands: they need config, but not cache dirs, secrets
+# or log files
+LOCAL_READ_ONLY_COMMANDS = {_cmd_audit_report}
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -34,20 +133,13 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument("--config", default="config.yaml", help="Path to config.yaml")
 
-    # Commands - default is --run (master command)
+    # Commands - default is --run (master command).  Every command flag
+    # stores its handler in args.cmd, so dispatch is a single call.
     cmds = parser.add_mutually_exclusive_group(required=False)
-    cmds.add_argument("--run", action="store_true", default=True,
-                       help="Run the full pipeline (default)")
-    cmds.add_argument("--health-check", action="store_true", help="Verify all connections")
-    cmds.add_argument("--process-new-releases", action="store_true", help="Process PDFs only")
-    cmds.add_argument("--list-new-releases", action="store_true", help="List PDFs in New Releases")
-    cmds.add_argument("--certify-all", action="store_true", help="Certify ALL templates")
-    cmds.add_argument("--certify-template", action="store_true", help="Certify one template")
-    cmds.add_argument("--inspect-template-drive", action="store_true", help="Inspect a template")
-    cmds.add_argument("--scan-template-drive", action="store_true", help="Scan template for markers")
-    cmds.add_argument("--sync-drive-folders", action="store_true", help="Cache folder IDs")
-    cmds.add_argument("--audit-report", action="store_true", help="Print audit info")
-    cmds.add_argument("--force-lock-reset", action="store_true", help="Clear stuck lock")
+    for flag, help_text, handler in COMMANDS:
+        cmds.add_argument(flag, dest="cmd", action="store_const", const=handler,
+                          help=help_text)
+    parser.set_defaults(cmd=_cmd_run)
 
     # Filters
     parser.add_argument("--community", default=None, help="Filter by community")
@@ -58,6 +150,8 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--dry-run", action="store_true", help="Simulate without uploading")
     parser.add_argument("--once", action="store_true", help="Run one cycle only")
     parser.add_argument("--overwrite-existing", action="store_true", help="Overwrite existing rows")
+    parser.add_argument("--use-cache", action="store_true",
+                        help="Reuse Drive metadata and the parsed config cached by earlier runs")
 
     # Scan options
     parser.add_argument("--file_name", default=None, help="Template filename (for --scan-template-drive)")
@@ -69,9 +163,15 @@ def main():
     parser = build_parser()
     args = parser.parse_args()
 
+    if args.cmd in NO_CONFIG_COMMANDS:
+        args.cmd(None, args)
+        return
+
     # Load config
     try:
-        cfg = Config.load(args.config)
+        # Read-only commands leave the config cache alone
+        cfg = Config.load(args.config,
+                          use_cache=args.use_cache and args.cmd not in LOCAL_READ_ONLY_COMMANDS)
     except Exception as e:
         print(f"ERROR loading config: {e}")
         sys.exit(1)
@@ -81,75 +181,16 @@ def main():
         cfg.app.dry_run = True
     if args.overwrite_existing:
         cfg.app.overwrite_existing = True
+    if args.use_cache:
+        cfg.drive.use_metadata_cache = True
 
     # Setup logging and dirs
-    cfg.ensure_cache_dirs()
-    cfg.materialize_secrets_from_env()  # Write secrets from env vars (CI/cloud)
-    logger = setup_logging()
-
-    # Figure out which command to run
-    # (--run is default, but other flags override it)
-    if args.health_check:
-        ok = run_health_check(cfg)
-        sys.exit(0 if ok else 1)
-
-    elif args.process_new_releases:
-        run_process_new_releases(
-            cfg,
-            community_filter=args.community,
-            homesite_filter=args.homesite,
-            floorplan_filter=args.floorplan,
-            overwrite_existing_override=args.overwrite_existing,
-            once=args.once,
-        )
-
-    elif args.list_new_releases:
-        run_list_new_releases(cfg)
-
-    elif args.certify_all:
-        ok, total, passed, failed = run_certify_all(cfg)
-        print(f"\nDone: {passed}/{total} passed, {failed} failed.")
-        sys.exit(0 if ok else 1)
-
-    elif args.certify_template:
-        if not args.community or not args.floorplan:
-            print("ERROR: --certify-template requires --community and --floorplan")
-            sys.exit(1)
-        ok = run_certify_template(cfg, args.community, args.floorplan)
-        sys.exit(0 if ok else 1)
-
-    elif args.inspect_template_drive:
-        if not args.community or not args.floorplan:
-            print("ERROR: --inspect-template-drive requires --community and --floorplan")
-            sys.exit(1)
-        run_inspect_template(cfg, args.community, args.floorplan)
-
-    elif args.scan_template_drive:
-        if not args.file_name:
-            print("ERROR: --scan-template-drive requires --file_name")
-            sys.exit(1)
-        run_scan_template(cfg, args.file_name)
-
-    elif args.sync_drive_folders:
-        run_sync_drive_folders(cfg)
-
-    elif args.audit_report:
-        run_audit_report(cfg)
-
-    elif args.force_lock_reset:
-        release_lock()
-        print("Process lock cleared.")
-
-    else:
-        # Default: run the full pipeline
-        run_master(
-            cfg,
-            community_filter=args.community,
-            homesite_filter=args.homesite,
-            floorplan_filter=args.floorplan,
-            overwrite_existing_override=args.overwrite_existing,
-            once=args.once,
-        )
+    if args.cmd not in LOCAL_READ_ONLY_COMMANDS:
+        cfg.ensure_cache_dirs()
+        cfg.materialize_secrets_from_env()  # Write secrets from env vars (CI/cloud)
+        setup_logging()
+
+    args.cmd(cfg, args)
 
 
 if __name__ == "__main__":
@@ -17,10 +17,14 @@ Signal flow:
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import gspread
+from gspread.utils import rowcol_to_a1
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger("price_sheet_bot.agent_sync")
 
@@ -38,13 +42,20 @@ COL_STATUS = 2    # B: Status (IDLE/WORKING/DONE)
 COL_TIMESTAMP = 3 # C: Timestamp
 COL_NOTE = 4      # D: Note
 
+# Timestamps are UTC.  No zone suffix, so USER_ENTERED writes are parsed by
+# Sheets into native (sortable, filterable) date-time values.
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 # Status values
 IDLE = "IDLE"
 WORKING = "WORKING"
 DONE = "DONE"
 
 # Polling settings
-DEFAULT_POLL_INTERVAL = 15   # seconds between checks
+DEFAULT_POLL_INTERVAL = 15   # max seconds between checks
+MIN_POLL_INTERVAL = 1.0      # first check delay; backs off up to poll_interval
+POLL_BACKOFF = 1.5           # growth factor while status is unchanged
+STATUS_CACHE_TTL = 5         # seconds a read map_agent status may be reused
 DEFAULT_TIMEOUT = 600        # 10 minutes max wait
 
 SCOPES = [
@@ -52,6 +63,40 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive",
 ]
 
+# HTTP transport settings (keep-alive pool + transport-level retries)
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 10
+HTTP_MAX_RETRIES = 5
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_RETRY_STATUSES = (429, 500, 502, 503)
+
+# One authorized client per credentials file for the life of the process,
+# so repeated connect() calls reuse credentials and open connections.
+_CLIENT_CACHE: Dict[str, gspread.Client] = {}
+
+
+def _get_client(credentials_path: str) -> gspread.Client:
+    """Return a cached gspread client backed by a pooled, retrying session."""
+    client = _CLIENT_CACHE.get(credentials_path)
+    if client is not None:
+        return client
+
+    creds = Credentials.from_service_account_file(credentials_path, scopes=SCOPES)
+    session = AuthorizedSession(creds)
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=HTTP_MAX_RETRIES,
+            backoff_factor=HTTP_BACKOFF_FACTOR,
+            status_forcelist=HTTP_RETRY_STATUSES,
+        ),
+    )
+    session.mount("https://", adapter)
+    client = gspread.Client(auth=creds, session=session)
+    _CLIENT_CACHE[credentials_path] = client
+    return client
+
 
 class AgentSync:
     """Manages coordination with the map agent via shared status sheet."""
@@ -61,13 +106,12 @@ class AgentSync:
         self._client: Optional[gspread.Client] = None
         self._sheet: Optional[gspread.Spreadsheet] = None
         self._ws: Optional[gspread.Worksheet] = None
+        # (map_status, time.monotonic() when read), refreshed on every read
+        self._last_map_status: Optional[Tuple[str, float]] = None
 
     def connect(self):
         """Connect to the agent_status spreadsheet."""
-        creds = Credentials.from_service_account_file(
-            self.credentials_path, scopes=SCOPES
-        )
-        self._client = gspread.authorize(creds)
+        self._client = _get_client(self.credentials_path)
         self._sheet = self._client.open_by_key(AGENT_STATUS_SPREADSHEET_ID)
         self._ws = self._sheet.worksheet(AGENT_STATUS_TAB)
         logger.info("Connected to agent_status sheet.")
@@ -80,46 +124,69 @@ class AgentSync:
 
     # ── Read status ──
 
+    def _read_statuses(self) -> Tuple[str, str]:
+        """Read both agents' statuses (col B, rows 2-3) in one API call.
+
+        Returns (map_status, pricing_status).
+        """
+        first = min(MAP_AGENT_ROW, PRICING_AGENT_ROW)
+        last = max(MAP_AGENT_ROW, PRICING_AGENT_ROW)
+        range_name = (f"{rowcol_to_a1(first, COL_STATUS)}:"
+                      f"{rowcol_to_a1(last, COL_STATUS)}")
+        values = self.ws.batch_get([range_name])[0]
+
+        def _status_at(row: int) -> str:
+            offset = row - first
+            # Trailing empty rows/cells are omitted from the API response
+            if offset < len(values) and values[offset]:
+                return str(values[offset][0] or "").strip().upper()
+            return ""
+
+        map_status = _status_at(MAP_AGENT_ROW)
+        self._last_map_status = (map_status, time.monotonic())
+        return map_status, _status_at(PRICING_AGENT_ROW)
+
     def get_map_agent_status(self) -> str:
         """Read map_agent's current status (row 2, col B)."""
-        val = self.ws.cell(MAP_AGENT_ROW, COL_STATUS).value
-        return (val or "").strip().upper()
+        return self._read_statuses()[0]
 
     def get_pricing_agent_status(self) -> str:
         """Read pricing_agent's current status (row 3, col B)."""
-        val = self.ws.cell(PRICING_AGENT_ROW, COL_STATUS).value
-        return (val or "").strip().upper()
+        return self._read_statuses()[1]
 
     # ── Write status ──
 
     def _set_status(self, row: int, status: str, note: str = ""):
         """Update status, timestamp, and note for a row."""
-        now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-        self.ws.update_cell(row, COL_STATUS, status)
-        self.ws.update_cell(row, COL_TIMESTAMP, now)
+        now = datetime.now(timezone.utc).strftime(TIMESTAMP_FORMAT)
+        # One range write instead of a call per cell.  When there is no note,
+        # stop at the timestamp column so an existing note is not clobbered.
+        values = [status, now]
+        last_col = COL_TIMESTAMP
         if note:
-            self.ws.update_cell(row, COL_NOTE, note)
+            values.append(note)
+            last_col = COL_NOTE
+        range_name = (f"{rowcol_to_a1(row, COL_STATUS)}:"
+                      f"{rowcol_to_a1(row, last_col)}")
+        self.ws.update(range_name=range_name, values=[values],
+                       value_input_option="USER_ENTERED")
         logger.info("Set row %d status = %s (note: %s)", row, status, note or "(none)")
 
     def set_pricing_working(self, note: str = "Updating CONTROL sheet"):
         """Signal: pricing agent is WORKING (map agent should pause)."""
         self._set_status(PRICING_AGENT_ROW, WORKING, note)
-        print(f"  [SYNC] Set pricing_agent = WORKING")
 
     def set_pricing_done(self, note: str = "CONTROL updates complete"):
         """Signal: pricing agent finished CONTROL updates (triggers map agent)."""
         self._set_status(PRICING_AGENT_ROW, DONE, note)
-        print(f"  [SYNC] Set pricing_agent = DONE (map agent will start)")
 
     def set_pricing_idle(self, note: str = ""):
         """Reset pricing agent to IDLE."""
         self._set_status(PRICING_AGENT_ROW, IDLE, note)
-        print(f"  [SYNC] Set pricing_agent = IDLE")
 
     def reset_map_agent(self, note: str = "Reset by pricing agent after PDF export"):
         """Reset map_agent status to IDLE after we're done with PDF export."""
         self._set_status(MAP_AGENT_ROW, IDLE, note)
-        print(f"  [SYNC] Reset map_agent = IDLE")
 
     # ── Wait for map agent ──
 
@@ -131,33 +198,38 @@ class AgentSync:
     ) -> bool:
         """Poll until map_agent status = DONE, then return True.
 
+        Polls quickly at first and backs off exponentially up to
+        poll_interval while the status stays the same; any status change
+        resets the delay so a fast map agent is noticed within seconds.
+
         If map_agent stays IDLE for longer than idle_grace seconds, it means
         the map agent is not running/watching. In that case, skip the wait
         and proceed (so the pipeline doesn't hang).
 
         Returns False if timeout or idle grace is reached.
         """
-        print(f"\n  [SYNC] Waiting for map agent to finish (polling every {poll_interval}s, "
-              f"timeout {timeout}s)...")
+        logger.info("Waiting for map agent to finish (polling up to every %ss, timeout %ss)...",
+                    poll_interval, timeout)
         start = time.time()
         last_status = ""
         idle_since = None  # Track how long map_agent has been IDLE
+        delay = MIN_POLL_INTERVAL
 
         while True:
             elapsed = time.time() - start
             if elapsed >= timeout:
-                print(f"  [SYNC] TIMEOUT after {timeout}s. Map agent did not finish.")
                 logger.warning("Timed out waiting for map_agent = DONE after %ds", timeout)
                 return False
 
-            status = self.get_map_agent_status()
+            status, _ = self._read_statuses()
 
             if status != last_status:
-                print(f"  [SYNC] map_agent status = {status} ({int(elapsed)}s elapsed)")
+                logger.info("map_agent status = %s (%ds elapsed)", status, int(elapsed))
                 last_status = status
+                delay = MIN_POLL_INTERVAL
 
             if status == DONE:
-                print(f"  [SYNC] Map agent is DONE! Proceeding with PDF export.")
+                logger.info("Map agent is DONE. Proceeding with PDF export.")
                 return True
 
             if status == WORKING:
@@ -168,15 +240,15 @@ class AgentSync:
                 if idle_since is None:
                     idle_since = time.time()
                 elif time.time() - idle_since >= idle_grace:
-                    print(f"  [SYNC] Map agent still IDLE after {idle_grace}s — "
-                          f"it may not be running. Proceeding without maps.")
                     logger.warning(
-                        "Map agent stayed IDLE for %ds. Proceeding without waiting.",
+                        "Map agent stayed IDLE for %ds; it may not be running. "
+                        "Proceeding without maps.",
                         idle_grace,
                     )
                     return False
 
-            time.sleep(poll_interval)
+            time.sleep(min(delay, poll_interval))
+            delay = min(poll_interval, delay * POLL_BACKOFF)
 
     # ── Safety check ──
 
@@ -184,8 +256,13 @@ class AgentSync:
         """Check that map_agent is not currently WORKING.
 
         Per the protocol, we should NOT write to CONTROL while map_agent = WORKING.
+        Reuses a status read within the last STATUS_CACHE_TTL seconds.
         """
-        status = self.get_map_agent_status()
+        cached = self._last_map_status
+        if cached is not None and time.monotonic() - cached[1] < STATUS_CACHE_TTL:
+            status = cached[0]
+        else:
+            status = self.get_map_agent_status()
         if status == WORKING:
             logger.warning("map_agent is currently WORKING. Should not write to CONTROL.")
             return False
@@ -1,12 +1,33 @@
 """Configuration loader and validator for Price Sheet Bot."""
 
+import hashlib
 import json
 import os
+import pickle
 import yaml
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
 from typing import Optional
 
+from .utils import atomic_write
+
+try:
+    import orjson as _json  # optional, faster JSON parsing
+except ImportError:
+    _json = json
+
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml C extension
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# With Config.load(use_cache=True), parsed configs are pickled here, keyed
+# by path + mtime + content hash.  Only files owned by this user and not
+# writable by others are unpickled.
+CONFIG_CACHE_DIR = "./cache"
+# Bump when the dataclasses below change shape, so stale pickles are ignored.
+CONFIG_CACHE_VERSION = 5
+
 
 @dataclass
 class GoogleConfig:
@@ -33,6 +54,8 @@ class DriveConfig:
     download_cache_dir: str = "./cache/downloads"
     folder_cache_file: str = "./cache/drive_folders.json"
     processed_manifest: str = "./cache/processed_manifest.json"
+    use_metadata_cache: bool = False
+    metadata_cache_file: str = "./cache/drive_metadata.sqlite"
 
 
 @dataclass
@@ -59,6 +82,36 @@ class PdfConfig:
     require_control_match: bool = True
     on_unknown_pdf: str = "quarantine"
     quarantine_folder_name: str = "Quarantine"
+    speculative_drive_export: bool = False
+    race_export_engines: bool = False
+    use_pymupdf: bool = False
+
+
+# ── Section schema ──
+# Field names, types and defaults come from the dataclasses above; keys
+# missing from the YAML take the dataclass default, unknown keys are ignored.
+_CHECKED_TYPES = (str, bool, int)
+
+
+def _build_section(cls, section_raw: dict, section: str):
+    """Build one config section dataclass from its YAML mapping, checking scalar types."""
+    kwargs = {}
+    for f in fields(cls):
+        if f.name not in section_raw:
+            if f.default is MISSING and f.default_factory is MISSING:
+                raise ValueError(f"{section}.{f.name} is required.")
+            continue
+        value = section_raw[f.name]
+        if value is not None and f.type in _CHECKED_TYPES:
+            # bool is an int subclass; don't let True pass as a number
+            wrong_bool = f.type is int and isinstance(value, bool)
+            if wrong_bool or not isinstance(value, f.type):
+                raise ValueError(
+                    f"{section}.{f.name} must be {f.type.__name__}, "
+                    f"got {type(value).__name__}: {value!r}"
+                )
+        kwargs[f.name] = value
+    return cls(**kwargs)
 
 
 @dataclass
@@ -70,15 +123,43 @@ class Config:
     config_path: str = ""
 
     @staticmethod
-    def load(config_path: str) -> "Config":
-        """Load config from YAML file and validate."""
+    def load(config_path: str, use_cache: bool = False) -> "Config":
+        """Load config from YAML file and validate.
+
+        With use_cache, the validated Config is cached on disk; an unchanged
+        YAML file (same mtime and content hash) is loaded from the cache
+        instead of being re-parsed.
+        """
         path = Path(config_path)
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {config_path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            raw = yaml.safe_load(f)
+        resolved = str(path.resolve())
+        raw_bytes = path.read_bytes()
+        if not use_cache:
+            return Config._parse(yaml.load(raw_bytes, Loader=_YamlLoader), config_path, resolved)
+
+        key = (
+            CONFIG_CACHE_VERSION,
+            path.stat().st_mtime_ns,
+            hashlib.blake2b(raw_bytes).hexdigest(),
+        )
+        cache_file = os.path.join(
+            CONFIG_CACHE_DIR,
+            f"config.{hashlib.blake2b(resolved.encode('utf-8'), digest_size=8).hexdigest()}.pkl",
+        )
+
+        cached = _read_config_cache(cache_file, key)
+        if cached is not None:
+            return cached
+
+        cfg = Config._parse(yaml.load(raw_bytes, Loader=_YamlLoader), config_path, resolved)
+        _write_config_cache(cache_file, key, cfg)
+        return cfg
 
+    @staticmethod
+    def _parse(raw, config_path: str, resolved_path: str) -> "Config":
+        """Validate a raw YAML dict and build the Config dataclasses."""
         if not raw or not isinstance(raw, dict):
             raise ValueError(f"Config file is empty or invalid: {config_path}")
 
@@ -87,13 +168,17 @@ class Config:
             if section not in raw:
                 raise ValueError(f"Missing required config section: '{section}'")
 
-        google_raw = raw["google"]
-        drive_raw = raw["drive"]
-        app_raw = raw["app"]
-        pdf_raw = raw["pdf"]
+        google_raw = raw["google"] or {}
+        drive_raw = raw["drive"] or {}
+        app_raw = raw["app"] or {}
+        pdf_raw = raw["pdf"] or {}
+        for section, section_raw in (("google", google_raw), ("drive", drive_raw),
+                                     ("app", app_raw), ("pdf", pdf_raw)):
+            if not isinstance(section_raw, dict):
+                raise ValueError(f"Config section '{section}' must be a mapping.")
 
         # Validate required google fields
-        if not google_raw.get("spreadsheet_id") or google_raw["spreadsheet_id"].startswith("PASTE_"):
+        if not google_raw.get("spreadsheet_id") or str(google_raw["spreadsheet_id"]).startswith("PASTE_"):
             raise ValueError(
                 "google.spreadsheet_id is not set. "
                 "Open your Google Sheet and copy the ID from the URL."
@@ -101,31 +186,8 @@ class Config:
         if not google_raw.get("credentials_json_path"):
             raise ValueError("google.credentials_json_path is required.")
 
-        google = GoogleConfig(
-            spreadsheet_id=google_raw["spreadsheet_id"],
-            credentials_json_path=google_raw.get("credentials_json_path", "./secrets/service_account.json"),
-            control_tab=google_raw.get("control_tab", "CONTROL"),
-            mapping_tab=google_raw.get("mapping_tab", "MAPPING"),
-        )
-
-        # Validate drive folder IDs if required
-        drive = DriveConfig(
-            enabled=drive_raw.get("enabled", True),
-            require_folder_ids=drive_raw.get("require_folder_ids", True),
-            allow_name_fallback=drive_raw.get("allow_name_fallback", False),
-            shared_drive_id=drive_raw.get("shared_drive_id"),
-            templates_folder_id=drive_raw.get("templates_folder_id", ""),
-            new_releases_folder_id=drive_raw.get("new_releases_folder_id", ""),
-            final_price_sheets_folder_id=drive_raw.get("final_price_sheets_folder_id", ""),
-            sop_folder_id=drive_raw.get("sop_folder_id", ""),
-            allow_deletions=drive_raw.get("allow_deletions", False),
-            move_processed_pdfs=drive_raw.get("move_processed_pdfs", True),
-            keep_originals=drive_raw.get("keep_originals", True),
-            overwrite_drive_files=drive_raw.get("overwrite_drive_files", False),
-            download_cache_dir=drive_raw.get("download_cache_dir", "./cache/downloads"),
-            folder_cache_file=drive_raw.get("folder_cache_file", "./cache/drive_folders.json"),
-            processed_manifest=drive_raw.get("processed_manifest", "./cache/processed_manifest.json"),
-        )
+        google = _build_section(GoogleConfig, google_raw, "google")
+        drive = _build_section(DriveConfig, drive_raw, "drive")
 
         if drive.enabled and drive.require_folder_ids:
             for folder_key in ["templates_folder_id", "new_releases_folder_id",
@@ -137,36 +199,15 @@ class Config:
                         f"Open the folder in Google Drive and copy the ID from the URL."
                     )
 
-        app = AppConfig(
-            schema_version=app_raw.get("schema_version", 1),
-            strict_mode=app_raw.get("strict_mode", True),
-            poll_interval_seconds=app_raw.get("poll_interval_seconds", 0),
-            dry_run=app_raw.get("dry_run", False),
-            skip_unchanged=app_raw.get("skip_unchanged", True),
-            remove_invisible_code=app_raw.get("remove_invisible_code", True),
-            overwrite_existing=app_raw.get("overwrite_existing", False),
-            update_only_blank_cells=app_raw.get("update_only_blank_cells", True),
-            allow_price_update_when_filling_blanks=app_raw.get("allow_price_update_when_filling_blanks", False),
-            allow_uncertified_templates=app_raw.get("allow_uncertified_templates", False),
-            allow_overwrite_in_production=app_raw.get("allow_overwrite_in_production", False),
-            default_if_blank=app_raw.get("default_if_blank", "leave"),
-            print_watching_message=app_raw.get("print_watching_message", True),
-        )
-
-        pdf = PdfConfig(
-            enabled=pdf_raw.get("enabled", True),
-            parse_strategy=pdf_raw.get("parse_strategy", "filename_first"),
-            require_control_match=pdf_raw.get("require_control_match", True),
-            on_unknown_pdf=pdf_raw.get("on_unknown_pdf", "quarantine"),
-            quarantine_folder_name=pdf_raw.get("quarantine_folder_name", "Quarantine"),
-        )
+        app = _build_section(AppConfig, app_raw, "app")
+        pdf = _build_section(PdfConfig, pdf_raw, "pdf")
 
         return Config(
             google=google,
             drive=drive,
             app=app,
             pdf=pdf,
-            config_path=str(path.resolve()),
+            config_path=resolved_path,
         )
 
     def ensure_cache_dirs(self):
@@ -181,7 +222,8 @@ class Config:
     def materialize_secrets_from_env(self):
         """Write secret files from environment variables (for CI/cloud use).
 
-        Checks for these env vars and writes them to disk if present:
+        Checks for these env vars and writes them to disk if present and
+        different from what is already there:
           - SERVICE_ACCOUNT_JSON  -> secrets/service_account.json
           - OAUTH_CREDENTIALS_JSON -> secrets/oauth_credentials.json
           - OAUTH_USER_TOKEN_JSON  -> secrets/user_token.json
@@ -195,13 +237,51 @@ class Config:
         }
         for env_var, file_path in env_to_file.items():
             value = os.environ.get(env_var)
-            if value:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(value)
-                # Validate it's proper JSON
-                try:
-                    json.loads(value)
-                except json.JSONDecodeError:
-                    raise ValueError(
-                        f"Env var {env_var} is not valid JSON."
-                    )
+            if not value:
+                continue
+            # Validate it's proper JSON before anything touches the disk
+            try:
+                _json.loads(value)
+            except ValueError:  # json/orjson JSONDecodeError
+                raise ValueError(
+                    f"Env var {env_var} is not valid JSON."
+                )
+            # Skip the write when the file already holds the same content
+            new_bytes = value.encode("utf-8")
+            try:
+                with open(file_path, "rb") as f:
+                    existing = f.read()
+            except OSError:
+                existing = None
+            if existing == new_bytes:
+                continue
+            with open(file_path, "wb") as f:
+                f.write(new_bytes)
+
+
+def _read_config_cache(cache_file: str, key: tuple) -> Optional[Config]:
+    """Return the cached Config if its key matches, else None.
+
+    Files another user could have written are ignored: unpickling runs code.
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            st = os.fstat(f.fileno())
+            if hasattr(os, "getuid") and st.st_uid != os.getuid():
+                return None
+            if st.st_mode & 0o022:  # Group- or world-writable
+                return None
+            cached_key, cfg = pickle.load(f)
+    except Exception:
+        return None
+    if cached_key != key or not isinstance(cfg, Config):
+        return None
+    return cfg
+
+
+def _write_config_cache(cache_file: str, key: tuple, cfg: Config):
+    """Best-effort write of the parsed Config; failures only cost a re-parse."""
+    try:
+        atomic_write(cache_file, pickle.dumps((key, cfg), protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
@@ -1,15 +1,47 @@
 """CONTROL tab parser - reads and filters control rows from Google Sheet."""
 
 import logging
-from dataclasses import dataclass
-from typing import List, Optional
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
 
 from .utils import normalize_for_compare
 
 logger = logging.getLogger("price_sheet_bot.control")
 
+# Accepted column spellings, in priority order
+_MOVE_IN_KEYS = ("move_in", "move in", "move in date", "movein")
+_READY_BY_KEYS = ("ready_by", "ready by")
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10; on 3.9 rows keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# normalize_for_compare results per distinct raw string.  CONTROL has only a
+# few dozen distinct communities/homesites/floorplans across thousands of rows.
+_norm_cache: Dict[str, str] = {}
+
+
+def _normalize(value) -> str:
+    """normalize_for_compare, memoized for strings and interned."""
+    if not isinstance(value, str):
+        return normalize_for_compare(value)
+    norm = _norm_cache.get(value)
+    if norm is None:
+        norm = _norm_cache[value] = sys.intern(normalize_for_compare(value))
+    return norm
+
+
+def _first(record: dict, keys: tuple, default=""):
+    """Return the value of the first key present in record, else default."""
+    for key in keys:
+        value = record.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+@dataclass(**_SLOTS)
 class ControlRow:
     """A single row from the CONTROL tab."""
     enabled: bool
@@ -22,6 +54,11 @@ class ControlRow:
     move_in: str    # Raw move-in date as shown in Google Sheet (may be "April, 2026" etc.)
     notes: str
     row_index: int  # 1-based row in sheet (for debugging)
+    # Normalized (community, homesite, floorplan), computed once for lookups
+    _key: Tuple[str, str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._key = control_key(self.community, self.homesite, self.floorplan)
 
     @staticmethod
     def from_dict(record: dict, row_index: int) -> Optional["ControlRow"]:
@@ -30,9 +67,10 @@ class ControlRow:
         if enabled_raw not in ("TRUE", "1", "YES"):
             return None
 
-        community = str(record.get("community", "")).strip()
-        homesite = str(record.get("homesite", "")).strip()
-        floorplan = str(record.get("floorplan", "")).strip()
+        # Interned: values repeat across many rows, so rows share one string
+        community = sys.intern(str(record.get("community", "")).strip())
+        homesite = sys.intern(str(record.get("homesite", "")).strip())
+        floorplan = sys.intern(str(record.get("floorplan", "")).strip())
 
         if not community or not homesite or not floorplan:
             logger.warning(
@@ -44,14 +82,8 @@ class ControlRow:
         # Move-in date: read from "move_in" or "move in" column if present,
         # otherwise fall back to ready_by column.  The ready_by field stores
         # the parsed MM/DD/YYYY version used for the Word template.
-        move_in_raw = str(
-            record.get("move_in",
-            record.get("move in",
-            record.get("move in date",
-            record.get("movein", "")
-        )))).strip()
-
-        ready_by_raw = str(record.get("ready_by", record.get("ready by", ""))).strip()
+        move_in_raw = str(_first(record, _MOVE_IN_KEYS)).strip()
+        ready_by_raw = str(_first(record, _READY_BY_KEYS)).strip()
 
         # If move_in is present but ready_by is blank, use move_in as the source
         # for ready_by (after date parsing).  If both present, ready_by wins for
@@ -80,29 +112,55 @@ def parse_control_tab(records: list) -> List[ControlRow]:
 
     Only returns enabled rows with valid community/homesite/floorplan.
     """
-    rows = []
-    for i, record in enumerate(records):
-        row = ControlRow.from_dict(record, row_index=i + 2)  # +2: header is row 1
-        if row is not None:
-            rows.append(row)
+    rows = [
+        row for row in (
+            ControlRow.from_dict(record, row_index=i + 2)  # +2: header is row 1
+            for i, record in enumerate(records)
+        )
+        if row is not None
+    ]
     logger.info("Parsed %d enabled CONTROL rows from %d total.", len(rows), len(records))
     return rows
 
 
-def find_control_row(
+def control_key(community, homesite, floorplan) -> Tuple[str, str, str]:
+    """Normalized (community, homesite, floorplan) lookup key."""
+    return (
+        _normalize(community),
+        _normalize(homesite),
+        _normalize(floorplan),
+    )
+
+
+def build_control_index(
     control_rows: List[ControlRow],
+) -> Dict[Tuple[str, str, str], ControlRow]:
+    """Index CONTROL rows by normalized key for O(1) find_control_row lookups.
+
+    The first row wins when keys repeat, matching the linear-scan behaviour.
+    """
+    index = {}
+    for row in control_rows:
+        index.setdefault(row._key, row)
+    return index
+
+
+def find_control_row(
+    control_rows: Union[List[ControlRow], Dict[Tuple[str, str, str], ControlRow]],
     community: str,
     homesite: str,
     floorplan: str,
 ) -> Optional[ControlRow]:
-    """Find a CONTROL row matching (community, homesite, floorplan) case-insensitive."""
-    c_norm = normalize_for_compare(community)
-    h_norm = normalize_for_compare(homesite)
-    f_norm = normalize_for_compare(floorplan)
+    """Find a CONTROL row matching (community, homesite, floorplan) case-insensitive.
+
+    Accepts either the parsed row list or an index from build_control_index();
+    callers doing many lookups should build the index once and pass that.
+    """
+    key = control_key(community, homesite, floorplan)
+    if isinstance(control_rows, dict):
+        return control_rows.get(key)
 
     for row in control_rows:
-        if (normalize_for_compare(row.community) == c_norm
-                and normalize_for_compare(row.homesite) == h_norm
-                and normalize_for_compare(row.floorplan) == f_norm):
+        if row._key == key:
             return row
     return None
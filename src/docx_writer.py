@@ -7,14 +7,19 @@ Formatting rules applied to every data row written:
                                          (rest of row stays normal)
 """
 
+import copy
+import hashlib
 import io
 import logging
-from typing import Optional
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from functools import lru_cache
+from typing import BinaryIO, List, Optional, Tuple
 
+from lxml import etree
 from docx import Document
-from docx.table import Table
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.table import Table, _Cell
+from docx.oxml.ns import nsmap, qn
 from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT, WD_ALIGN_VERTICAL
@@ -27,7 +32,11 @@ from .utils import (
     normalize_for_compare,
 )
 from .control_parser import ControlRow
-from .locator import TableMatch
+from .locator import (
+    TableMatch,
+    find_table_by_invisible_code,
+    remove_invisible_code as do_remove,
+)
 
 logger = logging.getLogger("price_sheet_bot.docx_writer")
 
@@ -39,6 +48,35 @@ COLOR_BLACK  = RGBColor(0x00, 0x00, 0x00)
 # Purple: a rich purple (#7030A0 is Word's standard purple)
 HEX_PURPLE   = "7030A0"
 HEX_RED_FILL = "FF0000"   # used if you ever want red fill (not needed currently)
+HEX_RED      = str(COLOR_RED)
+HEX_WHITE    = str(COLOR_WHITE)
+HEX_BLACK    = str(COLOR_BLACK)
+
+# Clark-notation tag/attribute names, resolved once instead of per qn() call
+_QN_TC = qn("w:tc")
+_QN_P = qn("w:p")
+_QN_R = qn("w:r")
+_QN_T = qn("w:t")
+_QN_SHD = qn("w:shd")
+_QN_VAL = qn("w:val")
+_QN_COLOR = qn("w:color")
+_QN_FILL = qn("w:fill")
+_QN_THEME_COLOR = qn("w:themeColor")
+_QN_RPR = qn("w:rPr")
+_QN_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# Characters CT_R.text turns into <w:tab/>/<w:br/> rather than <w:t> text
+_RUN_SPECIAL_CHARS = frozenset("\t\n\r")
+
+# Text-bearing run content of one <w:p> (including hyperlinked runs), in
+# document order.  str() of each element gives its text as CT_R.text does:
+# <w:t> its text, <w:tab/> "\t", <w:br/>/<w:cr/> "\n".  Reading this straight
+# from the XML skips the _Cell/Paragraph/Run wrappers.
+_RUN_CONTENT = ("w:br", "w:cr", "w:noBreakHyphen", "w:ptab", "w:t", "w:tab")
+_P_TEXT_XPATH = etree.XPath(
+    " | ".join(f"{run}/{tag}" for run in ("w:r", "w:hyperlink/w:r") for tag in _RUN_CONTENT),
+    namespaces={"w": nsmap["w"]},
+)
 
 
 class DocxWriteResult:
@@ -50,20 +88,88 @@ class DocxWriteResult:
         self.error: str = ""
 
 
+# ── Memoized lookups ──
+# Site strings repeat across rows and writes, and every write against the
+# same template sees the same header row, so these are cached by value.
+_normalize_site = lru_cache(maxsize=1024)(normalize_for_compare)
+# Prices and ready-by dates repeat across the homesites of a release
+_format_price = lru_cache(maxsize=1024)(format_price)
+_parse_ready_by = lru_cache(maxsize=1024)(parse_ready_by)
+
+
+@lru_cache(maxsize=64)
+def _cached_header_map(header_cells: tuple) -> dict:
+    """build_header_map for a header row; callers must copy the result."""
+    return build_header_map(list(header_cells))
+
+
+# ── Parsed template cache ──
+# Parsed Documents keyed by a hash of their bytes.  A template is cached the
+# second time its bytes are seen (the first sighting only records the key),
+# so chained writes, whose input changes every call, never pay for a copy.
+TEMPLATE_CACHE_SIZE = 8
+_TEMPLATE_CACHE: "OrderedDict[bytes, Optional[Document]]" = OrderedDict()
+
+
+def _open_document(doc_bytes: bytes):
+    """Parse DOCX bytes, reusing a cached parse of the same bytes when possible.
+
+    Always returns a Document the caller may modify freely.
+    """
+    key = hashlib.blake2b(doc_bytes, digest_size=16).digest()
+    seen = key in _TEMPLATE_CACHE
+    cached = _TEMPLATE_CACHE.get(key)
+    if cached is not None:
+        _TEMPLATE_CACHE.move_to_end(key)
+        return copy.deepcopy(cached)
+
+    doc = Document(io.BytesIO(doc_bytes))
+    _TEMPLATE_CACHE[key] = copy.deepcopy(doc) if seen else None
+    _TEMPLATE_CACHE.move_to_end(key)
+    while len(_TEMPLATE_CACHE) > TEMPLATE_CACHE_SIZE:
+        _TEMPLATE_CACHE.popitem(last=False)
+    return doc
+
+
 # ── Low-level cell helpers ──
+# Table.rows and Row.cells rebuild their lists from the XML on every access,
+# so write_to_template snapshots table._tbl.tr_lst once and the helpers below
+# index that list of <w:tr> elements instead.
+
+def _row_tcs(tr) -> list:
+    """Return a row's <w:tc> elements, repeated across merged grid columns like Row.cells.
+
+    A vertically merged continuation cell (vMerge="continue") resolves to the
+    <w:tc> at the top of its merge, which holds the text.
+    """
+    tcs = []
+    for tc in tr.tc_lst:
+        while tc.vMerge == "continue":
+            tc = tc._tc_above
+        tcs.extend([tc] * tc.grid_span)
+    return tcs
+
+
+def _row_cells(table: Table, tr) -> list:
+    """Wrap a row's <w:tc> elements as _Cell objects without going through Table.rows."""
+    return [_Cell(tc, table) for tc in _row_tcs(tr)]
 
-def _get_cell_texts(table: Table, row_index: int) -> list:
+
+def _get_cell_texts(rows: list, row_index: int) -> list:
     """Get text of all cells in a table row."""
-    if row_index >= len(table.rows):
+    if row_index >= len(rows):
         return []
-    return [cell.text.strip() for cell in table.rows[row_index].cells]
+    return [
+        "\n".join("".join(map(str, _P_TEXT_XPATH(p))) for p in tc.p_lst).strip()
+        for tc in _row_tcs(rows[row_index])
+    ]
 
 
-def _set_cell_text(table: Table, row_index: int, col_index: int, value: str):
+def _set_cell_text(cells: list, col_index: int, value: str):
     """Set the text of a cell, preserving first run formatting if possible."""
-    if row_index >= len(table.rows):
+    if col_index >= len(cells):
         return
-    cell = table.rows[row_index].cells[col_index]
+    cell = cells[col_index]
     if cell.paragraphs and cell.paragraphs[0].runs:
         cell.paragraphs[0].runs[0].text = value
         for run in cell.paragraphs[0].runs[1:]:
@@ -75,69 +181,121 @@ def _set_cell_text(table: Table, row_index: int, col_index: int, value: str):
         cell.text = value
 
 
-def _is_row_blank(table: Table, row_index: int, header_map: dict) -> bool:
-    """Check if a row is blank (all mapped columns are empty/whitespace)."""
-    if row_index >= len(table.rows):
-        return True
-    cells = _get_cell_texts(table, row_index)
-    for col_idx in header_map.values():
-        if col_idx < len(cells) and cells[col_idx].strip():
-            return False
-    return True
+def _set_cell_text_xml(tc, value: str):
+    """Make ``value`` the only text of a <w:tc>, as one run in its first paragraph.
 
+    Every existing run is dropped; the first run's <w:rPr> is carried over so
+    template fonts survive, as in _set_cell_text.  Plain values get a single
+    <w:t xml:space="preserve">; values with tabs or line breaks go through
+    CT_R.text, which emits the <w:tab/>/<w:br/> elements for them.
+    """
+    p_lst = tc.p_lst
+    p = p_lst[0] if p_lst else tc.add_p()
+    first_runs = p.r_lst
+    rPr = first_runs[0].rPr if first_runs else None
+    for para in p_lst:
+        for r in para.r_lst:
+            para.remove(r)
+    new_r = p.add_r()
+    if rPr is not None:
+        new_r.insert(0, rPr)
+    if _RUN_SPECIAL_CHARS.isdisjoint(value):
+        t = etree.SubElement(new_r, _QN_T)
+        t.text = value
+        t.set(_QN_XML_SPACE, "preserve")
+    else:
+        new_r.text = value
 
-def _find_existing_site_rows(table: Table, header_map: dict, homesite: str,
-                              data_start: int) -> list:
-    """Find row indices in the table where SITE matches the homesite."""
-    site_col = header_map.get("SITE")
-    if site_col is None:
-        return []
-    h_norm = normalize_for_compare(homesite)
-    matches = []
-    for r_idx in range(data_start, len(table.rows)):
-        cells = _get_cell_texts(table, r_idx)
-        if site_col < len(cells):
-            if normalize_for_compare(cells[site_col]) == h_norm:
-                matches.append(r_idx)
-    return matches
 
+def _write_row_fast(tr, col_values: dict, style: Optional[str] = None,
+                    notes_col: int = -1, is_new_row: bool = False):
+    """Write {col_index: text} into one <w:tr> in a single pass over its cells.
+
+    Each written cell goes through _set_cell_text_xml.
 
-def _find_next_blank_row(table: Table, header_map: dict, data_start: int) -> int:
-    """Find the next blank row starting from data_start. Returns -1 if none."""
-    for r_idx in range(data_start, len(table.rows)):
-        if _is_row_blank(table, r_idx, header_map):
-            return r_idx
-    return -1
+    When ``style`` is given (see _determine_row_style), each cell's font
+    colour, shading and alignment are set in the same visit, so the row is
+    not walked again by _apply_row_formatting.  ``is_new_row`` marks a row
+    cloned from _empty_row_prototype, which has no shading to clear.
+    """
+    for col_idx, tc in enumerate(_row_tcs(tr)):
+        value = col_values.get(col_idx)
+        if value is not None:
+            _set_cell_text_xml(tc, value)
+        if style is not None:
+            font_hex, fill_hex = _cell_style(style, col_idx == notes_col)
+            _format_tc(tc, font_hex, fill_hex, clear_shading=not is_new_row)
 
 
-def _add_row_to_table(table: Table) -> int:
-    """Add a new blank row at the end of a table, cloning the structure of the last row.
+def _scan_table(rows: list, header_map: dict, homesite: Optional[str],
+                data_start: int) -> Tuple[list, int]:
+    """Scan the data rows once for SITE matches and the first blank row.
 
-    Copies the last row's XML structure (cell count, widths, borders) but
-    clears all text content.  Returns the index of the newly added row.
+    A row is blank when all of its mapped columns are empty/whitespace.
+    Pass homesite=None to look for the blank row only.
+
+    Returns (matching row indices, first blank row index or -1).
     """
-    import copy
-    from lxml import etree
+    site_col = header_map.get("SITE") if homesite is not None else None
+    h_norm = _normalize_site(homesite) if site_col is not None else ""
+    mapped_cols = list(header_map.values())
+    matches = []
+    first_blank = -1
+    for r_idx in range(data_start, len(rows)):
+        cells = _get_cell_texts(rows, r_idx)
+        n = len(cells)
+        if site_col is not None and site_col < n:
+            site = cells[site_col]
+            if site == homesite or _normalize_site(site) == h_norm:
+                matches.append(r_idx)
+                continue
+        if first_blank < 0 and not any(c < n and cells[c] for c in mapped_cols):
+            first_blank = r_idx
+    return matches, first_blank
 
-    last_row = table.rows[-1]
-    # Deep copy the last row's XML element
-    new_tr = copy.deepcopy(last_row._tr)
 
-    # Clear all text in every cell of the new row
-    for tc in new_tr.findall(qn("w:tc")):
-        for p in tc.findall(qn("w:p")):
+def _empty_row_prototype(tr):
+    """Deep-copy a <w:tr> and strip its text, keeping cell structure and paragraph properties.
+
+    Cell shading is dropped too, so rows cloned from the prototype carry no
+    fill and need no shading reset when formatted.
+    """
+    proto = copy.deepcopy(tr)
+    for tc in proto.findall(_QN_TC):
+        tcPr = tc.tcPr
+        if tcPr is not None:
+            for shd in tcPr.findall(_QN_SHD):
+                tcPr.remove(shd)
+        for p in tc.findall(_QN_P):
             # Keep paragraph properties (alignment, etc.) but clear runs
-            for r in p.findall(qn("w:r")):
+            for r in p.findall(_QN_R):
                 p.remove(r)
             # Also clear any bare text nodes
-            for t in p.findall(qn("w:t")):
+            for t in p.findall(_QN_T):
                 p.remove(t)
+    return proto
+
 
-    # Append the new row to the table's XML
-    table._tbl.append(new_tr)
-    new_index = len(table.rows) - 1
-    logger.info("Added new row to table (now %d rows), new row index = %d",
-                len(table.rows), new_index)
+def _add_row_to_table(table: Table, rows: list, count: int = 1) -> int:
+    """Add blank rows at the end of a table, cloning the structure of the last row.
+
+    Copies the last row's XML structure (cell count, widths, borders) but
+    clears all text content.  The last row is scrubbed once into an empty
+    prototype; every added row is a plain copy of it, appended in one
+    extend().  The new <w:tr> elements are also appended to ``rows``.
+    Returns the index of the first newly added row.
+    """
+    proto = _empty_row_prototype(rows[-1])
+    new_trs = [proto] + [copy.deepcopy(proto) for _ in range(count - 1)]
+
+    # Append the new rows to the table's XML.  ``rows`` mirrors tr_lst, so
+    # its length stands in for len(table.rows), which rebuilds the row list.
+    table._tbl.extend(new_trs)
+    rows.extend(new_trs)
+    row_count = len(rows)
+    new_index = row_count - count
+    logger.info("Added %d new row(s) to table (now %d rows), first new row index = %d",
+                count, row_count, new_index)
     return new_index
 
 
@@ -147,92 +305,143 @@ def _set_cell_shading(cell, hex_color: str):
     """Set the background fill colour of a table cell using OOXML shading."""
     tc = cell._tc
     tcPr = tc.get_or_add_tcPr()
+    fill = hex_color.upper()
+    existing_shd = tcPr.findall(_QN_SHD)
+    # Already shaded exactly like this - leave the XML alone
+    if (len(existing_shd) == 1 and existing_shd[0].get(_QN_FILL) == fill
+            and existing_shd[0].get(_QN_VAL) == "clear"
+            and existing_shd[0].get(_QN_COLOR) == "auto"):
+        return
     # Remove any existing shading element
-    for existing in tcPr.findall(qn("w:shd")):
+    for existing in existing_shd:
         tcPr.remove(existing)
-    shd = OxmlElement("w:shd")
-    shd.set(qn("w:val"), "clear")
-    shd.set(qn("w:color"), "auto")
-    shd.set(qn("w:fill"), hex_color.upper())
-    tcPr.append(shd)
+    etree.SubElement(tcPr, _QN_SHD, {_QN_VAL: "clear", _QN_COLOR: "auto", _QN_FILL: fill})
 
 
 def _clear_cell_shading(cell):
     """Remove all background fill/shading from a table cell (reset to no fill)."""
-    tc = cell._tc
-    tcPr = tc.get_or_add_tcPr()
-    for existing in tcPr.findall(qn("w:shd")):
+    tcPr = cell._tc.tcPr
+    if tcPr is None:
+        return
+    for existing in tcPr.findall(_QN_SHD):
         tcPr.remove(existing)
 
 
+def _set_run_color(r, hex_val: str):
+    """Set <w:color w:val=...> on one <w:r>, replacing any theme colour."""
+    rPr = r.rPr
+    color = rPr.color if rPr is not None else None
+    if color is not None and color.get(_QN_VAL) == hex_val and _QN_THEME_COLOR not in color.attrib:
+        return  # already this colour
+    color = r.get_or_add_rPr().get_or_add_color()
+    color.set(_QN_VAL, hex_val)
+    color.attrib.pop(_QN_THEME_COLOR, None)
+
+
 def _set_cell_font_color(cell, rgb: RGBColor):
-    """Set font colour for every run in every paragraph of a cell."""
-    for para in cell.paragraphs:
-        for run in para.runs:
-            run.font.color.rgb = rgb
+    """Set font colour for every run in every paragraph of a cell.
+
+    Works on the <w:p>/<w:r> elements directly instead of building
+    Paragraph/Run/Font wrappers for every run.
+    """
+    hex_val = str(rgb)
+    for p in cell._tc.p_lst:
+        runs = p.r_lst
+        for r in runs:
+            _set_run_color(r, hex_val)
         # If paragraph has no runs but has text, we need to handle it via XML
-        if not para.runs and para.text.strip():
-            r = OxmlElement("w:r")
-            rPr = OxmlElement("w:rPr")
-            color_el = OxmlElement("w:color")
-            color_el.set(qn("w:val"), f"{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}")
-            rPr.append(color_el)
-            r.append(rPr)
-            t = OxmlElement("w:t")
-            t.text = para.text
-            r.append(t)
-            para._p.clear()
-            para._p.append(rPr)
-            para._p.append(r)
-
-
-def _set_row_alignment(table: Table, row_index: int):
+        if not runs:
+            text = p.text
+            if text.strip():
+                p.clear()
+                r = etree.SubElement(p, _QN_R)
+                rPr = etree.SubElement(r, _QN_RPR)
+                etree.SubElement(rPr, _QN_COLOR, {_QN_VAL: hex_val})
+                etree.SubElement(r, _QN_T).text = text
+
+
+def _cell_style(style: str, is_notes_col: bool) -> Tuple[str, Optional[str]]:
+    """Return (font hex, fill hex or None) for one cell under a row style."""
+    if style == "sold":
+        return HEX_RED, None
+    if style == "upgraded_flooring" and is_notes_col:
+        return HEX_WHITE, HEX_PURPLE
+    return HEX_BLACK, None
+
+
+def _format_tc(tc, font_hex: str, fill_hex: Optional[str], clear_shading: bool = True):
+    """Colour, shade and centre one <w:tc> in a single visit of its XML.
+
+    Pass clear_shading=False when the cell is known to have no <w:shd>.
+    """
+    for p in tc.p_lst:
+        for r in p.r_lst:
+            _set_run_color(r, font_hex)
+    tcPr = tc.get_or_add_tcPr()
+    if clear_shading:
+        for existing in tcPr.findall(_QN_SHD):
+            tcPr.remove(existing)
+    if fill_hex:
+        etree.SubElement(tcPr, _QN_SHD, {_QN_VAL: "clear", _QN_COLOR: "auto", _QN_FILL: fill_hex})
+    _center_tc(tc)
+
+
+def _center_tc(tc):
+    """Centre a <w:tc> vertically and each of its paragraphs horizontally.
+
+    Only touches the XML when the alignment is not already centred.
+    """
+    tcPr = tc.get_or_add_tcPr()
+    if tcPr.vAlign_val != WD_ALIGN_VERTICAL.CENTER:
+        tcPr.vAlign_val = WD_ALIGN_VERTICAL.CENTER
+    for p in tc.p_lst:
+        pPr = p.pPr
+        if pPr is None or pPr.jc_val != WD_ALIGN_PARAGRAPH.CENTER:
+            p.get_or_add_pPr().jc_val = WD_ALIGN_PARAGRAPH.CENTER
+
+
+def _set_row_alignment(cells: list):
     """Centre every cell in a row: vertically (middle) + horizontally (center)."""
-    if row_index >= len(table.rows):
-        return
-    row = table.rows[row_index]
-    for cell in row.cells:
-        # Vertical alignment - middle
-        cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        # Horizontal alignment - center for every paragraph
-        for para in cell.paragraphs:
-            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    for cell in cells:
+        _center_tc(cell._tc)
 
 
+@lru_cache(maxsize=256)
 def _determine_row_style(notes: str) -> str:
     """Return the formatting style to apply based on the notes field.
 
     Returns: 'sold', 'upgraded_flooring', or 'normal'
     """
-    notes_lower = notes.strip().lower()
-    if "sold" in notes_lower:
+    if not notes:
+        return "normal"
+    # Substring tests need no strip(); casefold() is the Unicode-safe lower()
+    notes_folded = notes.casefold()
+    if "sold" in notes_folded:
         return "sold"
-    if "upgraded flooring" in notes_lower:
+    if "upgraded flooring" in notes_folded:
         return "upgraded_flooring"
     return "normal"
 
 
-def _apply_row_formatting(table: Table, row_index: int, notes: str,
-                          header_map: dict = None):
+def _apply_row_formatting(cells: list, style: str, header_map: dict = None):
     """Apply colour formatting + centre alignment to a data row.
 
+    ``style`` is _determine_row_style(notes), worked out once by the caller.
+
     Rules:
       - sold              → red font on ALL cells in the row
       - upgraded flooring → ONLY the NOTES cell: white font + purple background
                             rest of row: normal (black font, no background)
       - normal            → black font + no cell background (reset to default)
       - always            → vertically and horizontally centred
-    """
-    if row_index >= len(table.rows):
-        return
-
-    style = _determine_row_style(notes)
-    row = table.rows[row_index]
 
+    Cells that already carry the wanted colour, fill and alignment are left
+    untouched, so refreshing an already-correct row costs only the checks.
+    """
     # Identify the NOTES column index so we can treat it specially
     notes_col = header_map.get("NOTES", -1) if header_map else -1
 
-    for col_idx, cell in enumerate(row.cells):
+    for col_idx, cell in enumerate(cells):
         # ── Text colour + shading ──
         if style == "sold":
             # Sold: entire row gets red font, no background
@@ -253,34 +462,41 @@ def _apply_row_formatting(table: Table, row_index: int, notes: str,
             _clear_cell_shading(cell)
 
         # ── Alignment ──
-        cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        for para in cell.paragraphs:
-            para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        _center_tc(cell._tc)
 
 
 # ── Main write helpers ──
 
-def _write_row(table: Table, row_index: int, header_map: dict, control: ControlRow):
-    """Write all fields to a row, then apply formatting."""
-    if "SITE" in header_map:
-        _set_cell_text(table, row_index, header_map["SITE"], str(control.homesite))
-    if "PRICE" in header_map:
-        _set_cell_text(table, row_index, header_map["PRICE"], format_price(control.price))
-    if "ADDRESS" in header_map:
-        _set_cell_text(table, row_index, header_map["ADDRESS"], control.address)
-    if "READY BY" in header_map:
-        _set_cell_text(table, row_index, header_map["READY BY"], parse_ready_by(control.ready_by))
-    if "NOTES" in header_map:
-        _set_cell_text(table, row_index, header_map["NOTES"], control.notes)
-
-    # Apply formatting after text is set
-    _apply_row_formatting(table, row_index, control.notes, header_map=header_map)
+def _write_row(rows: list, row_index: int, header_map: dict, control: ControlRow,
+               is_new_row: bool = False):
+    """Write all fields to a row and apply its formatting."""
+    if row_index >= len(rows):
+        return
+    tr = rows[row_index]
+    values = {
+        "SITE": str(control.homesite),
+        "PRICE": _format_price(control.price),
+        "ADDRESS": control.address,
+        "READY BY": _parse_ready_by(control.ready_by),
+        "NOTES": control.notes,
+    }
+    # Text, colour, shading and alignment in one pass over the row
+    _write_row_fast(
+        tr,
+        {header_map[name]: value for name, value in values.items() if name in header_map},
+        style=_determine_row_style(control.notes),
+        notes_col=header_map.get("NOTES", -1),
+        is_new_row=is_new_row,
+    )
 
 
-def _fill_blank_cells(table: Table, row_index: int, header_map: dict,
+def _fill_blank_cells(table: Table, rows: list, row_index: int, header_map: dict,
                        control: ControlRow, allow_price_update: bool):
     """Fill only blank cells in an existing row, then refresh formatting."""
-    cells = _get_cell_texts(table, row_index)
+    if row_index >= len(rows):
+        return
+    cells = _get_cell_texts(rows, row_index)
+    row_cells = _row_cells(table, rows[row_index])
 
     def _is_blank(col_name):
         col_idx = header_map.get(col_name)
@@ -289,80 +505,105 @@ def _fill_blank_cells(table: Table, row_index: int, header_map: dict,
         return col_idx >= len(cells) or not cells[col_idx].strip()
 
     if "ADDRESS" in header_map and _is_blank("ADDRESS"):
-        _set_cell_text(table, row_index, header_map["ADDRESS"], control.address)
+        _set_cell_text(row_cells, header_map["ADDRESS"], control.address)
     if "READY BY" in header_map and _is_blank("READY BY"):
-        _set_cell_text(table, row_index, header_map["READY BY"], parse_ready_by(control.ready_by))
+        _set_cell_text(row_cells, header_map["READY BY"], _parse_ready_by(control.ready_by))
     if "NOTES" in header_map and _is_blank("NOTES"):
-        _set_cell_text(table, row_index, header_map["NOTES"], control.notes)
+        _set_cell_text(row_cells, header_map["NOTES"], control.notes)
     if allow_price_update and "PRICE" in header_map and _is_blank("PRICE"):
-        _set_cell_text(table, row_index, header_map["PRICE"], format_price(control.price))
+        _set_cell_text(row_cells, header_map["PRICE"], _format_price(control.price))
 
     # Always re-apply formatting so new notes value is reflected
-    _apply_row_formatting(table, row_index, control.notes, header_map=header_map)
-
-
-# ── Public API ──
+    _apply_row_formatting(
+        row_cells, _determine_row_style(control.notes), header_map=header_map
+    )
 
-def write_to_template(
-    doc_bytes: bytes,
-    table_match_info: dict,
-    control_row: ControlRow,
-    overwrite_existing: bool = False,
-    update_only_blank_cells: bool = True,
-    allow_price_update: bool = False,
-    strict_mode: bool = True,
-    remove_invisible_code: bool = True,
-    header_row_1based: int = 2,
-) -> tuple:
-    """Write control row data into the template DOCX.
 
-    Args:
-        doc_bytes: Raw DOCX bytes
-        table_match_info: Dict with invisible_code (and optionally table_index)
-        control_row: The CONTROL row data to write
-        overwrite_existing: If True, overwrite existing site rows
-        update_only_blank_cells: If True and site exists, only fill blank cells
-        allow_price_update: If True, allow price update when filling blanks
-        strict_mode: If True, fail on duplicate sites in same table
-        remove_invisible_code: If True, remove invisible code after finding table
-        header_row_1based: Header row number (1-based), default 2
+class _TableIndex:
+    """SITE -> row indices and blank data rows of one table, kept current across writes.
 
-    Returns:
-        (modified_doc_bytes, DocxWriteResult)
+    Lets write_many_to_template answer each control row's lookup without
+    rescanning the table; refresh() re-reads just the row that was written.
     """
-    from .locator import find_table_by_invisible_code, remove_invisible_code as do_remove
-
-    result = DocxWriteResult()
-    doc = Document(io.BytesIO(doc_bytes))
 
-    # Find target table
-    invisible_code = table_match_info["invisible_code"]
+    def __init__(self, rows: list, header_map: dict, data_start: int):
+        self.rows = rows
+        self.site_col = header_map.get("SITE")
+        self.mapped_cols = list(header_map.values())
+        self.sites = {}     # normalized SITE -> sorted row indices
+        self.row_site = {}  # row index -> normalized SITE
+        self.blanks = []    # sorted indices of blank rows
+        for r_idx in range(data_start, len(rows)):
+            self._add(r_idx)
+
+    def _add(self, r_idx: int):
+        cells = _get_cell_texts(self.rows, r_idx)
+        n = len(cells)
+        if self.site_col is not None and self.site_col < n:
+            norm = _normalize_site(cells[self.site_col])
+            self.row_site[r_idx] = norm
+            insort(self.sites.setdefault(norm, []), r_idx)
+        if not any(c < n and cells[c] for c in self.mapped_cols):
+            insort(self.blanks, r_idx)
+
+    def refresh(self, r_idx: int):
+        """Re-index one row after it was written (or added)."""
+        norm = self.row_site.pop(r_idx, None)
+        if norm is not None:
+            self.sites[norm].remove(r_idx)
+        pos = bisect_left(self.blanks, r_idx)
+        if pos < len(self.blanks) and self.blanks[pos] == r_idx:
+            del self.blanks[pos]
+        self._add(r_idx)
+
+    def lookup(self, homesite: str) -> Tuple[list, int]:
+        """Same answer as _scan_table(rows, header_map, homesite, data_start)."""
+        if self.site_col is None:
+            return [], (self.blanks[0] if self.blanks else -1)
+        matches = list(self.sites.get(_normalize_site(homesite), ()))
+        matched = set(matches)
+        first_blank = next((b for b in self.blanks if b not in matched), -1)
+        return matches, first_blank
+
+
+def _open_target_table(doc, invisible_code: str, header_row_1based: int,
+                       strict_mode: bool):
+    """Locate the table and its header map.
+
+    Returns (match, rows, header_map, data_start, error); error is "" on success.
+    """
     match = find_table_by_invisible_code(doc, invisible_code)
-    table = match.table
+    # Snapshot the <w:tr> list once; Table.rows rebuilds it on every access
+    rows = list(match.table._tbl.tr_lst)
 
     # Header row (0-based index)
     header_idx = header_row_1based - 1
-    if header_idx >= len(table.rows):
-        result.error = (
-            f"Header row {header_row_1based} is beyond table size ({len(table.rows)} rows)."
-        )
-        return None, result
+    if header_idx >= len(rows):
+        error = f"Header row {header_row_1based} is beyond table size ({len(rows)} rows)."
+        return match, rows, {}, 0, error
 
     # Build header map
-    header_cells = _get_cell_texts(table, header_idx)
-    header_map = build_header_map(header_cells)
+    header_cells = _get_cell_texts(rows, header_idx)
+    header_map = dict(_cached_header_map(tuple(header_cells)))
 
     missing = validate_headers(header_map, strict=strict_mode)
     if missing:
-        result.error = f"Missing required headers: {missing}. Found: {list(header_map.keys())}"
-        return None, result
+        error = f"Missing required headers: {missing}. Found: {list(header_map.keys())}"
+        return match, rows, header_map, 0, error
 
-    data_start = header_idx + 1
+    return match, rows, header_map, header_idx + 1, ""
 
-    # Check for existing site rows within THIS table only
-    existing_rows = _find_existing_site_rows(
-        table, header_map, control_row.homesite, data_start
-    )
+
+def _write_control_row(match, rows: list, header_map: dict, control_row: ControlRow,
+                       existing_rows: list, blank_row: int, overwrite_existing: bool,
+                       update_only_blank_cells: bool, allow_price_update: bool,
+                       strict_mode: bool) -> DocxWriteResult:
+    """Overwrite, blank-fill or append one control row, given its table lookup.
+
+    The table is left untouched when the returned result has an error.
+    """
+    result = DocxWriteResult()
+    table = match.table
 
     if len(existing_rows) > 1 and strict_mode:
         result.error = (
@@ -371,18 +612,18 @@ def write_to_template(
             f"strict_mode requires unique sites per table."
         )
         result.action = "duplicate_site_rows_in_table"
-        return None, result
+        return result
 
     if existing_rows:
         target_row = existing_rows[0]
         if overwrite_existing:
-            _write_row(table, target_row, header_map, control_row)
+            _write_row(rows, target_row, header_map, control_row)
             result.action = "overwritten"
             result.row_index = target_row
             result.details = f"Overwrote existing site at row {target_row + 1}"
         elif update_only_blank_cells:
             _fill_blank_cells(
-                table, target_row, header_map, control_row, allow_price_update
+                table, rows, target_row, header_map, control_row, allow_price_update
             )
             result.action = "updated_blanks"
             result.row_index = target_row
@@ -393,33 +634,192 @@ def write_to_template(
                 f"Site '{control_row.homesite}' already exists at row "
                 f"{target_row + 1}. Skipping."
             )
-            return None, result
+            return result
     else:
-        blank_row = _find_next_blank_row(table, header_map, data_start)
-        if blank_row < 0:
+        is_new_row = blank_row < 0
+        if is_new_row:
             # No blank rows available — add a new row to the table
             logger.info(
                 "No blank row in table[%d] (%d rows). Adding a new row for site=%s.",
-                match.table_index, len(table.rows), control_row.homesite,
+                match.table_index, len(rows), control_row.homesite,
             )
-            blank_row = _add_row_to_table(table)
+            blank_row = _add_row_to_table(table, rows)
 
-        _write_row(table, blank_row, header_map, control_row)
+        _write_row(rows, blank_row, header_map, control_row, is_new_row=is_new_row)
         result.action = "appended"
         result.row_index = blank_row
         result.details = f"Appended to row {blank_row + 1}"
 
+    logger.info(
+        "DOCX write: %s for site=%s in table[%d] at row %d",
+        result.action, control_row.homesite, match.table_index, result.row_index + 1,
+    )
+    return result
+
+
+# ── Public API ──
+
+def write_to_template_stream(
+    doc_bytes: bytes,
+    table_match_info: dict,
+    control_row: ControlRow,
+    out_stream: BinaryIO,
+    overwrite_existing: bool = False,
+    update_only_blank_cells: bool = True,
+    allow_price_update: bool = False,
+    strict_mode: bool = True,
+    remove_invisible_code: bool = True,
+    header_row_1based: int = 2,
+) -> DocxWriteResult:
+    """Write control row data into the template DOCX and save it to out_stream.
+
+    The document is saved straight into ``out_stream`` (an open file, an
+    upload buffer, ...), so no intermediate copy of the whole DOCX is made.
+    Nothing is written to the stream when ``result.error`` is set.
+
+    Args:
+        doc_bytes: Raw DOCX bytes
+        table_match_info: Dict with invisible_code (and optionally table_index)
+        control_row: The CONTROL row data to write
+        out_stream: Writable binary stream that receives the modified DOCX
+        overwrite_existing: If True, overwrite existing site rows
+        update_only_blank_cells: If True and site exists, only fill blank cells
+        allow_price_update: If True, allow price update when filling blanks
+        strict_mode: If True, fail on duplicate sites in same table
+        remove_invisible_code: If True, remove invisible code after finding table
+        header_row_1based: Header row number (1-based), default 2
+
+    Returns:
+        DocxWriteResult
+    """
+    doc = _open_document(doc_bytes)
+
+    # Find target table
+    invisible_code = table_match_info["invisible_code"]
+    match, rows, header_map, data_start, error = _open_target_table(
+        doc, invisible_code, header_row_1based, strict_mode
+    )
+    if error:
+        result = DocxWriteResult()
+        result.error = error
+        return result
+
+    # One pass over THIS table: existing site rows + the first blank row
+    existing_rows, blank_row = _scan_table(
+        rows, header_map, control_row.homesite, data_start
+    )
+    result = _write_control_row(
+        match, rows, header_map, control_row, existing_rows, blank_row,
+        overwrite_existing, update_only_blank_cells, allow_price_update, strict_mode,
+    )
+    if result.error:
+        return result
+
     # Remove invisible code if configured
     if remove_invisible_code:
         do_remove(match, invisible_code)
 
-    # Save to bytes
+    doc.save(out_stream)
+    return result
+
+
+def write_to_template(
+    doc_bytes: bytes,
+    table_match_info: dict,
+    control_row: ControlRow,
+    overwrite_existing: bool = False,
+    update_only_blank_cells: bool = True,
+    allow_price_update: bool = False,
+    strict_mode: bool = True,
+    remove_invisible_code: bool = True,
+    header_row_1based: int = 2,
+) -> tuple:
+    """Write control row data into the template DOCX.
+
+    Same arguments as write_to_template_stream, for callers that need the
+    result as bytes.
+
+    Returns:
+        (modified_doc_bytes, DocxWriteResult) - bytes are None on error
+    """
     output = io.BytesIO()
-    doc.save(output)
-    modified_bytes = output.getvalue()
+    result = write_to_template_stream(
+        doc_bytes, table_match_info, control_row, output,
+        overwrite_existing=overwrite_existing,
+        update_only_blank_cells=update_only_blank_cells,
+        allow_price_update=allow_price_update,
+        strict_mode=strict_mode,
+        remove_invisible_code=remove_invisible_code,
+        header_row_1based=header_row_1based,
+    )
+    if result.error:
+        return None, result
+    return output.getvalue(), result
 
-    logger.info(
-        "DOCX write: %s for site=%s in table[%d] at row %d",
-        result.action, control_row.homesite, match.table_index, result.row_index + 1,
+
+def write_many_to_template(
+    doc_bytes: bytes,
+    table_match_info: dict,
+    control_rows: List[ControlRow],
+    overwrite_existing: bool = False,
+    update_only_blank_cells: bool = True,
+    allow_price_update: bool = False,
+    strict_mode: bool = True,
+    remove_invisible_code: bool = True,
+    header_row_1based: int = 2,
+) -> Tuple[Optional[bytes], List[DocxWriteResult]]:
+    """Write several control rows into one table of the template DOCX.
+
+    Gives the same rows as calling write_to_template once per control row
+    (each feeding the previous output, invisible code kept until the end),
+    but the DOCX is parsed once, the header map is built once, the table is
+    indexed in one scan and the document is serialized once.
+
+    Returns:
+        (modified_doc_bytes, [DocxWriteResult per control row]) - bytes are
+        None when no row was written
+    """
+    if not control_rows:
+        return None, []
+    doc = _open_document(doc_bytes)
+
+    invisible_code = table_match_info["invisible_code"]
+    match, rows, header_map, data_start, error = _open_target_table(
+        doc, invisible_code, header_row_1based, strict_mode
     )
-    return modified_bytes, result
+    if error:
+        results = []
+        for _ in control_rows:
+            result = DocxWriteResult()
+            result.error = error
+            results.append(result)
+        return None, results
+
+    index = _TableIndex(rows, header_map, data_start)
+    results = []
+    written = 0
+    for control_row in control_rows:
+        row_count = len(rows)
+        existing_rows, blank_row = index.lookup(control_row.homesite)
+        result = _write_control_row(
+            match, rows, header_map, control_row, existing_rows, blank_row,
+            overwrite_existing, update_only_blank_cells, allow_price_update, strict_mode,
+        )
+        results.append(result)
+        if result.error:
+            continue
+        written += 1
+        # Index any rows the write added, then the row it changed
+        for r_idx in range(row_count, len(rows)):
+            index.refresh(r_idx)
+        index.refresh(result.row_index)
+
+    if not written:
+        return None, results
+
+    if remove_invisible_code:
+        do_remove(match, invisible_code)
+
+    output = io.BytesIO()
+    doc.save(output)
+    return output.getvalue(), results
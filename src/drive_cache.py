@@ -0,0 +1,139 @@
+"""Persistent Drive metadata cache (SQLite), shared across runs.
+
+Folder listings and name lookups made by DriveClient are stored here, so a
+later run can answer them without an API call while they are younger than
+the TTL.  DriveClient invalidates whatever it changes itself; changes made
+by anyone else are picked up once the entries expire.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("price_sheet_bot.drive_cache")
+
+DRIVE_CACHE_TTL = 600  # seconds
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id TEXT PRIMARY KEY,
+    parent TEXT NOT NULL,
+    name TEXT NOT NULL,
+    mime TEXT,
+    meta TEXT NOT NULL,
+    cached_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_parent_name ON files (parent, name);
+CREATE TABLE IF NOT EXISTS listings (
+    parent TEXT NOT NULL,
+    mime TEXT NOT NULL,
+    listed_at REAL NOT NULL,
+    PRIMARY KEY (parent, mime)
+);
+"""
+
+
+class DriveCache:
+    """File metadata per folder, plus when each folder was last fully listed.
+
+    A fresh listing row means the folder's rows are complete, so a name
+    missing from them is known not to exist.  Safe to share between threads.
+    """
+
+    def __init__(self, path: str, ttl: float = DRIVE_CACHE_TTL):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _listed(self, folder_id: str, mime_filter: Optional[str]) -> bool:
+        """True if folder_id was listed (fully, or for this MIME type) within the TTL."""
+        (listed_at,) = self._conn.execute(
+            "SELECT MAX(listed_at) FROM listings WHERE parent = ? AND mime IN (?, '')",
+            (folder_id, mime_filter or ""),
+        ).fetchone()
+        return listed_at is not None and listed_at >= time.time() - self.ttl
+
+    def get_listing(self, folder_id: str, mime_filter: Optional[str] = None) -> Optional[List[dict]]:
+        """The cached listing of folder_id, or None if it is missing or stale."""
+        with self._lock:
+            if not self._listed(folder_id, mime_filter):
+                return None
+            sql, args = "SELECT meta FROM files WHERE parent = ?", [folder_id]
+            if mime_filter:
+                sql += " AND mime = ?"
+                args.append(mime_filter)
+            return [json.loads(meta) for (meta,) in self._conn.execute(sql, args)]
+
+    def find(self, folder_id: str, name: str) -> Tuple[bool, Optional[dict]]:
+        """Look up a file by name: (known, file).
+
+        known is False when the cache can't tell, and the API must be asked.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT meta, cached_at FROM files WHERE parent = ? AND name = ? "
+                "ORDER BY rowid LIMIT 1",
+                (folder_id, name),
+            ).fetchone()
+            if row and row[1] >= time.time() - self.ttl:
+                return True, json.loads(row[0])
+            if self._listed(folder_id, None):
+                return True, None
+            return False, None
+
+    def put_listing(self, folder_id: str, mime_filter: Optional[str], files: List[dict]):
+        """Replace the cached contents of folder_id with a fresh listing."""
+        now = time.time()
+        with self._lock, self._conn:
+            if mime_filter:
+                self._conn.execute("DELETE FROM files WHERE parent = ? AND mime = ?",
+                                   (folder_id, mime_filter))
+            else:
+                self._conn.execute("DELETE FROM files WHERE parent = ?", (folder_id,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files (id, parent, name, mime, meta, cached_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(f["id"], folder_id, f["name"], f.get("mimeType"), json.dumps(f), now)
+                 for f in files],
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO listings (parent, mime, listed_at) VALUES (?, ?, ?)",
+                (folder_id, mime_filter or "", now),
+            )
+
+    def put_files(self, folder_id: str, files: Iterable[dict]):
+        """Record individually looked-up files of folder_id."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files (id, parent, name, mime, meta, cached_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(f["id"], folder_id, f["name"], f.get("mimeType"), json.dumps(f), now)
+                 for f in files],
+            )
+
+    def invalidate(self, folder_ids: Iterable[Optional[str]] = (), file_id: Optional[str] = None):
+        """Forget folder_ids' listings and files, and file_id together with its folder's listing."""
+        parents = [f for f in folder_ids if f]
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM files WHERE parent = ?",
+                                   [(p,) for p in set(parents)])
+            if file_id:
+                row = self._conn.execute("SELECT parent FROM files WHERE id = ?", (file_id,)).fetchone()
+                if row:
+                    parents.append(row[0])
+                self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+            self._conn.executemany("DELETE FROM listings WHERE parent = ?",
+                                   [(p,) for p in set(parents)])
@@ -5,19 +5,26 @@ since service accounts have no storage quota on personal Drive.
 Falls back to service account for read-only operations.
 """
 
+import hashlib
 import io
 import json
 import logging
 import os
+import random
+import threading
 import time
-from datetime import datetime, timezone
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 
 from google.oauth2.service_account import Credentials as SACredentials
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload, MediaIoBaseUpload
 
+from .drive_cache import DriveCache
+
 logger = logging.getLogger("price_sheet_bot.drive")
 
 SCOPES = [
@@ -27,33 +34,129 @@ SCOPES = [
 
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 2
+RETRY_MAX_DELAY = 60
+
+# HTTP statuses worth retrying; Drive also signals quota as 403 rate limit
+TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Worker threads for the *_many batch helpers.  Drive calls are dominated by
+# round-trip time, so threads with their own service objects scale fine.
+DRIVE_POOL_SIZE = 8
+
+# safe_replace's temp/archive name suffix (UTC)
+REPLACE_TIMESTAMP_FORMAT = "%Y%m%d%H%M%S"
+
+# Proactive request pacing, below Drive's per-user quotas: about 10 writes
+# per second, and 1000 reads per 100 seconds.
+WRITE_RATE, WRITE_BURST = 9, 10
+READ_RATE, READ_BURST = 10, 100
+
+# Transfer sizing: media requests default to 1 MiB chunks, i.e. one HTTPS
+# round trip per MiB.  Small uploads go as a single multipart POST, skipping
+# the resumable-session handshake.
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+
+# files.list page size.  Each page needs the previous page's token, so pages
+# can't be fetched concurrently; Drive's maximum of 1000 keeps it to one
+# round trip for any realistic folder.
+LIST_PAGE_SIZE = 1000
+
+# Names OR-ed into one files.list query by find_files_by_names
+FIND_NAMES_PER_QUERY = 50
+
+# In-memory metadata cache: folder listings and name lookups are reused for
+# this many seconds, and writes through this client invalidate them.
+LIST_CACHE_TTL = 60
+LIST_CACHE_SIZE = 64
 
 # Path to store OAuth2 user token (so you only sign in once)
 OAUTH_TOKEN_PATH = "./secrets/user_token.json"
 OAUTH_CREDENTIALS_PATH = "./secrets/oauth_credentials.json"
 
 
-def _retry(func, *args, **kwargs):
-    """Execute with exponential backoff for transient errors."""
+def _is_transient(e: Exception) -> bool:
+    """True for errors a retry can fix: throttling, 5xx and dropped connections."""
+    if isinstance(e, HttpError):
+        status = e.resp.status
+        if status in TRANSIENT_STATUSES:
+            return True
+        return status == 403 and "rate limit" in str(e.reason).lower()
+    return isinstance(e, (TimeoutError, ConnectionError))
+
+
+def _retry_after(e: Exception) -> Optional[float]:
+    """Seconds from a Retry-After header, if the server sent one."""
+    if not isinstance(e, HttpError):
+        return None
+    try:
+        return float(e.resp.get("retry-after"))
+    except (TypeError, ValueError):
+        return None  # Absent, or the HTTP-date form
+
+
+class TokenBucket:
+    """Thread-safe token bucket: acquire() blocks until a request may go out.
+
+    Tokens refill at `rate` per second up to `capacity`.  A caller that finds
+    the bucket empty reserves the next token and sleeps outside the lock, so
+    waiting threads are released in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _retry(func, *args, limiter: Optional[TokenBucket] = None, **kwargs):
+    """Execute with jittered exponential backoff for transient errors.
+
+    Delays use decorrelated jitter so parallel workers don't retry in
+    lockstep; a Retry-After header takes precedence when present.  With a
+    limiter, every attempt (retries included) waits for a token first.
+    """
+    delay = RETRY_BASE_DELAY
     for attempt in range(MAX_RETRIES):
+        if limiter is not None:
+            limiter.acquire()
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            err_str = str(e).lower()
-            transient = any(kw in err_str for kw in [
-                "rate limit", "500", "503", "backend", "timeout", "timed out"
-            ])
-            if transient and attempt < MAX_RETRIES - 1:
-                delay = RETRY_BASE_DELAY * (2 ** attempt)
-                logger.warning("Transient error (attempt %d/%d), retrying in %ds: %s",
-                               attempt + 1, MAX_RETRIES, delay, e)
-                time.sleep(delay)
-            else:
+            if not _is_transient(e) or attempt == MAX_RETRIES - 1:
                 raise
+            delay = min(RETRY_MAX_DELAY, random.uniform(RETRY_BASE_DELAY, delay * 3))
+            wait = _retry_after(e)
+            if wait is None:
+                wait = delay
+            wait = min(RETRY_MAX_DELAY, wait)
+            logger.warning("Transient error (attempt %d/%d), retrying in %.1fs: %s",
+                           attempt + 1, MAX_RETRIES, wait, e)
+            time.sleep(wait)
 
 
-def _build_oauth_service():
-    """Build a Drive API service using OAuth2 user credentials.
+def _load_oauth_credentials():
+    """Load OAuth2 user credentials.
 
     First time: opens browser for Google login.
     After that: uses saved token.
@@ -98,9 +201,36 @@ def _build_oauth_service():
             f.write(creds.to_json())
         logger.info("OAuth2 user token saved.")
 
-    service = build("drive", "v3", credentials=creds)
-    logger.info("Connected to Google Drive API via OAuth2 (user account).")
-    return service
+    return creds
+
+
+# One Drive service per (credentials, thread) for the life of the process, so
+# repeated connect() calls reuse credentials and httplib2's keep-alive
+# connections instead of re-authenticating and re-handshaking TLS.  The
+# thread is part of the key because httplib2 is not thread-safe.
+_SERVICE_CACHE: Dict[tuple, tuple] = {}
+
+
+def _get_service(key: tuple, load_credentials) -> tuple:
+    """Return cached (credentials, Drive service) for key on this thread."""
+    cache_key = (key, threading.get_ident())
+    entry = _SERVICE_CACHE.get(cache_key)
+    if entry is None:
+        creds = load_credentials()
+        entry = _SERVICE_CACHE[cache_key] = (creds, build("drive", "v3", credentials=creds))
+    return entry
+
+
+def _same_content(file_meta: dict, data: bytes, sha256_hex: str) -> bool:
+    """True if a Drive file already holds exactly these bytes.
+
+    Binary files carry Drive's own md5Checksum, which also catches edits
+    made outside the bot; content_sha256 is the stamp safe_replace leaves.
+    """
+    md5 = file_meta.get("md5Checksum")
+    if md5:
+        return md5 == hashlib.md5(data).hexdigest()
+    return (file_meta.get("appProperties") or {}).get("content_sha256") == sha256_hex
 
 
 class DriveClient:
@@ -109,23 +239,39 @@ class DriveClient:
     Uses service account for reads, OAuth2 user account for writes.
     """
 
-    def __init__(self, credentials_path: str, shared_drive_id: Optional[str] = None):
+    def __init__(self, credentials_path: str, shared_drive_id: Optional[str] = None,
+                 pool_size: int = DRIVE_POOL_SIZE, metadata_cache: Optional[DriveCache] = None):
         self.credentials_path = credentials_path
         self.shared_drive_id = shared_drive_id
+        self.pool_size = pool_size
+        self._sa_creds = None
+        self._user_creds = None
         self._sa_service = None   # Service account (reads)
         self._user_service = None  # OAuth2 user (writes)
+        self._pool = None          # Lazily created for the *_many helpers
+        self._local = threading.local()
+        # (folder_id, mime_filter) -> (time, files); (folder_id, name) -> (time, file)
+        self._list_cache = OrderedDict()
+        self._find_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._disk_cache = metadata_cache  # Optional, persists across runs
+        self._write_limiter = TokenBucket(WRITE_RATE, WRITE_BURST)
+        self._read_limiter = TokenBucket(READ_RATE, READ_BURST)
 
     def connect(self):
         """Authenticate with service account for reads."""
-        creds = SACredentials.from_service_account_file(
-            self.credentials_path, scopes=SCOPES
+        self._sa_creds, self._sa_service = _get_service(
+            ("sa", self.credentials_path),
+            lambda: SACredentials.from_service_account_file(self.credentials_path, scopes=SCOPES),
         )
-        self._sa_service = build("drive", "v3", credentials=creds)
         logger.info("Connected to Google Drive API (service account for reads).")
 
     def connect_for_writes(self):
         """Authenticate with OAuth2 for uploads/writes. Opens browser first time."""
-        self._user_service = _build_oauth_service()
+        self._user_creds, self._user_service = _get_service(
+            ("oauth", OAUTH_TOKEN_PATH), _load_oauth_credentials,
+        )
+        logger.info("Connected to Google Drive API via OAuth2 (user account).")
 
     @property
     def service(self):
@@ -153,10 +299,65 @@ class DriveClient:
             params.update(extra)
         return params
 
+    # ── Metadata cache ──
+
+    def _cache_get(self, cache: OrderedDict, key):
+        """Return a fresh cached value, or None."""
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > LIST_CACHE_TTL:
+                del cache[key]
+                return None
+            cache.move_to_end(key)
+            return entry[1]
+
+    def _cache_put(self, cache: OrderedDict, key, value):
+        with self._cache_lock:
+            cache[key] = (time.monotonic(), value)
+            cache.move_to_end(key)
+            while len(cache) > LIST_CACHE_SIZE:
+                cache.popitem(last=False)
+
+    def _invalidate(self, folder_ids=(), file_id: str = None):
+        """Drop cached metadata touched by a write.
+
+        Listings of folder_ids go, as does any listing or lookup that
+        contains file_id (its name, parents or properties may have changed).
+        """
+        if self._disk_cache is not None:
+            self._disk_cache.invalidate(folder_ids, file_id)
+        with self._cache_lock:
+            for key in [k for k, (_, files) in self._list_cache.items()
+                        if k[0] in folder_ids
+                        or (file_id and any(f["id"] == file_id for f in files))]:
+                del self._list_cache[key]
+            for key in [k for k, (_, f) in self._find_cache.items()
+                        if k[0] in folder_ids or (file_id and f["id"] == file_id)]:
+                del self._find_cache[key]
+
+    def invalidate_folder(self, folder_id: str):
+        """Forget everything cached about folder_id's contents.
+
+        For folders another process may have changed, since only this
+        client's own writes invalidate the cache by themselves.
+        """
+        self._invalidate(folder_ids=(folder_id,))
+
     # ── Listing ──
 
     def list_files(self, folder_id: str, mime_filter: str = None) -> list:
         """List files in a Drive folder."""
+        cached = self._cache_get(self._list_cache, (folder_id, mime_filter))
+        if cached is not None:
+            return list(cached)
+        if self._disk_cache is not None:
+            cached = self._disk_cache.get_listing(folder_id, mime_filter)
+            if cached is not None:
+                self._cache_put(self._list_cache, (folder_id, mime_filter), cached)
+                return list(cached)
+
         query = f"'{folder_id}' in parents and trashed = false"
         if mime_filter:
             query += f" and mimeType = '{mime_filter}'"
@@ -166,19 +367,22 @@ class DriveClient:
         while True:
             params = self._drive_params({
                 "q": query,
-                "fields": "nextPageToken, files(id, name, mimeType, modifiedTime, appProperties, size)",
-                "pageSize": 100,
+                "fields": "nextPageToken, files(id, name, mimeType, modifiedTime, appProperties, size, md5Checksum)",
+                "pageSize": LIST_PAGE_SIZE,
             })
             if page_token:
                 params["pageToken"] = page_token
-            resp = _retry(self.service.files().list(**params).execute)
+            resp = _retry(self.service.files().list(**params).execute, limiter=self._read_limiter)
             results.extend(resp.get("files", []))
             page_token = resp.get("nextPageToken")
             if not page_token:
                 break
 
         logger.debug("Listed %d files in folder %s", len(results), folder_id)
-        return results
+        self._cache_put(self._list_cache, (folder_id, mime_filter), results)
+        if self._disk_cache is not None:
+            self._disk_cache.put_listing(folder_id, mime_filter, results)
+        return list(results)
 
     def list_pdfs(self, folder_id: str) -> list:
         """List PDF files in a folder."""
@@ -186,19 +390,93 @@ class DriveClient:
 
     def find_file_by_name(self, folder_id: str, file_name: str) -> Optional[dict]:
         """Find a specific file by exact name in a folder."""
+        # A fresh full listing of the folder answers this without a request
+        listing = self._cache_get(self._list_cache, (folder_id, None))
+        if listing is not None:
+            return next((f for f in listing if f["name"] == file_name), None)
+        cached = self._cache_get(self._find_cache, (folder_id, file_name))
+        if cached is not None:
+            return cached
+        if self._disk_cache is not None:
+            known, cached = self._disk_cache.find(folder_id, file_name)
+            if known:
+                return cached
+
         escaped = file_name.replace("'", "\\'")
         query = f"'{folder_id}' in parents and name = '{escaped}' and trashed = false"
         params = self._drive_params({
             "q": query,
-            "fields": "files(id, name, mimeType, modifiedTime, appProperties, size)",
+            "fields": "files(id, name, mimeType, modifiedTime, appProperties, size, md5Checksum)",
             "pageSize": 5,
         })
-        resp = _retry(self.service.files().list(**params).execute)
+        resp = _retry(self.service.files().list(**params).execute, limiter=self._read_limiter)
         files = resp.get("files", [])
         if files:
+            # Misses aren't cached: the file may be uploaded moments later
+            self._cache_put(self._find_cache, (folder_id, file_name), files[0])
+            if self._disk_cache is not None:
+                self._disk_cache.put_files(folder_id, files[:1])
             return files[0]
         return None
 
+    def find_files_by_names(self, folder_id: str, names: List[str]) -> Dict[str, dict]:
+        """Find several files by exact name in a folder, in as few requests as possible.
+
+        Returns {name: file metadata} for the names that exist.
+        """
+        found = {}
+        listing = self._cache_get(self._list_cache, (folder_id, None))
+        if listing is not None:
+            wanted = set(names)
+            for f in listing:
+                if f["name"] in wanted:
+                    found.setdefault(f["name"], f)
+            return found
+
+        pending = []
+        for name in dict.fromkeys(names):
+            cached = self._cache_get(self._find_cache, (folder_id, name))
+            if cached is not None:
+                found[name] = cached
+                continue
+            if self._disk_cache is not None:
+                known, cached = self._disk_cache.find(folder_id, name)
+                if known:
+                    if cached is not None:
+                        found[name] = cached
+                    continue
+            pending.append(name)
+
+        fetched = []
+        for i in range(0, len(pending), FIND_NAMES_PER_QUERY):
+            chunk = pending[i:i + FIND_NAMES_PER_QUERY]
+            name_terms = " or ".join(
+                "name = '%s'" % name.replace("'", "\\'") for name in chunk
+            )
+            query = f"'{folder_id}' in parents and trashed = false and ({name_terms})"
+            page_token = None
+            while True:
+                params = self._drive_params({
+                    "q": query,
+                    "fields": "nextPageToken, files(id, name, mimeType, modifiedTime, appProperties, size, md5Checksum)",
+                    "pageSize": LIST_PAGE_SIZE,
+                })
+                if page_token:
+                    params["pageToken"] = page_token
+                resp = _retry(self.service.files().list(**params).execute, limiter=self._read_limiter)
+                for f in resp.get("files", []):
+                    if f["name"] not in found:
+                        found[f["name"]] = f
+                        fetched.append(f)
+                        self._cache_put(self._find_cache, (folder_id, f["name"]), f)
+                page_token = resp.get("nextPageToken")
+                if not page_token:
+                    break
+
+        if fetched and self._disk_cache is not None:
+            self._disk_cache.put_files(folder_id, fetched)
+        return found
+
     # ── Download ──
 
     def download_file(self, file_id: str, dest_path: str) -> str:
@@ -206,10 +484,10 @@ class DriveClient:
         os.makedirs(os.path.dirname(dest_path), exist_ok=True)
         request = self.service.files().get_media(fileId=file_id, supportsAllDrives=True)
         with open(dest_path, "wb") as f:
-            downloader = MediaIoBaseDownload(f, request)
+            downloader = MediaIoBaseDownload(f, request, chunksize=DOWNLOAD_CHUNK_SIZE)
             done = False
             while not done:
-                _, done = _retry(downloader.next_chunk)
+                _, done = _retry(downloader.next_chunk, limiter=self._read_limiter)
         logger.info("Downloaded %s -> %s", file_id, dest_path)
         return dest_path
 
@@ -217,10 +495,10 @@ class DriveClient:
         """Download a file from Drive into memory."""
         request = self.service.files().get_media(fileId=file_id, supportsAllDrives=True)
         buffer = io.BytesIO()
-        downloader = MediaIoBaseDownload(buffer, request)
+        downloader = MediaIoBaseDownload(buffer, request, chunksize=DOWNLOAD_CHUNK_SIZE)
         done = False
         while not done:
-            _, done = _retry(downloader.next_chunk)
+            _, done = _retry(downloader.next_chunk, limiter=self._read_limiter)
         return buffer.getvalue()
 
     # ── Upload (uses OAuth2 write_service) ──
@@ -237,14 +515,18 @@ class DriveClient:
                 mime_type = "application/octet-stream"
 
         metadata = {"name": file_name, "parents": [folder_id]}
-        media = MediaFileUpload(local_path, mimetype=mime_type, resumable=True)
+        resumable = os.path.getsize(local_path) >= RESUMABLE_THRESHOLD
+        media = MediaFileUpload(local_path, mimetype=mime_type,
+                                chunksize=UPLOAD_CHUNK_SIZE, resumable=resumable)
         result = _retry(
             self.write_service.files().create(
                 body=metadata, media_body=media,
                 fields="id, name, size, modifiedTime",
                 supportsAllDrives=True,
-            ).execute
+            ).execute,
+            limiter=self._write_limiter,
         )
+        self._invalidate(folder_ids=(folder_id,))
         logger.info("Uploaded %s as %s (id=%s)", local_path, file_name, result["id"])
         return result
 
@@ -260,14 +542,18 @@ class DriveClient:
                 mime_type = "application/octet-stream"
 
         metadata = {"name": file_name, "parents": [folder_id]}
-        media = MediaIoBaseUpload(io.BytesIO(data), mimetype=mime_type, resumable=True)
+        media = MediaIoBaseUpload(io.BytesIO(data), mimetype=mime_type,
+                                  chunksize=UPLOAD_CHUNK_SIZE,
+                                  resumable=len(data) >= RESUMABLE_THRESHOLD)
         result = _retry(
             self.write_service.files().create(
                 body=metadata, media_body=media,
                 fields="id, name, size, modifiedTime",
                 supportsAllDrives=True,
-            ).execute
+            ).execute,
+            limiter=self._write_limiter,
         )
+        self._invalidate(folder_ids=(folder_id,))
         logger.info("Uploaded bytes as %s (id=%s, size=%s)", file_name, result["id"], result.get("size"))
         return result
 
@@ -279,8 +565,10 @@ class DriveClient:
             self.write_service.files().update(
                 fileId=file_id, body={"name": new_name},
                 fields="id, name", supportsAllDrives=True,
-            ).execute
+            ).execute,
+            limiter=self._write_limiter,
         )
+        self._invalidate(file_id=file_id)
         logger.debug("Renamed %s -> %s", file_id, new_name)
         return result
 
@@ -290,13 +578,33 @@ class DriveClient:
                   "fields": "id, name, parents"}
         if old_parent_id:
             params["removeParents"] = old_parent_id
-        result = _retry(self.write_service.files().update(**params).execute)
+        result = _retry(self.write_service.files().update(**params).execute, limiter=self._write_limiter)
+        self._invalidate(folder_ids=(new_parent_id, old_parent_id), file_id=file_id)
         logger.debug("Moved %s to folder %s", file_id, new_parent_id)
         return result
 
+    def rename_and_move(self, file_id: str, new_name: str, add_parent: str = None,
+                        remove_parent: str = None, app_properties: dict = None) -> dict:
+        """Rename a file, optionally moving it and setting appProperties, in one request."""
+        body = {"name": new_name}
+        if app_properties:
+            body["appProperties"] = app_properties
+        params = {"fileId": file_id, "body": body, "supportsAllDrives": True,
+                  "fields": "id, name, parents"}
+        if add_parent:
+            params["addParents"] = add_parent
+        if remove_parent:
+            params["removeParents"] = remove_parent
+        result = _retry(self.write_service.files().update(**params).execute, limiter=self._write_limiter)
+        self._invalidate(folder_ids=(add_parent, remove_parent), file_id=file_id)
+        logger.debug("Renamed %s -> %s (moved to %s)", file_id, new_name, add_parent or "same folder")
+        return result
+
     def delete_file(self, file_id: str):
         """Permanently delete a file (use with caution!)."""
-        _retry(self.write_service.files().delete(fileId=file_id, supportsAllDrives=True).execute)
+        _retry(self.write_service.files().delete(fileId=file_id, supportsAllDrives=True).execute,
+               limiter=self._write_limiter)
+        self._invalidate(file_id=file_id)
         logger.warning("Deleted file %s", file_id)
 
     def trash_file(self, file_id: str) -> dict:
@@ -305,8 +613,10 @@ class DriveClient:
             self.write_service.files().update(
                 fileId=file_id, body={"trashed": True},
                 supportsAllDrives=True, fields="id, name, trashed",
-            ).execute
+            ).execute,
+            limiter=self._write_limiter,
         )
+        self._invalidate(file_id=file_id)
         logger.info("Trashed file %s", file_id)
         return result
 
@@ -320,8 +630,10 @@ class DriveClient:
                 body={"appProperties": properties},
                 supportsAllDrives=True,
                 fields="id, appProperties",
-            ).execute
+            ).execute,
+            limiter=self._write_limiter,
         )
+        self._invalidate(file_id=file_id)
         logger.debug("Set appProperties on %s: %s", file_id, properties)
 
     def get_app_properties(self, file_id: str) -> dict:
@@ -330,7 +642,8 @@ class DriveClient:
             self.service.files().get(
                 fileId=file_id, fields="appProperties",
                 supportsAllDrives=True,
-            ).execute
+            ).execute,
+            limiter=self._read_limiter,
         )
         return result.get("appProperties", {})
 
@@ -351,8 +664,10 @@ class DriveClient:
             self.write_service.files().create(
                 body=metadata, fields="id, name",
                 supportsAllDrives=True,
-            ).execute
+            ).execute,
+            limiter=self._write_limiter,
         )
+        self._invalidate(folder_ids=(parent_id,))
         logger.info("Created subfolder '%s' (id=%s) in %s", folder_name, result["id"], parent_id)
         return result["id"]
 
@@ -360,28 +675,63 @@ class DriveClient:
 
     def safe_replace(self, data: bytes, folder_id: str, final_name: str,
                      mime_type: str = None, allow_deletions: bool = False,
-                     archive_folder_name: str = "Archive") -> dict:
+                     archive_folder_name: str = "Archive",
+                     app_properties: dict = None) -> dict:
         """Upload with atomic safe-replace logic.
 
+        0. Skip everything if final_name already holds this content
         1. Upload as temp name
         2. Verify upload
         3. Archive or delete old file
-        4. Rename temp to final
+        4. Rename temp to final, stamping content_sha256 (and app_properties)
         """
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+        existing = self.find_file_by_name(folder_id, final_name)
+        return self._replace(data, folder_id, final_name, existing, mime_type,
+                             allow_deletions, archive_folder_name, app_properties)
+
+    def safe_replace_many(self, items: List[tuple], folder_id: str,
+                          allow_deletions: bool = False,
+                          archive_folder_name: str = "Archive") -> List[dict]:
+        """safe_replace each (data, final_name[, mime_type]) into one folder.
+
+        The existing files are looked up with one query instead of one per
+        name.  Returns the results in item order; stops at the first error.
+        """
+        existing = self.find_files_by_names(folder_id, [item[1] for item in items])
+        results = []
+        for data, final_name, *rest in items:
+            mime_type = rest[0] if rest else None
+            results.append(self._replace(
+                data, folder_id, final_name, existing.get(final_name), mime_type,
+                allow_deletions, archive_folder_name, None,
+            ))
+        return results
+
+    def _replace(self, data: bytes, folder_id: str, final_name: str,
+                 existing: Optional[dict], mime_type: Optional[str],
+                 allow_deletions: bool, archive_folder_name: str,
+                 app_properties: Optional[dict]) -> dict:
+        """safe_replace, given the current file at final_name (or None)."""
+        # Step 0: Skip the upload entirely if the final file already has this content
+        digest = hashlib.sha256(data).hexdigest()
+        if existing and _same_content(existing, data, digest):
+            logger.info("Safe replace: %s unchanged (id=%s), skipping upload.", final_name, existing["id"])
+            return {"id": existing["id"], "name": final_name,
+                    "size": int(existing.get("size", 0)), "unchanged": True}
+
+        timestamp = time.strftime(REPLACE_TIMESTAMP_FORMAT, time.gmtime())
         temp_name = f"{final_name}.tmp.{timestamp}"
 
         # Step 1: Upload as temp
         new_file = self.upload_bytes(data, folder_id, temp_name, mime_type)
+
+        # Step 2: Verify upload
         new_size = int(new_file.get("size", 0))
         if new_size == 0 and len(data) > 0:
             logger.error("Safe replace: uploaded file is empty! Aborting.")
             self.delete_file(new_file["id"])
             raise RuntimeError(f"Safe replace failed: uploaded temp file is empty for {final_name}")
 
-        # Step 2: Find existing file with final name
-        existing = self.find_file_by_name(folder_id, final_name)
-
         # Step 3: Archive or delete old
         if existing:
             if allow_deletions:
@@ -390,15 +740,86 @@ class DriveClient:
             else:
                 archive_id = self.ensure_subfolder(folder_id, archive_folder_name)
                 archive_name = f"{final_name}.{timestamp}"
-                self.rename_file(existing["id"], archive_name)
-                self.move_file(existing["id"], archive_id, folder_id)
+                self.rename_and_move(existing["id"], archive_name, archive_id, folder_id)
                 logger.info("Archived old file: %s -> %s/%s", final_name, archive_folder_name, archive_name)
 
         # Step 4: Rename temp to final
-        self.rename_file(new_file["id"], final_name)
+        self.rename_and_move(new_file["id"], final_name,
+                             app_properties={**(app_properties or {}), "content_sha256": digest})
         logger.info("Safe replace complete: %s (id=%s)", final_name, new_file["id"])
         return {"id": new_file["id"], "name": final_name, "size": new_size}
 
+    # ── Batch operations (thread pool) ──
+
+    def _thread_client(self) -> "DriveClient":
+        """Return this thread's DriveClient, sharing our credentials.
+
+        The API client (httplib2 underneath) is not thread-safe, so every
+        pool thread uses its own service objects from _SERVICE_CACHE.
+        """
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = DriveClient(self.credentials_path, self.shared_drive_id)
+            # Share the metadata cache so invalidations are seen by all threads
+            client._list_cache = self._list_cache
+            client._find_cache = self._find_cache
+            client._cache_lock = self._cache_lock
+            client._disk_cache = self._disk_cache
+            # ... and the rate limiters, since the quotas are per user
+            client._write_limiter = self._write_limiter
+            client._read_limiter = self._read_limiter
+            if self._sa_creds is not None:
+                client._sa_creds, client._sa_service = _get_service(
+                    ("sa", self.credentials_path), lambda: self._sa_creds,
+                )
+            if self._user_creds is not None:
+                client._user_creds, client._user_service = _get_service(
+                    ("oauth", OAUTH_TOKEN_PATH), lambda: self._user_creds,
+                )
+            self._local.client = client
+        return client
+
+    def _run_many(self, method_name: str, items: list) -> list:
+        """Call method_name(*item) for every item on the pool.
+
+        Results come back in item order; a failed item's slot holds the
+        exception instead of raising, so one bad file doesn't sink the batch.
+        """
+        def run(client, item):
+            try:
+                return getattr(client, method_name)(*item)
+            except Exception as e:
+                logger.error("%s failed for %s: %s", method_name, item[0], e)
+                return e
+
+        if len(items) <= 1:
+            return [run(self, item) for item in items]
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.pool_size,
+                                            thread_name_prefix="drive")
+        return list(self._pool.map(lambda item: run(self._thread_client(), item), items))
+
+    def download_many(self, items: List[Tuple[str, str]]) -> list:
+        """Download (file_id, dest_path) pairs concurrently.
+
+        Returns each dest path, or the exception for that item.
+        """
+        return self._run_many("download_file", list(items))
+
+    def upload_many(self, items: List[tuple]) -> list:
+        """Upload (data, folder_id, file_name[, mime_type]) tuples concurrently.
+
+        Returns each file's metadata, or the exception for that item.
+        """
+        return self._run_many("upload_bytes", list(items))
+
+    def delete_many(self, file_ids: List[str]) -> list:
+        """Permanently delete files concurrently.
+
+        Returns None per deleted file, or the exception for that item.
+        """
+        return self._run_many("delete_file", [(fid,) for fid in file_ids])
+
     # ── PDF export via Drive ──
 
     def export_as_pdf(self, docx_file_id: str) -> bytes:
@@ -407,10 +828,10 @@ class DriveClient:
             fileId=docx_file_id, mimeType="application/pdf"
         )
         buffer = io.BytesIO()
-        downloader = MediaIoBaseDownload(buffer, request)
+        downloader = MediaIoBaseDownload(buffer, request, chunksize=DOWNLOAD_CHUNK_SIZE)
         done = False
         while not done:
-            _, done = _retry(downloader.next_chunk)
+            _, done = _retry(downloader.next_chunk, limiter=self._read_limiter)
         return buffer.getvalue()
 
     def upload_docx_as_google_doc(self, data: bytes, folder_id: str, name: str) -> dict:
@@ -423,14 +844,17 @@ class DriveClient:
         media = MediaIoBaseUpload(
             io.BytesIO(data),
             mimetype="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            resumable=True,
+            chunksize=UPLOAD_CHUNK_SIZE,
+            resumable=len(data) >= RESUMABLE_THRESHOLD,
         )
         result = _retry(
             self.write_service.files().create(
                 body=metadata, media_body=media,
                 fields="id, name", supportsAllDrives=True,
-            ).execute
+            ).execute,
+            limiter=self._write_limiter,
         )
+        self._invalidate(folder_ids=(folder_id,))
         logger.debug("Uploaded DOCX as Google Doc: %s (id=%s)", name, result["id"])
         return result
 
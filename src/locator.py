@@ -1,26 +1,70 @@
 """Table locator - finds the target table in a DOCX by invisible code."""
 
 import logging
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from docx import Document
-from docx.table import Table
+from lxml import etree
+
+# python-docx is only needed once a document is actually scanned; importing
+# it here would add its load time to every command that imports this module.
+if TYPE_CHECKING:
+    from docx import Document
+    from docx.table import Table
 
 logger = logging.getLogger("price_sheet_bot.locator")
 
+# Cells of a <w:tbl> (direct w:tr/w:tc, as Table.rows and row.cells see them)
+# whose text contains $needle, evaluated in libxml2.  string(.) has no
+# paragraph or tab separators, so it can only over-match: hits are confirmed
+# against cell.text, which is built only for these few cells.
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_CELLS_CONTAINING = etree.XPath(
+    "w:tr/w:tc[contains(string(.), $needle)]", namespaces={"w": _W_NS},
+)
+
+# Runs of a cell's own paragraphs, as cell.paragraphs[i].runs sees them
+_CELL_RUNS = etree.XPath("w:p/w:r", namespaces={"w": _W_NS})
+_W_T = f"{{{_W_NS}}}t"
+_W_RPR = f"{{{_W_NS}}}rPr"
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
 
 @dataclass
 class TableMatch:
     """Result of finding a table by invisible code."""
     table_index: int
-    table: Table
+    table: "Table"
     cell_row: int
     cell_col: int
     cell_text: str
+    # The <w:tc> holding the code, so removal needn't walk Table.rows again
+    cell_tc: Optional[object] = field(default=None, repr=False, compare=False)
+
+
+def _first_cell_match(table: "Table", t_idx: int, needle: str, test) -> Optional[TableMatch]:
+    """First cell (in row order) of table whose text contains needle and passes test."""
+    from docx.table import _Cell
+
+    for tc in _CELLS_CONTAINING(table._tbl, needle=needle):
+        text = _Cell(tc, table).text
+        if test(text):
+            tr = tc.getparent()
+            tcs = tr.tc_lst
+            return TableMatch(
+                table_index=t_idx,
+                table=table,
+                cell_row=tr.getparent().tr_lst.index(tr),
+                # row.cells repeats a cell once per grid column it spans
+                cell_col=sum(c.grid_span for c in tcs[:tcs.index(tc)]),
+                cell_text=text,
+                cell_tc=tc,
+            )
+    return None
 
 
-def find_table_by_invisible_code(doc: Document, invisible_code: str) -> TableMatch:
+def find_table_by_invisible_code(doc: "Document", invisible_code: str) -> TableMatch:
     """Scan all tables/cells for the invisible_code string.
 
     Returns a TableMatch if found exactly once.
@@ -34,100 +78,146 @@ def find_table_by_invisible_code(doc: Document, invisible_code: str) -> TableMat
     if not invisible_code:
         raise ValueError("invisible_code is empty.")
 
-    matches: List[TableMatch] = []
-
-    for t_idx, table in enumerate(doc.tables):
-        for r_idx, row in enumerate(table.rows):
-            for c_idx, cell in enumerate(row.cells):
-                if invisible_code in cell.text:
-                    matches.append(TableMatch(
-                        table_index=t_idx,
-                        table=table,
-                        cell_row=r_idx,
-                        cell_col=c_idx,
-                        cell_text=cell.text,
-                    ))
-
-    # Fallback: if exact match failed, try matching without the closing ']]'
-    # Some templates have broken codes like "[[PS|COMM=NOVA|FP=02 " instead
-    # of "[[PS|COMM=NOVA|FP=02]]"
-    if len(matches) == 0 and invisible_code.endswith("]]"):
-        import re
+    # Broken codes like "[[PS|COMM=NOVA|FP=02 " instead of
+    # "[[PS|COMM=NOVA|FP=02]]" match on the core without the closing ']]'.
+    # The character after the core must NOT be alphanumeric, to prevent
+    # "FP=02" from matching "FP=02X".  It can be space, ], end-of-string, etc.
+    core = None
+    fallback_re = None
+    if invisible_code.endswith("]]"):
         core = invisible_code[:-2]  # e.g. "[[PS|COMM=NOVA|FP=02"
-        # The character after the core must NOT be alphanumeric, to prevent
-        # "FP=02" from matching "FP=02X".  It can be space, ], end-of-string, etc.
-        pattern = re.escape(core) + r"(?![A-Za-z0-9])"
-        for t_idx, table in enumerate(doc.tables):
-            for r_idx, row in enumerate(table.rows):
-                for c_idx, cell in enumerate(row.cells):
-                    if re.search(pattern, cell.text):
-                        matches.append(TableMatch(
-                            table_index=t_idx,
-                            table=table,
-                            cell_row=r_idx,
-                            cell_col=c_idx,
-                            cell_text=cell.text,
-                        ))
-        if matches:
-            logger.info(
-                "Invisible code '%s' not found exactly, but matched via "
-                "prefix '%s' in %d cell(s).", invisible_code, core, len(matches),
-            )
+        fallback_re = re.compile(re.escape(core) + r"(?![A-Za-z0-9])")
 
-    if len(matches) == 0:
-        raise ValueError(
-            f"Invisible code '{invisible_code}' NOT FOUND in any table cell. "
-            f"Scanned {len(doc.tables)} tables."
-        )
+    # One pass over the tables.  Only the first hit per table is kept: that
+    # is the one returned.  A second table with an exact hit is an error
+    # straight away; fallback hits only count when no exact hit exists
+    # anywhere, so a second fallback table is only an error at the end.
+    match: Optional[TableMatch] = None
+    fallback: List[TableMatch] = []
 
-    # Check if all matches are in the same table
-    table_indices = set(m.table_index for m in matches)
-    if len(table_indices) > 1:
-        details = "; ".join(
-            f"table[{m.table_index}] cell({m.cell_row},{m.cell_col})" for m in matches
-        )
-        raise ValueError(
-            f"Invisible code '{invisible_code}' found in MULTIPLE tables: {details}. "
-            f"Each invisible code must appear in exactly one table."
+    for t_idx, table in enumerate(doc.tables):
+        hit = _first_cell_match(table, t_idx, invisible_code,
+                                lambda text: invisible_code in text)
+        if hit:
+            if match:
+                _raise_multiple(invisible_code, [match, hit])
+            match = hit
+        elif not match and fallback_re and len(fallback) < 2:
+            hit = _first_cell_match(table, t_idx, core, fallback_re.search)
+            if hit:
+                fallback.append(hit)
+
+    if match:
+        return match
+
+    if fallback:
+        if len(fallback) > 1:
+            _raise_multiple(invisible_code, fallback)
+        logger.info(
+            "Invisible code '%s' not found exactly, but matched via "
+            "prefix '%s'.", invisible_code, core,
         )
-
-    # Multiple matches in the same table is OK (return first)
-    return matches[0]
+        return fallback[0]
+
+    raise ValueError(
+        f"Invisible code '{invisible_code}' NOT FOUND in any table cell. "
+        f"Scanned {len(doc.tables)} tables."
+    )
+
+
+def _raise_multiple(invisible_code: str, matches: List[TableMatch]):
+    """Raise the ValueError for a code found in more than one table."""
+    details = "; ".join(
+        f"table[{m.table_index}] cell({m.cell_row},{m.cell_col})" for m in matches
+    )
+    raise ValueError(
+        f"Invisible code '{invisible_code}' found in MULTIPLE tables: {details}. "
+        f"Each invisible code must appear in exactly one table."
+    )
+
+
+def _sole_text_element(r):
+    """The run's <w:t> if it is the run's only content besides <w:rPr>, else None."""
+    content = [child for child in r if child.tag != _W_RPR]
+    if len(content) == 1 and content[0].tag == _W_T:
+        return content[0]
+    return None
+
+
+def _set_run_text(r, t, text: str):
+    """Set a single-<w:t> run's text in place, as Run.text's setter would leave it."""
+    if not text:
+        r.remove(t)
+    elif "\t" in text or "\n" in text or "\r" in text:
+        from docx.text.run import Run
+        Run(r, None).text = text  # becomes <w:tab/>/<w:br/> elements
+    else:
+        t.text = text
+        if len(text.strip()) < len(text):
+            t.set(_XML_SPACE, "preserve")
+        else:
+            t.attrib.pop(_XML_SPACE, None)
 
 
 def remove_invisible_code(table_match: TableMatch, invisible_code: str):
     """Remove the invisible_code substring from the cell where it was found.
 
     Also handles broken codes (missing ']]') by removing the core prefix.
+    Uses the <w:tc> remembered by find_table_by_invisible_code when present,
+    so the table is not walked a second time.  Plain runs are edited at the
+    <w:t> level; runs with tabs, breaks or other content go through Run.text.
     """
-    cell = table_match.table.rows[table_match.cell_row].cells[table_match.cell_col]
+    tc = table_match.cell_tc
+    if tc is None:
+        tc = table_match.table.rows[table_match.cell_row].cells[table_match.cell_col]._tc
+
+    # Every code contains '[['; with no '[[' or ']]' anywhere there is nothing to do
+    cell_text = tc.xpath("string(.)")
+    if "[[" not in cell_text and "]]" not in cell_text:
+        return
 
     # Build list of strings to try removing (exact first, then prefix without ']]')
     codes_to_try = [invisible_code]
     if invisible_code.endswith("]]"):
         codes_to_try.append(invisible_code[:-2])  # prefix without closing brackets
 
-    for paragraph in cell.paragraphs:
-        for run in paragraph.runs:
+    for r in _CELL_RUNS(tc):
+        t = _sole_text_element(r)
+        if t is None:
+            from docx.text.run import Run
+            run = Run(r, None)
             for code in codes_to_try:
                 if code in run.text:
                     run.text = run.text.replace(code, "")
-                    # Also clean up any leftover ']]' that was in a separate run
-            # Clean stray ']]' that may have been the broken closing
             if run.text.strip() == "]]":
                 run.text = ""
+            continue
+
+        old = text = t.text or ""
+        for code in codes_to_try:
+            if code in text:
+                text = text.replace(code, "")
+        # Clean stray ']]' that may have been the broken closing
+        if text.strip() == "]]":
+            text = ""
+        if text != old:
+            _set_run_text(r, t, text)
 
 
-def scan_template_for_markers(doc: Document, marker_prefix: str = "[[PS|") -> list:
+def scan_template_for_markers(doc: "Document", marker_prefix: str = "[[PS|") -> list:
     """Scan all tables/cells for a marker prefix. For debugging.
 
     Returns list of dicts with table_index, cell_row, cell_col, snippet.
     """
     results = []
     for t_idx, table in enumerate(doc.tables):
+        # Only cells libxml2 flags as candidates get their text built
+        candidates = set(_CELLS_CONTAINING(table._tbl, needle=marker_prefix))
+        if not candidates:
+            continue
         for r_idx, row in enumerate(table.rows):
             for c_idx, cell in enumerate(row.cells):
-                if marker_prefix in cell.text:
+                if cell._tc in candidates and marker_prefix in cell.text:
                     snippet = cell.text[:100]
                     results.append({
                         "table_index": t_idx,
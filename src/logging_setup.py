@@ -5,36 +5,91 @@ Sets up dual logging: console + file + JSONL structured events.
 
 import json
 import logging
+import logging.handlers
 import os
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 
+try:
+    import orjson  # optional, much faster JSON encoding
+except ImportError:
+    orjson = None
+
 
 JSONL_PATH = "./logs/price_sheet_bot.jsonl"
 LOG_PATH = "./logs/price_sheet_bot.log"
 
+# Both log files roll over at this size, keeping this many old copies
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+
+def _iso_utc(created: float) -> str:
+    """A record's creation time as ISO-8601 UTC, as datetime.isoformat() writes it."""
+    return "%s.%06d+00:00" % (
+        time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(created)),
+        int(created % 1 * 1_000_000),
+    )
+
+
+def _dumps_line(entry: dict) -> bytes:
+    """Encode one JSONL line, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, default=str,
+                                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib copes
+    return (json.dumps(entry, default=str) + "\n").encode("utf-8")
+
+
+class JsonlHandler(logging.handlers.RotatingFileHandler):
+    """Writes structured JSON lines to a size-capped, rotating log file.
 
-class JsonlHandler(logging.Handler):
-    """Writes structured JSON lines to a log file."""
+    The file is opened once with a large buffer and records are not flushed
+    one by one; ERROR and above flush immediately, and logging's exit hook
+    flushes and closes the rest.  Handler.handle() serialises emit() calls
+    across threads.
+    """
 
-    def __init__(self, path: str):
-        super().__init__()
+    BUFFER_SIZE = 1 << 16
+
+    def __init__(self, path: str, max_bytes: int = LOG_MAX_BYTES,
+                 backup_count: int = LOG_BACKUP_COUNT):
         os.makedirs(os.path.dirname(path), exist_ok=True)
+        super().__init__(path, maxBytes=max_bytes, backupCount=backup_count, delay=True)
         self.path = path
 
+    def _open(self):
+        # Binary append regardless of self.mode, which the base class forces to "a"
+        return open(self.baseFilename, "ab", buffering=self.BUFFER_SIZE)
+
+    def format(self, record) -> bytes:
+        entry = {
+            "timestamp": _iso_utc(record.created),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if hasattr(record, "event_data"):
+            entry["data"] = record.event_data
+        return _dumps_line(entry)
+
     def emit(self, record):
         try:
-            entry = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "level": record.levelname,
-                "logger": record.name,
-                "message": record.getMessage(),
-            }
-            if hasattr(record, "event_data"):
-                entry["data"] = record.event_data
-            with open(self.path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, default=str) + "\n")
+            line = self.format(record)
+            if self.stream is None:
+                self.stream = self._open()
+            # Size check against the encoded line, rather than the base
+            # class's shouldRollover(), which would format the record twice
+            pos = self.stream.tell()
+            if self.maxBytes > 0 and pos and pos + len(line) > self.maxBytes:
+                self.doRollover()
+                self.stream = self._open()
+            self.stream.write(line)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
         except Exception:
             self.handleError(record)
 
@@ -63,7 +118,9 @@ def setup_logging(log_dir: str = "./logs", level: str = "INFO") -> logging.Logge
 
     # File handler
     log_file = os.path.join(log_dir, "price_sheet_bot.log")
-    fh = logging.FileHandler(log_file, encoding="utf-8")
+    fh = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8",
+    )
     fh.setLevel(logging.DEBUG)
     fh.setFormatter(fmt)
     logger.addHandler(fh)
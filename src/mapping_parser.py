@@ -2,13 +2,31 @@
 
 import logging
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 from .utils import normalize_for_compare
 
 logger = logging.getLogger("price_sheet_bot.mapping")
 
 
+# MAPPING field -> accepted header spellings, in priority order
+_FIELD_KEYS = {
+    "community": ("community",),
+    "floorplan": ("floorplan",),
+    "file_name": ("file_name", "file name"),
+    "invisible_code": ("invisible_code", "invisible code"),
+    "header_row": ("header_row", "header row"),
+}
+
+
+def _resolve_keys(record: dict) -> dict:
+    """Map each MAPPING field to the first of its spellings present in record."""
+    return {
+        name: next((k for k in spellings if k in record), None)
+        for name, spellings in _FIELD_KEYS.items()
+    }
+
+
 @dataclass
 class MappingRow:
     """A single row from the MAPPING tab."""
@@ -20,12 +38,24 @@ class MappingRow:
     row_index: int
 
     @staticmethod
-    def from_dict(record: dict, row_index: int) -> Optional["MappingRow"]:
-        """Parse a dict into a MappingRow. Returns None if required fields missing."""
-        community = str(record.get("community", "")).strip()
-        floorplan = str(record.get("floorplan", "")).strip()
-        file_name = str(record.get("file_name", record.get("file name", ""))).strip()
-        invisible_code = str(record.get("invisible_code", record.get("invisible code", ""))).strip()
+    def from_dict(record: dict, row_index: int,
+                  keys: Optional[dict] = None) -> Optional["MappingRow"]:
+        """Parse a dict into a MappingRow. Returns None if required fields missing.
+
+        keys is a _resolve_keys() result; parse_mapping_tab resolves it once
+        for all records, since they share the sheet's header row.
+        """
+        if keys is None:
+            keys = _resolve_keys(record)
+
+        def value(name: str, default: str = "") -> str:
+            key = keys[name]
+            return str(record[key]).strip() if key is not None else default
+
+        community = value("community")
+        floorplan = value("floorplan")
+        file_name = value("file_name")
+        invisible_code = value("invisible_code")
 
         if not community or not floorplan or not file_name or not invisible_code:
             logger.warning(
@@ -33,9 +63,9 @@ class MappingRow:
             )
             return None
 
-        header_row_raw = record.get("header_row", record.get("header row", "2"))
+        header_row_raw = value("header_row", "2")
         try:
-            header_row = int(str(header_row_raw).strip()) if str(header_row_raw).strip() else 2
+            header_row = int(header_row_raw) if header_row_raw else 2
         except ValueError:
             header_row = 2
 
@@ -51,24 +81,44 @@ class MappingRow:
 
 def parse_mapping_tab(records: list) -> List[MappingRow]:
     """Parse all records from the MAPPING tab into MappingRow objects."""
+    keys = _resolve_keys(records[0]) if records else None
     rows = []
     for i, record in enumerate(records):
-        row = MappingRow.from_dict(record, row_index=i + 2)
+        row = MappingRow.from_dict(record, row_index=i + 2, keys=keys)
         if row is not None:
             rows.append(row)
     logger.info("Parsed %d MAPPING rows from %d total.", len(rows), len(records))
     return rows
 
 
+def build_mapping_index(mapping_rows: List[MappingRow]) -> Dict[Tuple[str, str], MappingRow]:
+    """Index MAPPING rows by normalized (community, floorplan).
+
+    The first row wins on duplicates, as with a linear find_mapping_row scan.
+    """
+    index = {}
+    for row in mapping_rows:
+        key = (normalize_for_compare(row.community), normalize_for_compare(row.floorplan))
+        index.setdefault(key, row)
+    return index
+
+
 def find_mapping_row(
-    mapping_rows: List[MappingRow],
+    mapping_rows: Union[List[MappingRow], Dict[Tuple[str, str], MappingRow]],
     community: str,
     floorplan: str,
 ) -> Optional[MappingRow]:
-    """Find a MAPPING row matching (community, floorplan) case-insensitive."""
+    """Find a MAPPING row matching (community, floorplan) case-insensitive.
+
+    mapping_rows may be the parsed list or a build_mapping_index() dict;
+    pass the index when looking up many rows.
+    """
     c_norm = normalize_for_compare(community)
     f_norm = normalize_for_compare(floorplan)
 
+    if isinstance(mapping_rows, dict):
+        return mapping_rows.get((c_norm, f_norm))
+
     for row in mapping_rows:
         if (normalize_for_compare(row.community) == c_norm
                 and normalize_for_compare(row.floorplan) == f_norm):
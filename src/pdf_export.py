@@ -17,77 +17,285 @@ Microsoft Word via COM automation gives pixel-perfect output because it's
 the same engine that created the DOCX files.
 """
 
+import atexit
+import functools
+import hashlib
+import io
 import logging
 import os
 import platform
+import queue
+import re
+import shutil
+import socket
 import subprocess
 import tempfile
-from typing import Optional
+import threading
+import time
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from .utils import atomic_write, evict_lru
 
 logger = logging.getLogger("price_sheet_bot.pdf_export")
 
+# DOCX bytes, or the path of a DOCX file already on disk
+DocxInput = Union[bytes, str]
+
+# Set these to skip the executable search entirely (e.g. in production)
+SOFFICE_ENV_VAR = "PRICE_SHEET_SOFFICE"
+WINWORD_ENV_VAR = "PRICE_SHEET_WINWORD"
+# Directory for the DOCX/PDF files converters read and write
+STAGING_DIR_ENV_VAR = "PRICE_SHEET_STAGING_DIR"
+
+# Common install locations, expanded once; %PROGRAMFILES% usually repeats a
+# literal entry, so duplicates are dropped
+_WINDOWS_SOFFICE_PATHS = tuple(dict.fromkeys([
+    r"C:\Program Files\LibreOffice\program\soffice.exe",
+    r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
+    os.path.expandvars(r"%PROGRAMFILES%\LibreOffice\program\soffice.exe"),
+]))
+_MAC_SOFFICE_PATH = "/Applications/LibreOffice.app/Contents/MacOS/soffice"
+_WINWORD_PATHS = tuple(dict.fromkeys([
+    r"C:\Program Files\Microsoft Office\Root\Office16\WINWORD.EXE",
+    r"C:\Program Files (x86)\Microsoft Office\Root\Office16\WINWORD.EXE",
+    r"C:\Program Files\Microsoft Office\Root\Office15\WINWORD.EXE",
+    os.path.expandvars(r"%PROGRAMFILES%\Microsoft Office\Root\Office16\WINWORD.EXE"),
+]))
+
+# Persistent LibreOffice listener (optional, needs the unoserver package)
+UNOSERVER_HOST = "127.0.0.1"
+UNOSERVER_PORT = 2003  # unoserver's XML-RPC port
+UNO_PORT = 2202  # soffice's UNO socket, owned by unoserver
+UNOSERVER_START_TIMEOUT = 30  # seconds
+LO_BATCH_SIZE = 10  # documents per one-shot soffice run
+LO_TIMEOUT = 120  # seconds for a one-shot soffice run ...
+LO_TIMEOUT_PER_EXTRA_DOC = 30  # ... plus this for each extra document
+# LibreOffice profiles live here so their caches survive restarts
+LO_PROFILE_DIR = "./cache/lo_profile"
+
+# Runs speculative Drive conversions (see export_to_pdf) and temp-doc
+# cleanup; one long-lived thread, so it keeps a single Drive service of its own
+_DRIVE_BACKGROUND_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-drive")
+
+# Runs Word and LibreOffice side by side when export_to_pdf races them
+_RACE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf-race")
+
+# DOCX files beyond these limits are refused rather than rendered
+MAX_DOCX_BYTES = 200 * 1024 * 1024
+MAX_MEDIA_BYTES = 50 * 1024 * 1024  # uncompressed word/media/ total
+
+# Word/LibreOffice output, keyed by the SHA-256 of the input DOCX and the
+# engine that rendered it.  Least recently used files are evicted once the
+# directory exceeds the size cap.
+PDF_CACHE_DIR = "./cache/pdf"
+_PDF_CACHE_ENGINES = {"Word COM": "word", "LibreOffice": "libreoffice"}
+PDF_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _staging_root() -> Optional[str]:
+    """Where to stage files for conversion; None means the system temp dir.
+
+    On Linux this is /dev/shm when writable, so staged files stay in RAM.
+    """
+    override = os.environ.get(STAGING_DIR_ENV_VAR)
+    if override:
+        return override
+    if platform.system() == "Linux" and os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return None
+
+
+def _write_file(path: str, data: bytes):
+    """Write data to path with unbuffered os.write calls (no copy into a buffer)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _stage_docx(docx: DocxInput, dest_path: str) -> str:
+    """Path of docx on disk: the path itself, or dest_path after writing the bytes there."""
+    if isinstance(docx, str):
+        return docx
+    _write_file(dest_path, docx)
+    return dest_path
+
 
+def _read_file(path: str) -> bytes:
+    """Read all of path; unbuffered, so the result is sized from fstat and filled once."""
+    with open(path, "rb", buffering=0) as f:
+        return f.readall()
+
+
+@functools.lru_cache(maxsize=1)
 def _find_libreoffice() -> Optional[str]:
     """Find the LibreOffice executable on the current platform.
 
-    Returns the path to soffice, or None if not found.
+    Returns the path to soffice, or None if not found.  The result is
+    cached for the life of the process.
     """
+    override = os.environ.get(SOFFICE_ENV_VAR)
+    if override:
+        return override
+
     # Try 'soffice' in PATH first (Linux, macOS, or manually added)
-    try:
-        subprocess.run(["soffice", "--version"], capture_output=True, check=True, timeout=10)
-        return "soffice"
-    except (FileNotFoundError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
-        pass
+    found = shutil.which("soffice")
+    if found:
+        return found
 
     # Windows: check common install locations
     if platform.system() == "Windows":
-        common_paths = [
-            r"C:\Program Files\LibreOffice\program\soffice.exe",
-            r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
-            os.path.expandvars(r"%PROGRAMFILES%\LibreOffice\program\soffice.exe"),
-        ]
-        for path in common_paths:
+        for path in _WINDOWS_SOFFICE_PATHS:
             if os.path.exists(path):
                 return path
 
     # macOS: check Applications
     if platform.system() == "Darwin":
-        mac_path = "/Applications/LibreOffice.app/Contents/MacOS/soffice"
-        if os.path.exists(mac_path):
-            return mac_path
+        if os.path.exists(_MAC_SOFFICE_PATH):
+            return _MAC_SOFFICE_PATH
 
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def _find_word() -> Optional[str]:
     """Find Microsoft Word executable on Windows.
 
     Returns the path to WINWORD.EXE, or None if not found.
-    Only works on Windows (Word COM requires Windows).
+    Only works on Windows (Word COM requires Windows).  The result is
+    cached for the life of the process.
     """
     if platform.system() != "Windows":
         return None
 
-    common_paths = [
-        r"C:\Program Files\Microsoft Office\Root\Office16\WINWORD.EXE",
-        r"C:\Program Files (x86)\Microsoft Office\Root\Office16\WINWORD.EXE",
-        r"C:\Program Files\Microsoft Office\Root\Office15\WINWORD.EXE",
-        os.path.expandvars(r"%PROGRAMFILES%\Microsoft Office\Root\Office16\WINWORD.EXE"),
-    ]
-    for path in common_paths:
+    override = os.environ.get(WINWORD_ENV_VAR)
+    if override:
+        return override
+
+    for path in _WINWORD_PATHS:
         if os.path.exists(path):
             return path
 
     return None
 
 
-def export_pdf_via_word(docx_bytes: bytes) -> Optional[bytes]:
+def _co_initialize():
+    """Initialize COM on the calling thread."""
+    try:
+        import comtypes
+        comtypes.CoInitialize()
+    except ImportError:
+        import pythoncom
+        pythoncom.CoInitialize()
+
+
+def _create_word_app():
+    # Try comtypes first (more reliable, no pywin32 dependency)
+    try:
+        import comtypes.client
+        word = comtypes.client.CreateObject("Word.Application")
+    except Exception:
+        import win32com.client
+        word = win32com.client.Dispatch("Word.Application")
+
+    word.Visible = False
+    word.DisplayAlerts = False
+    return word
+
+
+class _WordWorker:
+    """One Word instance, kept open on a thread of its own.
+
+    Starting Word takes seconds, so the instance is reused for every
+    conversion and only quit at exit (or after a failure, in case Word is
+    in a bad state).  Word's COM objects are single-threaded, so the
+    thread that created them runs every job; callers queue work to it.
+    """
+
+    def __init__(self):
+        self._jobs: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def convert(self, docx_abs: str, pdf_abs: str):
+        """Save docx_abs as PDF at pdf_abs; raises on failure."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="word-com", daemon=True)
+                self._thread.start()
+        future: Future = Future()
+        self._jobs.put((docx_abs, pdf_abs, future))
+        future.result()
+
+    def stop(self):
+        with self._lock:
+            if self._thread is not None:
+                self._jobs.put(None)
+                self._thread.join(timeout=30)
+                self._thread = None
+
+    def _run(self):
+        _co_initialize()
+        word = None
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            docx_abs, pdf_abs, future = job
+            doc = None
+            try:
+                if word is None:
+                    word = _create_word_app()
+
+                # Open the document
+                doc = word.Documents.Open(docx_abs, ReadOnly=True)
+
+                # ExportAsFixedFormat: Type=0 is PDF
+                # wdExportFormatPDF = 17
+                doc.SaveAs2(pdf_abs, FileFormat=17)
+
+                doc.Close(SaveChanges=False)
+                future.set_result(None)
+            except Exception as e:
+                if doc:
+                    try:
+                        doc.Close(SaveChanges=False)
+                    except Exception:
+                        pass
+                word = _quit_word(word)
+                future.set_exception(e)
+        _quit_word(word)
+
+
+def _quit_word(word) -> None:
+    if word:
+        try:
+            word.Quit()
+        except Exception:
+            pass
+    return None
+
+
+_WORD_WORKER = _WordWorker()
+atexit.register(_WORD_WORKER.stop)
+
+
+def export_pdf_via_word(docx: DocxInput) -> Optional[bytes]:
     """Export DOCX to PDF using Microsoft Word COM automation.
 
     BEST method - pixel-perfect rendering because Word is the engine that
     created the DOCX files. Only available on Windows with Word installed.
 
-    Uses win32com.client to open the DOCX in Word and SaveAs PDF.
+    Uses COM (comtypes or win32com.client) to open the DOCX in Word and
+    SaveAs PDF; the Word instance is kept open between calls.  docx may
+    be the bytes or the path of a DOCX file.
     Returns PDF bytes or None if Word/COM not available.
     """
     if platform.system() != "Windows":
@@ -109,109 +317,274 @@ def export_pdf_via_word(docx_bytes: bytes) -> Optional[bytes]:
 
     logger.info("Exporting PDF via Microsoft Word COM...")
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        docx_path = os.path.join(tmpdir, "input.docx")
+    with tempfile.TemporaryDirectory(dir=_staging_root()) as tmpdir:
+        docx_path = _stage_docx(docx, os.path.join(tmpdir, "input.docx"))
         pdf_path = os.path.join(tmpdir, "input.pdf")
 
-        with open(docx_path, "wb") as f:
-            f.write(docx_bytes)
-
         # Use absolute paths (Word COM requires them)
         docx_abs = os.path.abspath(docx_path)
         pdf_abs = os.path.abspath(pdf_path)
 
-        word = None
-        doc = None
         try:
-            # Try comtypes first (more reliable, no pywin32 dependency)
-            try:
-                import comtypes.client
-                word = comtypes.client.CreateObject("Word.Application")
-            except Exception:
-                import win32com.client
-                word = win32com.client.Dispatch("Word.Application")
-
-            word.Visible = False
-            word.DisplayAlerts = False
-
-            # Open the document
-            doc = word.Documents.Open(docx_abs, ReadOnly=True)
-
-            # ExportAsFixedFormat: Type=0 is PDF
-            # wdExportFormatPDF = 17
-            doc.SaveAs2(pdf_abs, FileFormat=17)
-
-            doc.Close(SaveChanges=False)
-            doc = None
-
+            _WORD_WORKER.convert(docx_abs, pdf_abs)
         except Exception as e:
             logger.error("Word COM conversion failed: %s", e)
-            if doc:
-                try:
-                    doc.Close(SaveChanges=False)
-                except Exception:
-                    pass
             return None
-        finally:
-            if word:
-                try:
-                    word.Quit()
-                except Exception:
-                    pass
 
         if not os.path.exists(pdf_path):
             logger.error("Word COM did not produce PDF output.")
             return None
 
-        with open(pdf_path, "rb") as f:
-            pdf_bytes = f.read()
+        pdf_bytes = _read_file(pdf_path)
 
         logger.info("PDF export via Microsoft Word successful (%d bytes).", len(pdf_bytes))
         return pdf_bytes
 
 
-def export_pdf_via_libreoffice(docx_bytes: bytes) -> Optional[bytes]:
-    """Export DOCX to PDF using LibreOffice.
+class _LoServer:
+    """A LibreOffice instance kept running between conversions.
 
-    Preferred method — preserves all Word formatting including page borders,
-    floating images, positioned shapes, headers/footers, etc.
+    Started on first use through unoserver (which owns the soffice process
+    and its UNO socket) and stopped at exit, so soffice's 1-3 s startup is
+    paid once per process rather than once per document.
 
-    Returns PDF bytes or None if LibreOffice not available.
+    Two LibreOffice instances can't share a profile, so the server and the
+    one-shot soffice fallback each get their own, keyed by the UNO port.
+    one_shot_lock keeps one-shot runs on that profile one at a time.
     """
-    soffice = _find_libreoffice()
-    if not soffice:
-        logger.debug("LibreOffice not available for PDF conversion.")
-        return None
 
-    logger.info("Exporting PDF via LibreOffice...")
+    def __init__(self, port: int = UNOSERVER_PORT, uno_port: int = UNO_PORT):
+        self.port = port
+        self.uno_port = uno_port
+        profiles = Path(LO_PROFILE_DIR).resolve() / str(uno_port)
+        self.profile = profiles / "server"
+        self.one_shot_profile = profiles / "oneshot"
+        self.one_shot_lock = threading.Lock()
+        self._proc: Optional[subprocess.Popen] = None
+        self._failed = False
+        self._lock = threading.Lock()
+
+    def _listening(self) -> bool:
+        try:
+            with socket.create_connection((UNOSERVER_HOST, self.port), timeout=1):
+                return True
+        except OSError:
+            return False
+
+    def ensure_running(self) -> bool:
+        """Start the server if needed; False if it isn't available."""
+        with self._lock:
+            if self._proc is not None and self._proc.poll() is None:
+                return True
+            if self._failed:
+                return False
+
+            unoserver = shutil.which("unoserver")
+            soffice = _find_libreoffice()
+            if not unoserver or not soffice:
+                self._failed = True
+                return False
+
+            logger.info("Starting LibreOffice server on port %d...", self.port)
+            self._proc = subprocess.Popen(
+                [unoserver, "--interface", UNOSERVER_HOST, "--port", str(self.port),
+                 "--uno-port", str(self.uno_port), "--executable", soffice,
+                 "--user-installation", self.profile.as_uri()],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            deadline = time.monotonic() + UNOSERVER_START_TIMEOUT
+            while time.monotonic() < deadline and self._proc.poll() is None:
+                if self._listening():
+                    return True
+                time.sleep(0.2)
+
+            logger.warning("LibreOffice server did not start; using one-shot soffice.")
+            self._stop()
+            self._failed = True
+            return False
+
+    def convert(self, docx: DocxInput) -> Optional[bytes]:
+        """Convert via the server; None if it isn't available or fails."""
+        try:
+            from unoserver.client import UnoClient
+        except ImportError:
+            return None
+        if not self.ensure_running():
+            return None
+        try:
+            client = UnoClient(server=UNOSERVER_HOST, port=str(self.port))
+            if isinstance(docx, str):
+                return client.convert(inpath=docx, convert_to="pdf")
+            return client.convert(indata=docx, convert_to="pdf")
+        except Exception as e:
+            logger.warning("LibreOffice server conversion failed: %s", e)
+            return None
+
+    def _stop(self):
+        if self._proc is None:
+            return
+        self._proc.terminate()
+        try:
+            self._proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+        self._proc = None
+
+    def stop(self):
+        with self._lock:
+            self._stop()
+
+
+_LO_SERVER = _LoServer()
+atexit.register(_LO_SERVER.stop)
+
+
+def _export_one_shot(soffice: str, server: _LoServer,
+                     docs: List[DocxInput]) -> List[Optional[bytes]]:
+    """Convert docs with a single soffice run; None for each that failed.
+
+    soffice names each PDF after its input, so paths among docs need
+    distinct file names.
+    """
+    logger.info("Exporting %d PDF(s) via LibreOffice...", len(docs))
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        docx_path = os.path.join(tmpdir, "input.docx")
-        with open(docx_path, "wb") as f:
-            f.write(docx_bytes)
+    # One-shot soffice only reads and writes named files: --outdir must be a
+    # directory, and it picks the import filter from the input's extension,
+    # so neither pipes nor /proc/self/fd paths work here.  The server path
+    # is the in-memory one.
+    with tempfile.TemporaryDirectory(dir=_staging_root()) as tmpdir:
+        docx_paths = [_stage_docx(docx, os.path.join(tmpdir, f"doc_{i}.docx"))
+                      for i, docx in enumerate(docs)]
 
         try:
-            subprocess.run(
-                [soffice, "--headless", "--convert-to", "pdf", "--outdir", tmpdir, docx_path],
-                capture_output=True, check=True, timeout=120,
-            )
+            with server.one_shot_lock:
+                # close_fds=False lets CPython launch soffice with posix_spawn
+                # instead of fork+exec; nothing leaks, since Python creates
+                # its descriptors non-inheritable (PEP 446)
+                subprocess.run(
+                    [soffice, f"-env:UserInstallation={server.one_shot_profile.as_uri()}",
+                     "--headless", "--convert-to", "pdf", "--outdir", tmpdir, *docx_paths],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True,
+                    timeout=LO_TIMEOUT + LO_TIMEOUT_PER_EXTRA_DOC * (len(docs) - 1),
+                    close_fds=False,
+                )
         except subprocess.CalledProcessError as e:
             logger.error("LibreOffice conversion failed: %s", e.stderr)
-            return None
+            return [None] * len(docs)
         except subprocess.TimeoutExpired:
             logger.error("LibreOffice conversion timed out.")
-            return None
+            return [None] * len(docs)
 
-        pdf_path = os.path.join(tmpdir, "input.pdf")
-        if not os.path.exists(pdf_path):
-            logger.error("LibreOffice did not produce PDF output.")
-            return None
+        results: List[Optional[bytes]] = []
+        for docx_path in docx_paths:
+            stem = os.path.splitext(os.path.basename(docx_path))[0]
+            pdf_path = os.path.join(tmpdir, f"{stem}.pdf")
+            if not os.path.exists(pdf_path):
+                logger.error("LibreOffice did not produce PDF output.")
+                results.append(None)
+                continue
 
-        with open(pdf_path, "rb") as f:
-            pdf_bytes = f.read()
+            pdf_bytes = _read_file(pdf_path)
+
+            logger.info("PDF export via LibreOffice successful (%d bytes).", len(pdf_bytes))
+            results.append(pdf_bytes)
+        return results
 
-        logger.info("PDF export via LibreOffice successful (%d bytes).", len(pdf_bytes))
-        return pdf_bytes
+
+def export_pdfs_via_libreoffice(docs: List[DocxInput],
+                                server: Optional[_LoServer] = None) -> List[Optional[bytes]]:
+    """Export several DOCX files to PDF using LibreOffice, in the order given.
+
+    Documents go to the persistent LibreOffice server one by one when
+    unoserver is installed.  Otherwise one soffice run converts up to
+    LO_BATCH_SIZE of them, paying LibreOffice's startup once per batch.
+    A caller may pass its own server, whose one-shot profile is then
+    used too.
+
+    Returns PDF bytes per document: None where it failed, or for all of
+    them if LibreOffice is not available.
+    """
+    soffice = _find_libreoffice()
+    if not soffice:
+        logger.debug("LibreOffice not available for PDF conversion.")
+        return [None] * len(docs)
+
+    server = server or _LO_SERVER
+    results = []
+    for docx in docs:
+        pdf_bytes = server.convert(docx)
+        if pdf_bytes:
+            logger.info("PDF export via LibreOffice server successful (%d bytes).", len(pdf_bytes))
+        results.append(pdf_bytes)
+
+    pending = [i for i, pdf_bytes in enumerate(results) if not pdf_bytes]
+    for start in range(0, len(pending), LO_BATCH_SIZE):
+        batch = pending[start:start + LO_BATCH_SIZE]
+        for i, pdf_bytes in zip(batch, _export_one_shot(soffice, server, [docs[i] for i in batch])):
+            results[i] = pdf_bytes
+    return results
+
+
+def export_pdf_via_libreoffice(docx: DocxInput,
+                               server: Optional[_LoServer] = None) -> Optional[bytes]:
+    """Export DOCX to PDF using LibreOffice.
+
+    Preferred method — preserves all Word formatting including page borders,
+    floating images, positioned shapes, headers/footers, etc.
+
+    Uses the persistent LibreOffice server when unoserver is installed, and
+    a one-shot soffice run otherwise (see export_pdfs_via_libreoffice).
+    docx may be the bytes or the path of a DOCX file.
+
+    Returns PDF bytes or None if LibreOffice not available.
+    """
+    return export_pdfs_via_libreoffice([docx], server)[0]
+
+
+def _minimal_docx() -> bytes:
+    """A valid one-paragraph DOCX, for warming up LibreOffice."""
+    w_ns = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as z:
+        z.writestr(
+            "[Content_Types].xml",
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/word/document.xml" ContentType='
+            '"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            '</Types>',
+        )
+        z.writestr(
+            "_rels/.rels",
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/'
+            '2006/relationships/officeDocument" Target="word/document.xml"/>'
+            '</Relationships>',
+        )
+        z.writestr(
+            "word/document.xml",
+            f'<?xml version="1.0" encoding="UTF-8"?><w:document xmlns:w="{w_ns}">'
+            '<w:body><w:p><w:r><w:t>warmup</w:t></w:r></w:p></w:body></w:document>',
+        )
+    return buf.getvalue()
+
+
+def warmup():
+    """Run one throwaway LibreOffice conversion.
+
+    The first conversion pays for LibreOffice's startup and, on a new
+    profile, its font and configuration caches; calling this at startup
+    (e.g. on a background thread) moves that off the first real export.
+    Does nothing when Word will do the exports.
+    """
+    if _find_word() or not _find_libreoffice():
+        return
+    started = time.monotonic()
+    if export_pdf_via_libreoffice(_minimal_docx()):
+        logger.info("LibreOffice warmed up in %.1fs.", time.monotonic() - started)
 
 
 def export_pdf_via_drive(drive_client, docx_bytes: bytes, temp_folder_id: str,
@@ -224,9 +597,15 @@ def export_pdf_via_drive(drive_client, docx_bytes: bytes, temp_folder_id: str,
     - Positioned elements get displaced
 
     Use only as a fallback when LibreOffice is not available.
+
+    The temp Google Doc is deleted in the background, off the caller's
+    critical path (pending deletes still finish before the process exits).
     """
     logger.info("Exporting PDF via Google Drive conversion (fallback)...")
 
+    # Upload, export and delete all go to www.googleapis.com through the
+    # client's cached service, so they share one kept-alive TLS connection
+
     # Upload DOCX as Google Doc
     temp_doc = drive_client.upload_docx_as_google_doc(
         docx_bytes, temp_folder_id, temp_name
@@ -242,27 +621,159 @@ def export_pdf_via_drive(drive_client, docx_bytes: bytes, temp_folder_id: str,
         return pdf_bytes
     finally:
         # Always clean up temp Google Doc
-        try:
-            drive_client.delete_file(temp_id)
-        except Exception as e:
-            logger.warning("Failed to delete temp Google Doc %s: %s", temp_id, e)
+        _DRIVE_BACKGROUND_POOL.submit(_delete_temp_doc, drive_client, temp_id)
 
 
-def _count_pdf_pages(pdf_bytes: bytes) -> int:
-    """Count the number of pages in a PDF."""
+def _delete_temp_doc(drive_client, temp_id: str):
+    # drive_client isn't thread-safe: use this thread's own client
     try:
-        import pdfplumber
-        import io
+        drive_client._thread_client().delete_file(temp_id)
+    except Exception as e:
+        logger.warning("Failed to delete temp Google Doc %s: %s", temp_id, e)
+
+
+# Page-tree dictionaries (without nested dictionaries) and page objects
+_PAGES_NODE_RE = re.compile(rb"<<(?:(?!<<|>>).)*?/Type\s*/Pages\b(?:(?!<<|>>).)*>>", re.S)
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)")
+_PAGE_OBJECT_RE = re.compile(rb"/Type\s*/Page\b(?!s)")
+
+
+def _pdf_cache_path(docx_bytes: bytes, engine: str) -> str:
+    digest = hashlib.sha256(docx_bytes).hexdigest()
+    return os.path.join(PDF_CACHE_DIR, f"{digest}.{_PDF_CACHE_ENGINES[engine]}.pdf")
+
+
+def _load_cached_pdf(docx_bytes: bytes,
+                     engines: Tuple[str, ...]) -> Tuple[Optional[str], Optional[bytes]]:
+    """The PDF exported from these exact DOCX bytes by the first of engines cached.
+
+    Returns (engine, PDF), or (None, None) on a miss.
+    """
+    for engine in engines:
+        path = _pdf_cache_path(docx_bytes, engine)
+        try:
+            pdf_bytes = _read_file(path)
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            continue
+        if pdf_bytes:
+            logger.info("%s PDF export served from cache (%d bytes).", engine, len(pdf_bytes))
+            return engine, pdf_bytes
+    return None, None
+
+
+def _store_cached_pdf(docx_bytes: bytes, engine: str, pdf_bytes: bytes):
+    """Cache engine's pdf_bytes for docx_bytes, then evict the oldest entries over the cap."""
+    try:
+        atomic_write(_pdf_cache_path(docx_bytes, engine), pdf_bytes)
+        evict_lru(PDF_CACHE_DIR, ".pdf", PDF_CACHE_MAX_BYTES)
+    except OSError as e:
+        logger.warning("Could not cache exported PDF: %s", e)
+
+
+def count_pdf_pages(pdf_bytes: bytes) -> int:
+    """Count the number of pages in a PDF.
+
+    Reads /Count from the page tree (the root /Pages node has the largest)
+    and counts /Type /Page objects, straight from the bytes, taking the
+    larger: a /Pages node holding a nested dictionary (such as inline
+    /Resources) isn't matched, leaving only intermediate nodes' counts.
+    Only PDFs that keep their objects in compressed streams need a full
+    parse, and only they import pdfplumber.  Returns -1 if the page count
+    can't be found.
+    """
+    counts = [
+        int(m.group(1))
+        for node in _PAGES_NODE_RE.finditer(pdf_bytes)
+        for m in [_COUNT_RE.search(node.group(0))] if m
+    ]
+    pages = max(max(counts, default=0), len(_PAGE_OBJECT_RE.findall(pdf_bytes)))
+    if pages:
+        return pages
+
+    try:
+        import pdfplumber  # Slow to import; only needed here
         with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
             return len(pdf.pages)
     except Exception:
         return -1
 
 
+_PAGE_MISMATCH_HINTS = {
+    "Word COM": "Continuing anyway.",
+    "LibreOffice": "This may indicate font metric differences causing table overflow.",
+}
+
+
+def _check_page_count(engine: str, pdf_bytes: bytes, expected_pages: int):
+    """Warn when the PDF doesn't have expected_pages pages (0 skips the check)."""
+    if expected_pages <= 0:
+        return
+    actual = count_pdf_pages(pdf_bytes)
+    if actual != expected_pages:
+        logger.warning(
+            "%s PDF has %d pages (expected %d). %s",
+            engine, actual, expected_pages, _PAGE_MISMATCH_HINTS[engine],
+        )
+
+
+def _check_docx_size(docx_bytes: bytes):
+    """Raise ValueError if the DOCX is too big to render sensibly.
+
+    Only the ZIP central directory is read, not the file contents.
+    """
+    if len(docx_bytes) > MAX_DOCX_BYTES:
+        raise ValueError(
+            f"DOCX is {len(docx_bytes)} bytes, over the {MAX_DOCX_BYTES}-byte limit."
+        )
+    try:
+        with zipfile.ZipFile(io.BytesIO(docx_bytes)) as z:
+            media = sum(i.file_size for i in z.infolist() if i.filename.startswith("word/media/"))
+    except zipfile.BadZipFile:
+        return  # Not a ZIP: leave it to the converters to reject
+    if media > MAX_MEDIA_BYTES:
+        raise ValueError(
+            f"DOCX embeds {media} bytes of media, over the {MAX_MEDIA_BYTES}-byte limit."
+        )
+
+
+def _export_word_then_libreoffice(docx: DocxInput) -> Tuple[str, Optional[bytes]]:
+    """(engine, PDF) from Word, or from LibreOffice if Word isn't available."""
+    # Try Microsoft Word COM first (pixel-perfect rendering)
+    result = export_pdf_via_word(docx)
+    if result:
+        return "Word COM", result
+    # Try LibreOffice next (preserves design faithfully, minor table style diffs)
+    return "LibreOffice", export_pdf_via_libreoffice(docx)
+
+
+def _race_word_and_libreoffice(docx_bytes: bytes) -> Tuple[Optional[str], Optional[bytes]]:
+    """Run Word and LibreOffice at once: (engine, PDF) of the first to succeed.
+
+    The other keeps running in the background and its result is dropped;
+    neither can be interrupted safely mid-document.
+    """
+    futures = {
+        _RACE_POOL.submit(export_pdf_via_word, docx_bytes): "Word COM",
+        _RACE_POOL.submit(export_pdf_via_libreoffice, docx_bytes): "LibreOffice",
+    }
+    for future in as_completed(futures):
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.warning("%s PDF export failed: %s", futures[future], e)
+            continue
+        if result:
+            return futures[future], result
+    return None, None
+
+
 def export_to_pdf(drive_client, docx_bytes: bytes, temp_folder_id: str,
                    temp_name: str = "_temp_convert",
                    prefer_drive: bool = False,
-                   expected_pages: int = 0) -> bytes:
+                   expected_pages: int = 0,
+                   speculate_drive: bool = False,
+                   race: bool = False) -> bytes:
     """Export DOCX to PDF using best available method.
 
     Priority:
@@ -273,36 +784,67 @@ def export_to_pdf(drive_client, docx_bytes: bytes, temp_folder_id: str,
     If expected_pages > 0, validates the generated PDF has the correct
     page count. This catches LibreOffice rendering differences that can
     cause tables to overflow to extra pages.
+
+    Word and LibreOffice output is cached by DOCX content and engine, so
+    exporting the same bytes again returns the earlier PDF, unless it came
+    from LibreOffice and Word (without race) is now available.  Drive
+    output isn't cached, letting a later run with Word or LibreOffice do
+    better.  Cached PDFs get the same page-count check as fresh ones.
+
+    With speculate_drive, the Drive conversion starts in the background
+    alongside Word/LibreOffice.  Their output still wins when they succeed,
+    and a Drive job that hasn't started yet is then cancelled; when they
+    fail, the Drive result is already on its way.
+
+    With race, Word and LibreOffice run at the same time and the first PDF
+    wins, trading Word's fidelity for latency when LibreOffice is faster.
+
+    Raises ValueError, before any conversion, for a DOCX over MAX_DOCX_BYTES
+    or with more than MAX_MEDIA_BYTES of embedded media.
     """
-    # Try Microsoft Word COM first (pixel-perfect rendering)
-    result = export_pdf_via_word(docx_bytes)
-    if result:
-        if expected_pages > 0:
-            actual = _count_pdf_pages(result)
-            if actual != expected_pages:
-                logger.warning(
-                    "Word COM PDF has %d pages (expected %d). Continuing anyway.",
-                    actual, expected_pages,
-                )
-        return result
+    _check_docx_size(docx_bytes)
+
+    engines = ("Word COM",) if _find_word() and not race else ("Word COM", "LibreOffice")
+    engine, cached = _load_cached_pdf(docx_bytes, engines)
+    if cached:
+        _check_page_count(engine, cached, expected_pages)
+        return cached
+
+    drive_future = None
+    if speculate_drive:
+        # drive_client isn't thread-safe: the pool thread uses its own client
+        drive_future = _DRIVE_BACKGROUND_POOL.submit(
+            lambda: export_pdf_via_drive(drive_client._thread_client(), docx_bytes,
+                                         temp_folder_id, temp_name),
+        )
+
+    if race:
+        engine, result = _race_word_and_libreoffice(docx_bytes)
+    elif _find_word():
+        # Word, and LibreOffice if Word fails, both read the DOCX from disk:
+        # write it once for the two of them
+        with tempfile.TemporaryDirectory(dir=_staging_root()) as tmpdir:
+            docx_path = os.path.join(tmpdir, "input.docx")
+            _write_file(docx_path, docx_bytes)
+            engine, result = _export_word_then_libreoffice(docx_path)
+    else:
+        engine, result = _export_word_then_libreoffice(docx_bytes)
 
-    # Try LibreOffice next (preserves design faithfully, minor table style diffs)
-    result = export_pdf_via_libreoffice(docx_bytes)
     if result:
-        if expected_pages > 0:
-            actual = _count_pdf_pages(result)
-            if actual != expected_pages:
-                logger.warning(
-                    "LibreOffice PDF has %d pages (expected %d). "
-                    "This may indicate font metric differences causing table overflow.",
-                    actual, expected_pages,
-                )
+        if drive_future is not None:
+            # The pool has one worker: drop the Drive job if it hasn't
+            # started, so it doesn't delay later exports or process exit
+            drive_future.cancel()
+        _store_cached_pdf(docx_bytes, engine, result)
+        _check_page_count(engine, result, expected_pages)
         return result
 
     logger.info("Neither Word nor LibreOffice available, falling back to Google Drive.")
 
     # Fallback to Google Drive conversion
     try:
+        if drive_future is not None:
+            return drive_future.result()
         return export_pdf_via_drive(drive_client, docx_bytes, temp_folder_id, temp_name)
     except Exception as e:
         logger.error("Google Drive PDF export also failed: %s", e)
@@ -12,17 +12,58 @@ These PDFs follow a standard internal format with:
 Tables 2-7 share the same row alignment (row 1..N = data, last row = TOTALS).
 """
 
+import functools
+import hashlib
 import logging
+import logging.handlers
+import multiprocessing
+import os
+import pickle
 import re
-from dataclasses import dataclass, field
-from typing import List, Optional
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Tuple
 
-import pdfplumber
+from .utils import atomic_write, evict_lru
 
-logger = logging.getLogger("price_sheet_bot.pdf_parser")
+# pdfplumber (and PyMuPDF, if installed) are imported on first parse: they
+# take hundreds of ms to import, and filename parsing never needs them.
 
+logger = logging.getLogger("price_sheet_bot.pdf_parser")
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10; on 3.9 instances keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_SPACE_TABLE = str.maketrans("", "", " ")
+_EMPTY_PRICES = frozenset(("", "$", "$-", "-"))  # After removing spaces
+_HS_RE = re.compile(r"^\d+[A-Za-z]?$")
+_HS_HEADER_RE = re.compile(r"\bHS\b", re.IGNORECASE)
+_PHASE_RE = re.compile(r"^(.+?)\s+Phase\s+(\S+)$", re.IGNORECASE)
+
+# Release PDF tables are ruled, so cells come from the drawn lines alone.
+# These are pdfplumber's current defaults, pinned so an upgrade can't change
+# how the sheets split; without laparams pdfplumber skips layout analysis.
+_TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 3,
+    "intersection_tolerance": 3,
+}
+
+PARALLEL_PARSE_MIN_PDFS = 4  # fewer PDFs than this are parsed in-process
+PARSE_CHUNKSIZE = 4  # PDFs handed to a worker process at a time
+
+# Parsed PDFs are cached on disk by content hash (every run downloads the
+# release PDFs afresh, so path and mtime never repeat); bump the version
+# whenever a parser change alters what an unchanged PDF parses to
+PARSE_CACHE_DIR = "./cache/pdf_parser"
+PARSE_CACHE_VERSION = 4
+PARSE_CACHE_MAX_BYTES = 20 * 1024 * 1024  # oldest entries are evicted past this
+
+
+@dataclass(**_SLOTS)
 class ReleaseMeta:
     """Metadata from the PDF header row."""
     community: str
@@ -31,7 +72,7 @@ class ReleaseMeta:
     coe: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ReleaseHomesite:
     """A single homesite row extracted from a release PDF."""
     coe_date: str          # Close of escrow date for THIS homesite
@@ -64,7 +105,7 @@ class ReleaseHomesite:
     default_coe: str = ""   # From header, used if row-level COE is blank
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ParsedReleasePDF:
     """Full result of parsing a release PDF."""
     meta: ReleaseMeta
@@ -78,15 +119,12 @@ def _clean_price(raw: str) -> str:
 
     pdfplumber sometimes inserts spaces like '$ 1 ,087,990' or '$ -'
     """
-    if not raw or not raw.strip():
-        return ""
-    s = raw.strip()
-    if s == "$" or s == "$ -" or s == "$-" or s == "-":
+    if not raw:
         return ""
     # Remove ALL spaces between dollar parts, then normalize
-    s = s.replace(" ", "")
+    s = raw.strip().translate(_SPACE_TABLE)
     # Should now be like $1,087,990 or $1,045,990
-    return s
+    return "" if s in _EMPTY_PRICES else s
 
 
 def _safe_get(table: list, row: int, col: int) -> str:
@@ -101,6 +139,21 @@ def _safe_get(table: list, row: int, col: int) -> str:
     return str(val).strip()
 
 
+def _column(table: list, start: int, count: int, col: int, short_col: Optional[int] = None) -> List[str]:
+    """Cells of one column for rows start..start+count-1, stripped.
+
+    Like _safe_get for each row, with "" for missing rows and cells.  Rows
+    too short for col read short_col instead, when given.
+    """
+    cells = []
+    for row in table[start:start + count]:
+        c = short_col if short_col is not None and len(row) <= col else col
+        val = row[c] if c < len(row) else None
+        cells.append("" if val is None else str(val).strip())
+    cells.extend([""] * (count - len(cells)))
+    return cells
+
+
 def _parse_metadata(table0: list) -> Optional[ReleaseMeta]:
     """Parse Table 0 to extract community, phase, release date, COE.
 
@@ -140,6 +193,50 @@ def _is_totals_row(row: list) -> bool:
     return first in ("TOTALS", "TOTAL")
 
 
+# Keywords that identify the companion tables, one bit each
+_KW_OPTION, _KW_INCREASE, _KW_TOTAL, _KW_RELEASED, _KW_NRCC, _KW_NET_PRICE = (1 << i for i in range(6))
+_TABLE_KEYWORDS = (
+    ("OPTION", _KW_OPTION), ("INCREASE", _KW_INCREASE), ("TOTAL", _KW_TOTAL),
+    ("RELEASED", _KW_RELEASED), ("NRCC", _KW_NRCC), ("NET PRICE", _KW_NET_PRICE),
+)
+_KW_ALL = (1 << len(_TABLE_KEYWORDS)) - 1
+
+
+def _find_hs_column(tables: list) -> Optional[Tuple[int, int, int]]:
+    """(table, row, column) of the first "HS" header cell, or None.
+
+    Looks at the first 2 rows of every table after Table 0.
+    """
+    for t_idx in range(1, len(tables)):
+        for r_idx, row in enumerate(tables[t_idx][:2]):
+            for c_idx, cell in enumerate(row):
+                if cell and _HS_HEADER_RE.search(str(cell)):
+                    return t_idx, r_idx, c_idx
+    return None
+
+
+def _table_flags(tbl: list) -> int:
+    """Bitmask of the _TABLE_KEYWORDS found in the first 2 rows of a table.
+
+    Matches as if the cells were joined with spaces, so "NET" and "PRICE" in
+    neighbouring cells still count as "NET PRICE".
+    """
+    flags = 0
+    prev = ""
+    for row in tbl[:2]:
+        for c in row:
+            cell = str(c or "").upper()
+            for word, bit in _TABLE_KEYWORDS:
+                if word in cell:
+                    flags |= bit
+            if prev.endswith("NET") and cell.startswith("PRICE"):
+                flags |= _KW_NET_PRICE
+            if flags == _KW_ALL:
+                return flags
+            prev = cell
+    return flags
+
+
 def _is_valid_homesite(hs: str) -> bool:
     """Check if a homesite value looks like a real homesite number.
 
@@ -148,245 +245,388 @@ def _is_valid_homesite(hs: str) -> bool:
     """
     if not hs:
         return False
-    cleaned = hs.strip()
     # Must be a simple number (digits, maybe with a letter suffix like '10A')
-    return bool(re.match(r"^\d+[A-Za-z]?$", cleaned))
+    return _HS_RE.match(hs.strip()) is not None
 
 
-def parse_release_pdf(pdf_path: str) -> ParsedReleasePDF:
+def parse_release_pdf(pdf_path: str, use_pymupdf: bool = False) -> ParsedReleasePDF:
     """Parse a New Release PDF and extract all homesite data rows.
 
     Args:
         pdf_path: Local path to the downloaded PDF file.
+        use_pymupdf: Extract the tables with PyMuPDF when it is installed
+            (pdf.use_pymupdf), falling back to pdfplumber.
 
     Returns:
         ParsedReleasePDF with metadata, list of homesites, and any errors.
     """
-    errors = []
-    filename = pdf_path.rsplit("\\", 1)[-1].rsplit("/", 1)[-1]
+    extractor = "pymupdf" if use_pymupdf and _import_pymupdf() is not None else "pdfplumber"
+    try:
+        with open(pdf_path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return _parse_release_pdf(pdf_path, extractor)  # Reports the open failure
+    return _parse_release_pdf_cached((PARSE_CACHE_VERSION, extractor, digest), pdf_path)
+
+
+# ── Parse cache ──
 
+def _parse_cache_file(key: tuple) -> str:
+    _, extractor, digest = key
+    return os.path.join(PARSE_CACHE_DIR, f"{digest}.{extractor}.pkl")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_release_pdf_cached(key: tuple, pdf_path: str) -> ParsedReleasePDF:
+    """parse_release_pdf for known content: memory, then disk, then parse."""
+    cache_file = _parse_cache_file(key)
     try:
-        pdf = pdfplumber.open(pdf_path)
-    except Exception as e:
-        return ParsedReleasePDF(
-            meta=ReleaseMeta("", "", "", ""),
-            homesites=[],
-            filename=filename,
-            errors=[f"Failed to open PDF: {e}"],
-        )
+        with open(cache_file, "rb") as f:
+            cached_key, parsed = pickle.load(f)
+        if cached_key == key and isinstance(parsed, ParsedReleasePDF):
+            os.utime(cache_file)  # Mark as recently used
+            # The same bytes may have been parsed under another name
+            parsed = replace(parsed, filename=_pdf_filename(pdf_path))
+            logger.info("Parsed PDF served from cache: %s", parsed.filename)
+            return parsed
+    except Exception:
+        pass
+
+    parsed = _parse_release_pdf(pdf_path, key[1])
+    if parsed.errors and parsed.errors[0].startswith("Failed to open PDF"):
+        return parsed  # May be transient; don't remember it
 
     try:
-        page = pdf.pages[0]
-        tables = page.extract_tables()
+        atomic_write(cache_file, pickle.dumps((key, parsed), protocol=pickle.HIGHEST_PROTOCOL))
+        evict_lru(PARSE_CACHE_DIR, ".pkl", PARSE_CACHE_MAX_BYTES)
+    except OSError:
+        pass
+    return parsed
 
-        if len(tables) < 3:
+
+def clear_pdf_cache():
+    """Forget every cached parse, in memory and on disk."""
+    _parse_release_pdf_cached.cache_clear()
+    try:
+        entries = list(os.scandir(PARSE_CACHE_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name.endswith(".pkl"):
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def _pdf_filename(pdf_path: str) -> str:
+    """The file name part of a Windows or POSIX path."""
+    return pdf_path.rsplit("\\", 1)[-1].rsplit("/", 1)[-1]
+
+
+def _parse_release_pdf(pdf_path: str, extractor: str = "pdfplumber") -> ParsedReleasePDF:
+    """parse_release_pdf without the cache."""
+    filename = _pdf_filename(pdf_path)
+
+    tables = None
+    if extractor == "pymupdf":
+        tables = _extract_tables_pymupdf(_import_pymupdf(), pdf_path)
+    if tables is None:
+        import pdfplumber  # Slow to import; see the note at the top
+        try:
+            # Only page 1 holds the tables; don't set up the others
+            pdf = pdfplumber.open(pdf_path, pages=[1], laparams=None)
+        except Exception as e:
             return ParsedReleasePDF(
                 meta=ReleaseMeta("", "", "", ""),
                 homesites=[],
                 filename=filename,
-                errors=[f"Expected at least 3 tables, found {len(tables)}"],
+                errors=[f"Failed to open PDF: {e}"],
             )
+        try:
+            tables = pdf.pages[0].extract_tables(table_settings=_TABLE_SETTINGS)
+        finally:
+            pdf.close()
 
-        # ── Parse metadata from Table 0 ──
-        meta = _parse_metadata(tables[0])
-        if not meta:
-            errors.append("Could not parse metadata from Table 0")
-            meta = ReleaseMeta("", "", "", "")
+    return _parse_tables(tables, filename)
 
-        logger.info(
-            "PDF metadata: community=%s phase=%s release_date=%s coe=%s",
-            meta.community, meta.phase, meta.release_date, meta.coe,
+
+@functools.lru_cache(maxsize=None)
+def _import_pymupdf():
+    """The optional PyMuPDF module (C table extraction, much faster than pdfminer), or None."""
+    try:
+        import fitz
+    except ImportError:
+        return None
+    return fitz
+
+
+def _extract_tables_pymupdf(fitz, pdf_path: str) -> Optional[list]:
+    """Tables on page 1 via PyMuPDF, as pdfplumber-shaped cell grids.
+
+    None when PyMuPDF can't open the file or finds too few tables, so the
+    caller falls back to pdfplumber.
+    """
+    try:
+        doc = fitz.open(pdf_path)
+    except Exception as e:
+        logger.debug("PyMuPDF could not open %s: %s", pdf_path, e)
+        return None
+    try:
+        tables = [t.extract() for t in doc[0].find_tables().tables]
+    except Exception as e:
+        logger.debug("PyMuPDF table extraction failed for %s: %s", pdf_path, e)
+        return None
+    finally:
+        doc.close()
+    return tables if len(tables) >= 3 else None
+
+
+def _parse_tables(tables: list, filename: str) -> ParsedReleasePDF:
+    """Build the ParsedReleasePDF from the tables on a release PDF's first page."""
+    errors = []
+    if len(tables) < 3:
+        return ParsedReleasePDF(
+            meta=ReleaseMeta("", "", "", ""),
+            homesites=[],
+            filename=filename,
+            errors=[f"Expected at least 3 tables, found {len(tables)}"],
         )
 
-        # ── Find the core homesite table (the one with HS # column) ──
-        # Some PDFs have core data in Table 1 (merged with premiums),
-        # others have it in Table 2.  Detect by looking for "HS" header.
-        core_table_idx = None
-        core_header_row = None
-        hs_col = 1  # default column for homesite number
-        for t_idx in range(1, len(tables)):
-            tbl = tables[t_idx]
-            # Check first 2 rows for a header containing "HS"
-            for r_idx in range(min(2, len(tbl))):
-                row = tbl[r_idx]
-                for c_idx, cell in enumerate(row):
-                    if cell and re.search(r"\bHS\b", str(cell), re.IGNORECASE):
-                        core_table_idx = t_idx
-                        core_header_row = r_idx
-                        hs_col = c_idx
-                        break
-                if core_table_idx is not None:
-                    break
-            if core_table_idx is not None:
-                break
-
-        if core_table_idx is None:
-            # Fallback: assume Table 2 like before
-            logger.warning("Could not find HS# header; falling back to Table 2")
-            core_table_idx = 2
-            core_header_row = 0
-            hs_col = 1
-
-        core_table = tables[core_table_idx] if len(tables) > core_table_idx else []
-        if not core_table or len(core_table) < 2:
-            return ParsedReleasePDF(
-                meta=meta, homesites=[], filename=filename,
-                errors=errors + [f"Core table (table {core_table_idx}) is empty or too small"],
-            )
+    # ── Parse metadata from Table 0 ──
+    meta = _parse_metadata(tables[0])
+    if not meta:
+        errors.append("Could not parse metadata from Table 0")
+        meta = ReleaseMeta("", "", "", "")
+
+    logger.info(
+        "PDF metadata: community=%s phase=%s release_date=%s coe=%s",
+        meta.community, meta.phase, meta.release_date, meta.coe,
+    )
+
+    # ── Find the core homesite table (the one with HS # column) ──
+    # Some PDFs have core data in Table 1 (merged with premiums),
+    # others have it in Table 2.  Detect by looking for "HS" header.
+    found = _find_hs_column(tables)
+    if found:
+        core_table_idx, core_header_row, hs_col = found
+    else:
+        # Fallback: assume Table 2 like before
+        logger.warning("Could not find HS# header; falling back to Table 2")
+        core_table_idx, core_header_row, hs_col = 2, 0, 1
+
+    core_table = tables[core_table_idx] if len(tables) > core_table_idx else []
+    if not core_table or len(core_table) < 2:
+        return ParsedReleasePDF(
+            meta=meta, homesites=[], filename=filename,
+            errors=errors + [f"Core table (table {core_table_idx}) is empty or too small"],
+        )
 
-        logger.info(
-            "Core homesite table: table[%d], header row %d, HS# in col %d",
-            core_table_idx, core_header_row, hs_col,
+    logger.info(
+        "Core homesite table: table[%d], header row %d, HS# in col %d",
+        core_table_idx, core_header_row, hs_col,
+    )
+
+    # Detect column layout from the header row
+    header = core_table[core_header_row]
+    coe_idx = hs_idx = plan_idx = elev_idx = base_idx = None  # Column indices
+    for c_idx, cell in enumerate(header):
+        if not cell:
+            continue
+        cell_upper = str(cell).strip().upper()
+        if "COE" in cell_upper:
+            coe_idx = c_idx
+        elif cell_upper in ("HS #", "HS", "HS#"):
+            hs_idx = c_idx
+        elif cell_upper in ("PLAN", "PLAN #"):
+            plan_idx = c_idx
+        elif "ELEV" in cell_upper:
+            elev_idx = c_idx
+        elif "BASE" in cell_upper:
+            base_idx = c_idx
+    # Ensure defaults if not found
+    coe_idx = 0 if coe_idx is None else coe_idx
+    hs_idx = hs_col if hs_idx is None else hs_idx
+    plan_idx = 2 if plan_idx is None else plan_idx
+    elev_idx = 3 if elev_idx is None else elev_idx
+    base_idx = 4 if base_idx is None else base_idx
+
+    # Determine data rows (after header, before TOTALS)
+    data_rows = []
+    for r_idx in range(core_header_row + 1, len(core_table)):
+        if _is_totals_row(core_table[r_idx]):
+            break
+        # Skip completely empty rows
+        row_vals = [str(c or "").strip() for c in core_table[r_idx]]
+        if not any(row_vals):
+            break
+        data_rows.append(r_idx)
+
+    num_data = len(data_rows)
+    if num_data == 0:
+        return ParsedReleasePDF(
+            meta=meta, homesites=[], filename=filename,
+            errors=errors + ["No data rows found in core table"],
         )
 
-        # Detect column layout from the header row
-        header = core_table[core_header_row]
-        col_map = {}  # Maps logical name -> column index
-        for c_idx, cell in enumerate(header):
-            if not cell:
-                continue
-            cell_upper = str(cell).strip().upper()
-            if "COE" in cell_upper:
-                col_map["coe"] = c_idx
-            elif cell_upper in ("HS #", "HS", "HS#"):
-                col_map["hs"] = c_idx
-            elif cell_upper in ("PLAN", "PLAN #"):
-                col_map["plan"] = c_idx
-            elif "ELEV" in cell_upper:
-                col_map["elev"] = c_idx
-            elif "BASE" in cell_upper:
-                col_map["base"] = c_idx
-        # Ensure defaults if not found
-        col_map.setdefault("coe", 0)
-        col_map.setdefault("hs", hs_col)
-        col_map.setdefault("plan", 2)
-        col_map.setdefault("elev", 3)
-        col_map.setdefault("base", 4)
-
-        # Determine data rows (after header, before TOTALS)
-        data_rows = []
-        for r_idx in range(core_header_row + 1, len(core_table)):
-            if _is_totals_row(core_table[r_idx]):
-                break
-            # Skip completely empty rows
-            row_vals = [str(c or "").strip() for c in core_table[r_idx]]
-            if not any(row_vals):
-                break
-            data_rows.append(r_idx)
-
-        num_data = len(data_rows)
-        if num_data == 0:
-            return ParsedReleasePDF(
-                meta=meta, homesites=[], filename=filename,
-                errors=errors + ["No data rows found in core table"],
-            )
+    logger.info("Found %d homesite data rows in PDF.", num_data)
 
-        logger.info("Found %d homesite data rows in PDF.", num_data)
-
-        # ── Identify remaining tables by header keywords ──
-        # After the core table, locate Options, Released Price, NRCC, Net Price
-        options_table = []
-        released_table = []
-        nrcc_table = []
-        net_table = []
-
-        for t_idx in range(len(tables)):
-            if t_idx == 0 or t_idx == core_table_idx:
-                continue
-            tbl = tables[t_idx]
-            if not tbl or not tbl[0]:
-                continue
-            # Check first 2 rows for identifying keywords
-            header_text = " ".join(str(c or "") for row in tbl[:2] for c in row).upper()
-            if "OPTION" in header_text and "INCREASE" in header_text and not options_table:
-                options_table = tbl
-            elif "TOTAL" in header_text and "RELEASED" in header_text and not released_table:
-                released_table = tbl
-            elif "NRCC" in header_text and not nrcc_table:
-                nrcc_table = tbl
-            elif "NET PRICE" in header_text and not net_table:
-                net_table = tbl
-
-        # The row offset for companion tables: they share the same row alignment
-        # Data starts after their own header rows.  We'll map by data row index.
-        def _companion_data_start(tbl):
-            """Find the first data row in a companion table (after its header)."""
-            for r in range(min(2, len(tbl))):
-                # If a row has a dollar value, that's data
-                for c in tbl[r]:
-                    if c and "$" in str(c):
-                        return r
-            return 1  # default: row 1
-
-        opt_start = _companion_data_start(options_table) if options_table else 1
-        rel_start = _companion_data_start(released_table) if released_table else 1
-        nrcc_start = _companion_data_start(nrcc_table) if nrcc_table else 1
-        net_start = _companion_data_start(net_table) if net_table else 1
-
-        # ── Build homesite objects ──
-        homesites = []
-        for i, r_idx in enumerate(data_rows):
-            # Map companion table row index from data row order
-            opt_r = opt_start + i
-            rel_r = rel_start + i
-            nrcc_r = nrcc_start + i
-            net_r = net_start + i
-
-            hs = ReleaseHomesite(
-                coe_date=_safe_get(core_table, r_idx, col_map["coe"]),
-                homesite=_safe_get(core_table, r_idx, col_map["hs"]),
-                plan=_safe_get(core_table, r_idx, col_map["plan"]),
-                plan_elev=_safe_get(core_table, r_idx, col_map["elev"]),
-                base_price=_clean_price(_safe_get(core_table, r_idx, col_map["base"])),
-                # Options
-                price_adj_increase=_clean_price(_safe_get(options_table, opt_r, 0)),
-                option_1=_clean_price(_safe_get(options_table, opt_r, 1)),
-                option_2=_clean_price(_safe_get(options_table, opt_r, 2)),
-                option_total=_clean_price(_safe_get(options_table, opt_r, 3)),
-                # Total Released Price
-                total_released_price=_clean_price(_safe_get(released_table, rel_r, 0)),
-                # NRCC and Price Change
-                nrcc=_clean_price(_safe_get(nrcc_table, nrcc_r, 0)),
-                total_price_change=_clean_price(
-                    _safe_get(nrcc_table, nrcc_r, 2)
-                    if len(nrcc_table) > nrcc_r and len(nrcc_table[nrcc_r]) > 2
-                    else _safe_get(nrcc_table, nrcc_r, 1)
-                ),
-                # Net Price
-                net_price=_clean_price(_safe_get(net_table, net_r, 0)),
-                # Metadata
-                community=meta.community,
-                phase=meta.phase,
-                release_date=meta.release_date,
-                default_coe=meta.coe,
-            )
+    # ── Identify remaining tables by header keywords ──
+    # After the core table, locate Options, Released Price, NRCC, Net Price
+    options_table = []
+    released_table = []
+    nrcc_table = []
+    net_table = []
 
-            # Validate: must have a real numeric homesite and a plan
-            if not hs.homesite or not hs.plan:
-                errors.append(f"Data row {r_idx}: missing homesite or plan, skipping")
-                continue
-            if not _is_valid_homesite(hs.homesite):
-                logger.warning(
-                    "Data row %d: homesite '%s' is not a valid number, skipping (likely PDF footer/summary data)",
-                    r_idx, hs.homesite,
-                )
-                continue
-
-            homesites.append(hs)
-            logger.info(
-                "  HS %s: plan=%s elev=%s base=%s net=%s",
-                hs.homesite, hs.plan, hs.plan_elev, hs.base_price, hs.net_price,
+    for t_idx in range(len(tables)):
+        if t_idx == 0 or t_idx == core_table_idx:
+            continue
+        tbl = tables[t_idx]
+        if not tbl or not tbl[0]:
+            continue
+        # Check first 2 rows for identifying keywords
+        flags = _table_flags(tbl)
+        if flags & _KW_OPTION and flags & _KW_INCREASE and not options_table:
+            options_table = tbl
+        elif flags & _KW_TOTAL and flags & _KW_RELEASED and not released_table:
+            released_table = tbl
+        elif flags & _KW_NRCC and not nrcc_table:
+            nrcc_table = tbl
+        elif flags & _KW_NET_PRICE and not net_table:
+            net_table = tbl
+
+    # The row offset for companion tables: they share the same row alignment
+    # Data starts after their own header rows.  We'll map by data row index.
+    def _companion_data_start(tbl):
+        """Find the first data row in a companion table (after its header)."""
+        for r in range(min(2, len(tbl))):
+            # If a row has a dollar value, that's data
+            for c in tbl[r]:
+                if c and "$" in str(c):
+                    return r
+        return 1  # default: row 1
+
+    opt_start = _companion_data_start(options_table) if options_table else 1
+    rel_start = _companion_data_start(released_table) if released_table else 1
+    nrcc_start = _companion_data_start(nrcc_table) if nrcc_table else 1
+    net_start = _companion_data_start(net_table) if net_table else 1
+
+    # ── Slice every table into aligned columns, one entry per data row ──
+    core_start = data_rows[0]
+
+    def _core(col):
+        return _column(core_table, core_start, num_data, col)
+
+    def _cells(tbl, start, col, short_col=None):
+        return _column(tbl, start, num_data, col, short_col)
+
+    columns = zip(
+        data_rows, _core(coe_idx), _core(hs_idx), _core(plan_idx), _core(elev_idx),
+        _core(base_idx),
+        # Options
+        _cells(options_table, opt_start, 0), _cells(options_table, opt_start, 1),
+        _cells(options_table, opt_start, 2), _cells(options_table, opt_start, 3),
+        # Total Released Price
+        _cells(released_table, rel_start, 0),
+        # NRCC and Price Change (column 2, or 1 in two-column tables)
+        _cells(nrcc_table, nrcc_start, 0), _cells(nrcc_table, nrcc_start, 2, short_col=1),
+        # Net Price
+        _cells(net_table, net_start, 0),
+    )
+
+    # ── Build homesite objects ──
+    homesites = []
+    for (r_idx, coe, homesite, plan, elev, base, adj, opt1, opt2, opt_total,
+         released, nrcc, change, net) in columns:
+        # Validate first, so skipped rows never have their prices cleaned:
+        # must have a real numeric homesite and a plan
+        if not homesite or not plan:
+            errors.append(f"Data row {r_idx}: missing homesite or plan, skipping")
+            continue
+        if not _is_valid_homesite(homesite):
+            logger.warning(
+                "Data row %d: homesite '%s' is not a valid number, skipping (likely PDF footer/summary data)",
+                r_idx, homesite,
             )
+            continue
 
-        return ParsedReleasePDF(
-            meta=meta,
-            homesites=homesites,
-            filename=filename,
-            errors=errors,
+        hs = ReleaseHomesite(
+            coe_date=coe,
+            homesite=homesite,
+            plan=plan,
+            plan_elev=elev,
+            base_price=_clean_price(base),
+            price_adj_increase=_clean_price(adj),
+            option_1=_clean_price(opt1),
+            option_2=_clean_price(opt2),
+            option_total=_clean_price(opt_total),
+            total_released_price=_clean_price(released),
+            nrcc=_clean_price(nrcc),
+            total_price_change=_clean_price(change),
+            net_price=_clean_price(net),
+            # Metadata
+            community=meta.community,
+            phase=meta.phase,
+            release_date=meta.release_date,
+            default_coe=meta.coe,
+        )
+        homesites.append(hs)
+        logger.info(
+            "  HS %s: plan=%s elev=%s base=%s net=%s",
+            hs.homesite, hs.plan, hs.plan_elev, hs.base_price, hs.net_price,
         )
 
+    return ParsedReleasePDF(
+        meta=meta,
+        homesites=homesites,
+        filename=filename,
+        errors=errors,
+    )
+
+
+def parse_release_pdfs(pdf_paths: List[str], use_pymupdf: bool = False) -> List[ParsedReleasePDF]:
+    """Parse several release PDFs, in the order given.
+
+    pdfminer is CPU-bound, so batches of PARALLEL_PARSE_MIN_PDFS or more are
+    spread over worker processes; smaller ones aren't worth the start-up.
+    Workers are spawned rather than forked (the parent has threads running)
+    and send their log records back to this process's handlers.
+    """
+    parse = functools.partial(parse_release_pdf, use_pymupdf=use_pymupdf)
+    workers = min(os.cpu_count() or 1, len(pdf_paths))
+    if len(pdf_paths) < PARALLEL_PARSE_MIN_PDFS or workers < 2:
+        return [parse(p) for p in pdf_paths]
+
+    chunksize = max(1, min(PARSE_CHUNKSIZE, len(pdf_paths) // workers))
+    ctx = multiprocessing.get_context("spawn")
+    log_queue = ctx.Queue()
+    listener = logging.handlers.QueueListener(log_queue, _RelayToLogger())
+    listener.start()
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                 initializer=_init_parse_worker,
+                                 initargs=(log_queue, logger.getEffectiveLevel())) as executor:
+            return list(executor.map(parse, pdf_paths, chunksize=chunksize))
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning("Parallel PDF parsing failed (%s); parsing serially", e)
+        return [parse(p) for p in pdf_paths]
     finally:
-        pdf.close()
+        listener.stop()  # Handles whatever the workers logged last
+        log_queue.close()
+
+
+class _RelayToLogger(logging.Handler):
+    """Hands records from worker processes to the same-named logger here."""
+
+    def emit(self, record):
+        logging.getLogger(record.name).handle(record)
+
+
+def _init_parse_worker(log_queue, level: int):
+    """Worker process setup: send price_sheet_bot log records to the parent."""
+    root = logging.getLogger("price_sheet_bot")
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
 
 
 def parse_release_filename(filename: str) -> Optional[dict]:
@@ -410,7 +650,7 @@ def parse_release_filename(filename: str) -> Optional[dict]:
 
     # Try "Community Phase XX" pattern (most common for release PDFs)
     # Phase part is typically like: 2D, 3A, 1B, etc. (number + optional letter(s))
-    m = re.match(r"^(.+?)\s+Phase\s+(\S+)$", name, re.IGNORECASE)
+    m = _PHASE_RE.match(name)
     if m:
         return {
             "community": m.group(1).strip(),
@@ -16,7 +16,10 @@ import json
 import logging
 import os
 import platform
+import sqlite3
+import threading
 import time
+from concurrent.futures import Future
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, List
@@ -24,13 +27,14 @@ from typing import Optional, List
 from .config import Config
 from .sheets import SheetsClient
 from .drive_client import DriveClient
-from .control_parser import parse_control_tab, find_control_row, ControlRow
-from .mapping_parser import parse_mapping_tab, find_mapping_row
-from .docx_writer import write_to_template
-from .pdf_export import export_to_pdf
+from .drive_cache import DriveCache
+from .control_parser import parse_control_tab, find_control_row, build_control_index, ControlRow
+from .mapping_parser import build_mapping_index, parse_mapping_tab, find_mapping_row
+from .docx_writer import write_many_to_template, write_to_template
+from .pdf_export import export_to_pdf, warmup as pdf_warmup
 from .sop_resolver import resolve_address
 from .locator import find_table_by_invisible_code, scan_template_for_markers
-from .pdf_parser import parse_release_pdf, parse_release_filename, ReleaseHomesite
+from .pdf_parser import parse_release_pdf, parse_release_pdfs, parse_release_filename, ReleaseHomesite
 from .utils import (
     parse_pdf_filename, compute_hash, normalize_for_compare,
     format_price, parse_ready_by,
@@ -41,6 +45,15 @@ from .agent_sync import AgentSync
 logger = logging.getLogger("price_sheet_bot.runner")
 
 
+# ── Drive Client ──
+
+def _new_drive_client(cfg: Config) -> DriveClient:
+    """DriveClient for cfg, backed by the on-disk metadata cache if enabled."""
+    cache = DriveCache(cfg.drive.metadata_cache_file) if cfg.drive.use_metadata_cache else None
+    return DriveClient(cfg.google.credentials_json_path, cfg.drive.shared_drive_id,
+                       metadata_cache=cache)
+
+
 # ── Write Lock ──
 
 LOCK_FILE = "./cache/.process_lock"
@@ -89,17 +102,58 @@ def release_lock():
 
 # ── Processed Manifest ──
 
+# Manifest paths with these suffixes are stored in SQLite (one row per
+# entry, only changed rows rewritten); anything else is a JSON file.
+SQLITE_MANIFEST_SUFFIXES = (".sqlite", ".sqlite3", ".db")
+
+
+def _is_sqlite_manifest(path: str) -> bool:
+    return path.lower().endswith(SQLITE_MANIFEST_SUFFIXES)
+
+
+def _open_manifest_db(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS manifest (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+    )
+    return conn
+
+
 def load_manifest(path: str) -> dict:
     """Load the processed manifest from disk."""
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+    if not os.path.exists(path):
+        return {}
+    if _is_sqlite_manifest(path):
+        conn = _open_manifest_db(path)
+        try:
+            return {k: json.loads(v) for k, v in conn.execute("SELECT key, value FROM manifest")}
+        finally:
+            conn.close()
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
 
 
 def save_manifest(path: str, manifest: dict):
     """Save the processed manifest to disk."""
     os.makedirs(os.path.dirname(path), exist_ok=True)
+    if _is_sqlite_manifest(path):
+        conn = _open_manifest_db(path)
+        try:
+            stored = dict(conn.execute("SELECT key, value FROM manifest"))
+            current = {k: json.dumps(v, default=str, sort_keys=True) for k, v in manifest.items()}
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO manifest (key, value) VALUES (?, ?)",
+                    [(k, v) for k, v in current.items() if stored.get(k) != v],
+                )
+                conn.executemany(
+                    "DELETE FROM manifest WHERE key = ?",
+                    [(k,) for k in stored if k not in current],
+                )
+        finally:
+            conn.close()
+        return
     with open(path, "w", encoding="utf-8") as f:
         json.dump(manifest, f, indent=2, default=str)
 
@@ -162,8 +216,7 @@ def quarantine_pdf(drive_client: DriveClient, pdf_file: dict,
     """Move a PDF to the quarantine subfolder with a reason tag."""
     q_folder_id = drive_client.ensure_subfolder(final_folder_id, quarantine_folder_name)
     try:
-        drive_client.move_file(pdf_file["id"], q_folder_id)
-        drive_client.set_app_properties(pdf_file["id"], {
+        drive_client.rename_and_move(pdf_file["id"], pdf_file["name"], q_folder_id, app_properties={
             "quarantined": "true",
             "quarantine_reason": reason,
             "quarantined_at": datetime.now(timezone.utc).isoformat(),
@@ -177,7 +230,7 @@ def quarantine_pdf(drive_client: DriveClient, pdf_file: dict,
 
 def _build_control_row_from_pdf(
     hs: ReleaseHomesite,
-    control_rows: list,
+    control_rows,
     drive_client: DriveClient = None,
     sop_folder_id: str = None,
 ) -> ControlRow:
@@ -288,7 +341,7 @@ def process_release_pdf(
         return result
 
     # Step 2: Parse the PDF content
-    parsed_pdf = parse_release_pdf(local_pdf_path)
+    parsed_pdf = parse_release_pdf(local_pdf_path, use_pymupdf=cfg.pdf.use_pymupdf)
 
     if parsed_pdf.errors:
         for err in parsed_pdf.errors:
@@ -326,9 +379,11 @@ def process_release_pdf(
     #   Key: (template_file_name) -> list of (homesite, mapping_row)
     template_groups = {}
     errors_per_hs = []
+    control_index = build_control_index(control_rows)
+    mapping_index = build_mapping_index(mapping_rows)
 
     for hs in homesites:
-        mrow = find_mapping_row(mapping_rows, community, hs.plan)
+        mrow = find_mapping_row(mapping_index, community, hs.plan)
         if not mrow:
             msg = f"No MAPPING row for ({community}, {hs.plan}) - HS #{hs.homesite} skipped"
             logger.warning(msg)
@@ -391,39 +446,41 @@ def process_release_pdf(
         with open(cache_path, "rb") as f:
             template_bytes = f.read()
 
-        # Write each homesite row into the template sequentially
-        current_bytes = template_bytes
-        write_actions = []
-
-        for hs in hs_list:
+        # Write every homesite row into the template in one batch
+        # (one DOCX parse + one save instead of one per row)
+        row_batch = [
             # Build a ControlRow from PDF data (+ optional CONTROL supplement)
-            control_row = _build_control_row_from_pdf(
-                hs, control_rows,
+            _build_control_row_from_pdf(
+                hs, control_index,
                 drive_client=drive_client,
                 sop_folder_id=cfg.drive.sop_folder_id,
             )
+            for hs in hs_list
+        ]
+
+        overwrite = overwrite_existing_override or cfg.app.overwrite_existing
+        modified_bytes, write_results = write_many_to_template(
+            doc_bytes=template_bytes,
+            table_match_info={"table_index": -1, "invisible_code": mrow.invisible_code},
+            control_rows=row_batch,
+            overwrite_existing=overwrite,
+            update_only_blank_cells=cfg.app.update_only_blank_cells,
+            allow_price_update=cfg.app.allow_price_update_when_filling_blanks,
+            strict_mode=cfg.app.strict_mode,
+            remove_invisible_code=False,  # Removed below, with its own error handling
+            header_row_1based=mrow.header_row,
+        )
+        current_bytes = modified_bytes if modified_bytes is not None else template_bytes
+        write_actions = []
 
-            overwrite = overwrite_existing_override or cfg.app.overwrite_existing
-            modified_bytes, write_result = write_to_template(
-                doc_bytes=current_bytes,
-                table_match_info={"table_index": -1, "invisible_code": mrow.invisible_code},
-                control_row=control_row,
-                overwrite_existing=overwrite,
-                update_only_blank_cells=cfg.app.update_only_blank_cells,
-                allow_price_update=cfg.app.allow_price_update_when_filling_blanks,
-                strict_mode=cfg.app.strict_mode,
-                remove_invisible_code=False,  # Don't remove yet - more rows to write
-                header_row_1based=mrow.header_row,
-            )
-
-            if modified_bytes is None:
+        for hs, control_row, write_result in zip(hs_list, row_batch, write_results):
+            if write_result.error:
                 msg = f"DOCX write failed for HS #{hs.homesite}: {write_result.error}"
                 logger.error(msg)
                 errors_per_hs.append({"homesite": hs.homesite, "plan": hs.plan, "error": msg})
                 error_count += 1
                 continue
 
-            current_bytes = modified_bytes
             write_actions.append({
                 "homesite": hs.homesite,
                 "plan": hs.plan,
@@ -479,6 +536,8 @@ def process_release_pdf(
                 drive_client, current_bytes,
                 cfg.drive.final_price_sheets_folder_id,
                 temp_name=f"_temp_{base_name}",
+                speculate_drive=cfg.pdf.speculative_drive_export,
+                race=cfg.pdf.race_export_engines,
             )
         except Exception as e:
             logger.error("PDF export failed for '%s': %s", template_name, e)
@@ -490,13 +549,9 @@ def process_release_pdf(
         # Upload DOCX + PDF with safe replace
         final_folder = cfg.drive.final_price_sheets_folder_id
         try:
-            docx_result = drive_client.safe_replace(
-                current_bytes, final_folder, docx_output_name,
-                allow_deletions=cfg.drive.allow_deletions,
-            )
-            pdf_result_file = drive_client.safe_replace(
-                output_pdf_bytes, final_folder, pdf_output_name,
-                allow_deletions=cfg.drive.allow_deletions,
+            docx_result, pdf_result_file = drive_client.safe_replace_many(
+                [(current_bytes, docx_output_name), (output_pdf_bytes, pdf_output_name)],
+                final_folder, allow_deletions=cfg.drive.allow_deletions,
             )
 
             all_output_ids[template_name] = {
@@ -732,16 +787,14 @@ def process_single_pdf(
         drive_client, modified_bytes,
         cfg.drive.final_price_sheets_folder_id,
         temp_name=f"_temp_{base_name}",
+        speculate_drive=cfg.pdf.speculative_drive_export,
+        race=cfg.pdf.race_export_engines,
     )
 
     final_folder = cfg.drive.final_price_sheets_folder_id
-    docx_result = drive_client.safe_replace(
-        modified_bytes, final_folder, docx_output_name,
-        allow_deletions=cfg.drive.allow_deletions,
-    )
-    pdf_result_file = drive_client.safe_replace(
-        pdf_bytes, final_folder, pdf_output_name,
-        allow_deletions=cfg.drive.allow_deletions,
+    docx_result, pdf_result_file = drive_client.safe_replace_many(
+        [(modified_bytes, docx_output_name), (pdf_bytes, pdf_output_name)],
+        final_folder, allow_deletions=cfg.drive.allow_deletions,
     )
 
     result["output_ids"] = {
@@ -815,7 +868,7 @@ def run_process_new_releases(
         # Connect
         sheets = SheetsClient(cfg.google.credentials_json_path, cfg.google.spreadsheet_id)
         sheets.connect()
-        drive = DriveClient(cfg.google.credentials_json_path, cfg.drive.shared_drive_id)
+        drive = _new_drive_client(cfg)
         drive.connect()
         drive.connect_for_writes()  # OAuth2 for uploads
 
@@ -961,8 +1014,9 @@ def sync_control_to_templates(
             file_groups[fname][ic] = {"mapping_row": mrow, "control_rows": []}
 
     # Then, add CONTROL rows to the appropriate groups
+    mapping_index = build_mapping_index(mapping_rows)
     for crow in control_rows:
-        mrow = find_mapping_row(mapping_rows, crow.community, crow.floorplan)
+        mrow = find_mapping_row(mapping_index, crow.community, crow.floorplan)
         if not mrow:
             continue
 
@@ -1157,9 +1211,9 @@ def sync_control_to_templates(
             current_bytes = f.read()
 
         # Get the template's expected PDF page count for validation
-        from .pdf_export import _count_pdf_pages, export_pdf_via_word, export_pdf_via_libreoffice
+        from .pdf_export import count_pdf_pages, export_pdf_via_word, export_pdf_via_libreoffice
         _ref_pdf = export_pdf_via_word(current_bytes) or export_pdf_via_libreoffice(current_bytes)
-        _expected_pages = _count_pdf_pages(_ref_pdf) if _ref_pdf else 0
+        _expected_pages = count_pdf_pages(_ref_pdf) if _ref_pdf else 0
         if _expected_pages > 0:
             logger.info("Template '%s' reference PDF has %d page(s).", template_name, _expected_pages)
 
@@ -1176,20 +1230,20 @@ def sync_control_to_templates(
             mrow = fp_data["mapping_row"]
             crow_list = fp_data["control_rows"]
 
-            for crow in crow_list:
-                modified_bytes, write_result = write_to_template(
-                    doc_bytes=current_bytes,
-                    table_match_info={"table_index": -1, "invisible_code": ic},
-                    control_row=crow,
-                    overwrite_existing=True,
-                    update_only_blank_cells=False,
-                    allow_price_update=True,
-                    strict_mode=False,
-                    remove_invisible_code=False,  # Keep codes for next floorplan
-                    header_row_1based=mrow.header_row,
-                )
+            modified_bytes, write_results = write_many_to_template(
+                doc_bytes=current_bytes,
+                table_match_info={"table_index": -1, "invisible_code": ic},
+                control_rows=crow_list,
+                overwrite_existing=True,
+                update_only_blank_cells=False,
+                allow_price_update=True,
+                strict_mode=False,
+                remove_invisible_code=False,  # Keep codes for next floorplan
+                header_row_1based=mrow.header_row,
+            )
 
-                if modified_bytes is None:
+            for crow, write_result in zip(crow_list, write_results):
+                if write_result.error:
                     logger.warning(
                         "Sheet->template sync: write failed for HS#%s (%s/%s) in '%s': %s",
                         crow.homesite, crow.community, crow.floorplan,
@@ -1197,9 +1251,10 @@ def sync_control_to_templates(
                     )
                     result["errors"] += 1
                     continue
+                rows_written += 1
 
+            if modified_bytes is not None:
                 current_bytes = modified_bytes
-                rows_written += 1
 
         if rows_written == 0 and not deletion_detected:
             continue
@@ -1219,16 +1274,14 @@ def sync_control_to_templates(
                 cfg.drive.final_price_sheets_folder_id,
                 temp_name=f"_sync_{base_name}",
                 expected_pages=_expected_pages,
+                speculate_drive=cfg.pdf.speculative_drive_export,
+                race=cfg.pdf.race_export_engines,
             )
 
             final_folder = cfg.drive.final_price_sheets_folder_id
-            drive_client.safe_replace(
-                current_bytes, final_folder, f"{base_name}.docx",
-                allow_deletions=cfg.drive.allow_deletions,
-            )
-            drive_client.safe_replace(
-                output_pdf_bytes, final_folder, f"{base_name}.pdf",
-                allow_deletions=cfg.drive.allow_deletions,
+            drive_client.safe_replace_many(
+                [(current_bytes, f"{base_name}.docx"), (output_pdf_bytes, f"{base_name}.pdf")],
+                final_folder, allow_deletions=cfg.drive.allow_deletions,
             )
 
             result["templates_updated"] += 1
@@ -1298,9 +1351,12 @@ def run_master(
         return
 
     # ── Connect everything ──
+    # LibreOffice starts up while steps 2-4 talk to Google
+    threading.Thread(target=pdf_warmup, name="lo-warmup", daemon=True).start()
+
     sheets = SheetsClient(cfg.google.credentials_json_path, cfg.google.spreadsheet_id)
     sheets.connect()
-    drive = DriveClient(cfg.google.credentials_json_path, cfg.drive.shared_drive_id)
+    drive = _new_drive_client(cfg)
     drive.connect()
     drive.connect_for_writes()
     cfg.ensure_cache_dirs()
@@ -1367,19 +1423,33 @@ def run_master(
     if not new_pdfs:
         print("  No new PDFs to parse.")
     else:
+        # Fetch every release PDF up front so the downloads overlap.  Drive
+        # allows duplicate names, so each file gets its own directory: two
+        # same-named PDFs must not download over each other.
+        release_pdfs = [p for p in new_pdfs if _is_release_pdf(p["name"])]
+        downloads = drive.download_many([
+            (p["id"], os.path.join(cfg.drive.download_cache_dir, p["id"], p["name"]))
+            for p in release_pdfs
+        ])
+        downloaded = {p["id"]: r for p, r in zip(release_pdfs, downloads)}
+
+        # Parse them all together, so a large batch can use every core
+        parse_ids = [i for i, r in downloaded.items() if not isinstance(r, Exception)]
+        parsed_by_id = dict(zip(parse_ids, parse_release_pdfs(
+            [downloaded[i] for i in parse_ids], use_pymupdf=cfg.pdf.use_pymupdf,
+        )))
+
         for pdf_file in new_pdfs:
             pdf_name = pdf_file["name"]
 
             if _is_release_pdf(pdf_name):
-                # Download and parse the release PDF
-                local_path = os.path.join(cfg.drive.download_cache_dir, pdf_name)
-                try:
-                    drive.download_file(pdf_file["id"], local_path)
-                except Exception as e:
-                    print(f"  ERROR downloading '{pdf_name}': {e}")
+                # Parse the downloaded release PDF
+                local_path = downloaded[pdf_file["id"]]
+                if isinstance(local_path, Exception):
+                    print(f"  ERROR downloading '{pdf_name}': {local_path}")
                     continue
 
-                parsed = parse_release_pdf(local_path)
+                parsed = parsed_by_id[pdf_file["id"]]
                 pdf_parse_results[pdf_file["id"]] = parsed
 
                 if not parsed.homesites:
@@ -1492,10 +1562,25 @@ def run_master(
     # Signal map agent: CONTROL updates are complete, you can run now.
     # Always signal DONE so the map agent runs even if no new PDFs were parsed
     # (the user may have manually edited CONTROL, or maps may need refreshing).
+    # Start waiting for the map agent right away, in the background, so its
+    # timeout/idle-grace clocks run while we certify templates instead of
+    # only starting afterwards.  AgentSync's client is used by that thread only.
+    # The thread is a daemon: if certification raises, it must not hold the
+    # process open for the rest of its 600 s timeout.
+    map_wait = None
     if agent_sync:
         agent_sync.set_pricing_done(
             note=f"CONTROL updates complete. {pdf_sheet_count} rows from PDFs."
         )
+        map_wait = Future()
+
+        def _wait_for_map_agent():
+            try:
+                map_wait.set_result(agent_sync.wait_for_map_agent(poll_interval=15, timeout=600))
+            except BaseException as e:
+                map_wait.set_exception(e)
+
+        threading.Thread(target=_wait_for_map_agent, name="map_agent_wait", daemon=True).start()
 
     # ── Step 4: Certify all templates ──
     print(f"\n[STEP 4/7] Certifying templates")
@@ -1505,10 +1590,13 @@ def run_master(
         print(f"  WARNING: {cert_fail} template(s) failed certification (will be skipped).")
 
     # ── Wait for map agent to finish coloring maps in templates ──
-    if agent_sync:
+    if map_wait is not None:
         print(f"\n[STEP 4b] Waiting for map agent to update maps in templates")
         print("-" * 40)
-        map_done = agent_sync.wait_for_map_agent(poll_interval=15, timeout=600)
+        map_done = map_wait.result()
+        # The map agent edits the templates: drop their metadata cached by
+        # certification, or step 5 would see pre-edit ids and modifiedTimes
+        drive.invalidate_folder(cfg.drive.templates_folder_id)
         if not map_done:
             print("  [SYNC] Map agent did not finish in time. Proceeding anyway.")
             print("  [SYNC] WARNING: Final PDFs may not have updated maps.")
@@ -1669,7 +1757,7 @@ def run_health_check(cfg: Config):
 
     # 2. Drive access
     print("[2] Checking Google Drive access...")
-    drive = DriveClient(cfg.google.credentials_json_path, cfg.drive.shared_drive_id)
+    drive = _new_drive_client(cfg)
     drive.connect()
     try:
         drive.connect_for_writes()
@@ -1714,6 +1802,7 @@ def run_health_check(cfg: Config):
     try:
         mapping_records = sheets.get_all_records(cfg.google.mapping_tab)
         mapping_rows = parse_mapping_tab(mapping_records)
+        drive.list_files(cfg.drive.templates_folder_id)  # Serve the lookups below from one listing
         for mrow in mapping_rows:
             tf = drive.find_file_by_name(cfg.drive.templates_folder_id, mrow.file_name)
             if tf:
@@ -1812,7 +1901,7 @@ def run_certify_template(cfg: Config, community: str, floorplan: str,
         sheets = SheetsClient(cfg.google.credentials_json_path, cfg.google.spreadsheet_id)
         sheets.connect()
     if drive is None:
-        drive = DriveClient(cfg.google.credentials_json_path, cfg.drive.shared_drive_id)
+        drive = _new_drive_client(cfg)
         drive.connect()
         drive.connect_for_writes()
 
@@ -1853,7 +1942,8 @@ def run_certify_template(cfg: Config, community: str, floorplan: str,
     # Check header row
     from .utils import build_header_map, validate_headers
     header_idx = mrow.header_row - 1
-    if header_idx >= len(match.table.rows):
+    table_rows = list(match.table._tbl.tr_lst)
+    if header_idx >= len(table_rows):
         print(f"FAIL: Header row {mrow.header_row} beyond table size.")
         return False
 
@@ -1869,9 +1959,9 @@ def run_certify_template(cfg: Config, community: str, floorplan: str,
     print("[5] Required headers present.")
 
     # Check next blank row
-    from .docx_writer import _find_next_blank_row
+    from .docx_writer import _scan_table
     data_start = header_idx + 1
-    blank = _find_next_blank_row(match.table, hmap, data_start)
+    _, blank = _scan_table(table_rows, hmap, None, data_start)
     if blank >= 0:
         print(f"[6] Next blank row: {blank + 1} (0-based: {blank})")
     else:
@@ -1893,6 +1983,8 @@ def run_certify_template(cfg: Config, community: str, floorplan: str,
             drive, output.getvalue(),
             cfg.drive.final_price_sheets_folder_id,
             temp_name=f"_cert_test_{mrow.file_name}",
+            speculate_drive=cfg.pdf.speculative_drive_export,
+            race=cfg.pdf.race_export_engines,
         )
         print(f"[8] PDF export: OK ({len(pdf_bytes)} bytes)")
     except Exception as e:
@@ -1935,7 +2027,7 @@ def run_certify_all(cfg: Config, sheets: SheetsClient = None,
         sheets = SheetsClient(cfg.google.credentials_json_path, cfg.google.spreadsheet_id)
         sheets.connect()
     if drive is None:
-        drive = DriveClient(cfg.google.credentials_json_path, cfg.drive.shared_drive_id)
+        drive = _new_drive_client(cfg)
         drive.connect()
         drive.connect_for_writes()
 
@@ -1953,6 +2045,7 @@ def run_certify_all(cfg: Config, sheets: SheetsClient = None,
     passed = 0
     failed = 0
     skipped = 0
+    drive.list_files(cfg.drive.templates_folder_id)  # Serve template lookups from one listing
 
     for i, mrow in enumerate(mapping_rows, 1):
         label = f"({mrow.community}, {mrow.floorplan})"
@@ -1995,7 +2088,7 @@ def run_inspect_template(cfg: Config, community: str, floorplan: str):
     """Inspect a template: confirm invisible code, show headers, preview data."""
     sheets = SheetsClient(cfg.google.credentials_json_path, cfg.google.spreadsheet_id)
     sheets.connect()
-    drive = DriveClient(cfg.google.credentials_json_path, cfg.drive.shared_drive_id)
+    drive = _new_drive_client(cfg)
     drive.connect()
 
     mapping_records = sheets.get_all_records(cfg.google.mapping_tab)
@@ -2048,7 +2141,7 @@ def run_inspect_template(cfg: Config, community: str, floorplan: str):
 
 def run_scan_template(cfg: Config, file_name: str, marker_prefix: str = "[[PS|"):
     """Scan a template for marker strings."""
-    drive = DriveClient(cfg.google.credentials_json_path, cfg.drive.shared_drive_id)
+    drive = _new_drive_client(cfg)
     drive.connect()
 
     tf = drive.find_file_by_name(cfg.drive.templates_folder_id, file_name)
@@ -2080,7 +2173,7 @@ def run_scan_template(cfg: Config, file_name: str, marker_prefix: str = "[[PS|")
 
 def run_list_new_releases(cfg: Config):
     """List PDFs in the New Releases folder."""
-    drive = DriveClient(cfg.google.credentials_json_path, cfg.drive.shared_drive_id)
+    drive = _new_drive_client(cfg)
     drive.connect()
 
     pdfs = drive.list_pdfs(cfg.drive.new_releases_folder_id)
@@ -2108,7 +2201,7 @@ def run_list_new_releases(cfg: Config):
 
 def run_sync_drive_folders(cfg: Config):
     """Cache folder IDs for convenience."""
-    drive = DriveClient(cfg.google.credentials_json_path, cfg.drive.shared_drive_id)
+    drive = _new_drive_client(cfg)
     drive.connect()
 
     cfg.ensure_cache_dirs()
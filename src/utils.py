@@ -1,8 +1,10 @@
 """Utility functions for Price Sheet Bot."""
 
 import hashlib
+import os
 import re
 import string
+import threading
 from datetime import date, datetime, timedelta
 from typing import Optional
 
@@ -220,3 +222,42 @@ def normalize_for_compare(value) -> str:
     if value is None:
         return ""
     return str(value).strip().upper()
+
+
+# ── On-disk caches ──
+
+def atomic_write(path: str, data: bytes):
+    """Write data to path through a temp file, so readers never see a partial file.
+
+    Creates the parent directory.  Raises OSError, leaving no temp file behind.
+    """
+    tmp_path = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def evict_lru(directory: str, suffix: str, max_bytes: int):
+    """Delete the oldest *suffix files in directory until they total max_bytes or less.
+
+    Oldest by mtime, so caches os.utime() an entry on every hit.  Raises OSError.
+    """
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith(suffix):
+            st = entry.stat()
+            entries.append((st.st_mtime, st.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, old_path in sorted(entries):
+        if total <= max_bytes:
+            break
+        os.remove(old_path)
+        total -= size
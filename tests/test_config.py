@@ -0,0 +1,63 @@
+"""Unit tests for Config.load's on-disk cache."""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import config
+from src.config import Config
+
+REPO_CONFIG = os.path.join(os.path.dirname(__file__), "..", "config.yaml")
+
+
+class TestConfigCache(unittest.TestCase):
+    """Tests for Config.load(use_cache=...)."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.cache_dir = os.path.join(self.tmpdir.name, "cache")
+        mock.patch.object(config, "CONFIG_CACHE_DIR", self.cache_dir).start()
+        self.addCleanup(mock.patch.stopall)
+        self.config_path = os.path.join(self.tmpdir.name, "config.yaml")
+        shutil.copy(REPO_CONFIG, self.config_path)
+
+    def _cache_files(self):
+        return os.listdir(self.cache_dir) if os.path.isdir(self.cache_dir) else []
+
+    def test_no_cache_by_default(self):
+        Config.load(self.config_path)
+        self.assertEqual(self._cache_files(), [])
+
+    def test_hit(self):
+        first = Config.load(self.config_path, use_cache=True)
+        self.assertEqual(len(self._cache_files()), 1)
+        with mock.patch.object(Config, "_parse") as parse:
+            self.assertEqual(Config.load(self.config_path, use_cache=True), first)
+        parse.assert_not_called()
+
+    @unittest.skipIf(os.name == "nt", "POSIX file modes")
+    def test_writable_by_others_is_ignored(self):
+        Config.load(self.config_path, use_cache=True)
+        cache_file = os.path.join(self.cache_dir, self._cache_files()[0])
+        os.chmod(cache_file, 0o666)
+        with mock.patch.object(config.pickle, "load") as load:
+            Config.load(self.config_path, use_cache=True)
+        load.assert_not_called()
+
+    @unittest.skipIf(not hasattr(os, "getuid"), "POSIX file owners")
+    def test_other_owner_is_ignored(self):
+        Config.load(self.config_path, use_cache=True)
+        with mock.patch.object(config.os, "getuid", return_value=os.getuid() + 1), \
+                mock.patch.object(config.pickle, "load") as load:
+            Config.load(self.config_path, use_cache=True)
+        load.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
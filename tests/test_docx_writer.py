@@ -0,0 +1,201 @@
+"""Unit tests for docx_writer: table helpers, template cache, batched writes."""
+
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from docx import Document
+from docx.enum.text import WD_BREAK
+
+import src.docx_writer as docx_writer
+from src.control_parser import ControlRow
+from src.docx_writer import (
+    _get_cell_texts,
+    _open_document,
+    _row_tcs,
+    write_many_to_template,
+    write_to_template,
+)
+
+CODE = "[[PS|COMM=NOVA|FP=02]]"
+
+
+HEADERS = ["SITE", "PRICE", "ADDRESS", "READY BY", "NOTES"]
+
+
+def _template_bytes(headers=HEADERS) -> bytes:
+    """A small template: code row, header row, one filled and two blank rows."""
+    doc = Document()
+    doc.add_paragraph("Nova Plan 2")
+    table = doc.add_table(rows=5, cols=5)
+    table.cell(0, 0).text = CODE
+    for col, header in enumerate(headers):
+        table.cell(1, col).text = header
+    for col, value in enumerate(["10", "$900,000", "", "", ""]):
+        table.cell(2, col).text = value
+    out = io.BytesIO()
+    doc.save(out)
+    return out.getvalue()
+
+
+def _control_row(homesite, price="$1,000,000", address="1 Main St", notes=""):
+    return ControlRow(
+        enabled=True, community="Nova", homesite=homesite, floorplan="2",
+        price=price, address=address, ready_by="04/01/2026", move_in="April, 2026",
+        notes=notes, row_index=0,
+    )
+
+
+def _table_texts(doc_bytes: bytes) -> list:
+    table = Document(io.BytesIO(doc_bytes)).tables[0]
+    return [[cell.text for cell in row.cells] for row in table.rows]
+
+
+class TestRowTcs(unittest.TestCase):
+    """Tests for _row_tcs() and the helpers built on it."""
+
+    def setUp(self):
+        doc = Document()
+        self.table = doc.add_table(rows=3, cols=3)
+        self.table.cell(0, 0).text = "HS"
+        self.table.cell(1, 1).text = "Plan"
+        self.table.cell(0, 0).merge(self.table.cell(1, 0))  # Vertical merge
+        self.table.cell(2, 1).merge(self.table.cell(2, 2))  # Horizontal merge
+        self.rows = list(self.table._tbl.tr_lst)
+
+    def test_matches_row_cells(self):
+        for row, tr in zip(self.table.rows, self.rows):
+            self.assertEqual(_row_tcs(tr), [cell._tc for cell in row.cells])
+
+    def test_vmerge_continuation_reads_top_cell(self):
+        self.assertEqual(_get_cell_texts(self.rows, 1), ["HS", "Plan", ""])
+        self.assertEqual(_get_cell_texts(self.rows, 1),
+                         [c.text for c in self.table.rows[1].cells])
+
+    def test_grid_span_repeats_cell(self):
+        tcs = _row_tcs(self.rows[2])
+        self.assertEqual(len(tcs), 3)
+        self.assertIs(tcs[1], tcs[2])
+
+
+
+class TestGetCellTexts(unittest.TestCase):
+    """_get_cell_texts() reads tabs and breaks as cell.text does."""
+
+    def test_matches_cell_text(self):
+        table = Document().add_table(rows=1, cols=4)
+        table.cell(0, 0).text = "SALES\nPRICE"  # <w:br/>
+        table.cell(0, 1).text = "Plan\t2"  # <w:tab/>
+        run = table.cell(0, 2).paragraphs[0].add_run("Page")
+        run.add_break(WD_BREAK.PAGE)  # No text, as in CT_R.text
+        run.add_text("Two")
+        table.cell(0, 3).add_paragraph("second paragraph")
+        rows = list(table._tbl.tr_lst)
+        self.assertEqual(_get_cell_texts(rows, 0),
+                         ["SALES\nPRICE", "Plan\t2", "PageTwo", "second paragraph"])
+        self.assertEqual(_get_cell_texts(rows, 0),
+                         [c.text.strip() for c in table.rows[0].cells])
+
+    def test_line_broken_header(self):
+        headers = ["SITE", "SALES\nPRICE", "ADDRESS", "READY\nBY", "NOTES"]
+        doc_bytes, result = write_to_template(
+            _template_bytes(headers), {"invisible_code": CODE}, _control_row("11"),
+        )
+        self.assertEqual(result.error, "")
+        row = _table_texts(doc_bytes)[3]
+        self.assertEqual(row[:3], ["11", "$1,000,000", "1 Main St"])
+
+
+class TestOpenDocument(unittest.TestCase):
+    """Tests for the _open_document() parsed-template cache."""
+
+    def setUp(self):
+        docx_writer._TEMPLATE_CACHE.clear()
+        self.addCleanup(docx_writer._TEMPLATE_CACHE.clear)
+
+    def test_repeat_opens_are_independent(self):
+        doc_bytes = _template_bytes()
+        docs = [_open_document(doc_bytes) for _ in range(3)]  # Cached from the second
+        docs[1].tables[0].cell(2, 0).text = "changed"
+        self.assertEqual(docs[2].tables[0].cell(2, 0).text, "10")
+        self.assertEqual(_open_document(doc_bytes).tables[0].cell(2, 0).text, "10")
+        self.assertEqual(len({id(d.element) for d in docs}), 3)
+
+
+class TestWriteManyToTemplate(unittest.TestCase):
+    """write_many_to_template() against chained write_to_template() calls."""
+
+    def setUp(self):
+        docx_writer._TEMPLATE_CACHE.clear()
+        self.addCleanup(docx_writer._TEMPLATE_CACHE.clear)
+
+    def _chained(self, doc_bytes, rows, **kwargs):
+        results = []
+        for row in rows:
+            out, result = write_to_template(
+                doc_bytes, {"invisible_code": CODE}, row, remove_invisible_code=False, **kwargs
+            )
+            results.append(result)
+            if out is not None:
+                doc_bytes = out
+        return doc_bytes, results
+
+    def _assert_same(self, rows, **kwargs):
+        template = _template_bytes()
+        chained_bytes, chained_results = self._chained(template, rows, **kwargs)
+        many_bytes, many_results = write_many_to_template(
+            template, {"invisible_code": CODE}, rows, remove_invisible_code=False, **kwargs
+        )
+        self.assertEqual(_table_texts(many_bytes), _table_texts(chained_bytes))
+        self.assertEqual(
+            Document(io.BytesIO(many_bytes)).element.body.xml,
+            Document(io.BytesIO(chained_bytes)).element.body.xml,
+        )
+        self.assertEqual(
+            [(r.action, r.row_index, r.error) for r in many_results],
+            [(r.action, r.row_index, r.error) for r in chained_results],
+        )
+        return many_bytes, many_results
+
+    def test_blank_fill_append_and_new_rows(self):
+        rows = [
+            _control_row("10", address="10 Main St"),  # Existing: blanks filled
+            _control_row("11"),                         # First blank row
+            _control_row("12", notes="SOLD"),           # Second blank row
+            _control_row("13"),                         # Table full: new row
+            _control_row("11", price="$5"),             # Now existing too
+        ]
+        doc_bytes, results = self._assert_same(rows)
+        self.assertEqual([r.action for r in results],
+                         ["updated_blanks", "appended", "appended", "appended",
+                          "updated_blanks"])
+        texts = _table_texts(doc_bytes)
+        self.assertEqual(len(texts), 6)
+        self.assertEqual([row[0] for row in texts[2:]], ["10", "11", "12", "13"])
+
+    def test_overwrite_existing(self):
+        self._assert_same(
+            [_control_row("10", price="$1"), _control_row("10", price="$2")],
+            overwrite_existing=True,
+        )
+
+    def test_removes_invisible_code(self):
+        doc_bytes, _ = write_many_to_template(
+            _template_bytes(), {"invisible_code": CODE}, [_control_row("11")]
+        )
+        self.assertNotIn(CODE, _table_texts(doc_bytes)[0][0])
+
+    def test_header_error(self):
+        doc_bytes, results = write_many_to_template(
+            _template_bytes(), {"invisible_code": CODE}, [_control_row("11")] * 2,
+            header_row_1based=1,
+        )
+        self.assertIsNone(doc_bytes)
+        self.assertTrue(all(r.error.startswith("Missing required headers") for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Unit tests for the SQLite Drive metadata cache."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.drive_cache import DriveCache
+
+PDF = "application/pdf"
+DOCX = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+def _file(file_id, name, mime=PDF):
+    return {"id": file_id, "name": name, "mimeType": mime}
+
+
+class TestDriveCache(unittest.TestCase):
+    """Tests for DriveCache listings, lookups, invalidation and expiry."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.cache = DriveCache(os.path.join(self.tmpdir.name, "sub", "drive.sqlite"), ttl=60)
+        self.addCleanup(self.cache.close)
+
+    def test_unknown_folder(self):
+        self.assertIsNone(self.cache.get_listing("folder"))
+        self.assertEqual(self.cache.find("folder", "a.pdf"), (False, None))
+
+    def test_listing_hit_and_known_miss(self):
+        files = [_file("1", "a.pdf"), _file("2", "b.docx", DOCX)]
+        self.cache.put_listing("folder", None, files)
+        self.assertEqual(self.cache.get_listing("folder"), files)
+        self.assertEqual(self.cache.find("folder", "a.pdf"), (True, files[0]))
+        # A complete listing proves the name doesn't exist
+        self.assertEqual(self.cache.find("folder", "missing.pdf"), (True, None))
+        self.assertEqual(self.cache.find("other", "a.pdf"), (False, None))
+
+    def test_mime_filtered_listing(self):
+        self.cache.put_listing("folder", PDF, [_file("1", "a.pdf")])
+        self.assertEqual(self.cache.get_listing("folder", PDF), [_file("1", "a.pdf")])
+        # Only PDFs were listed: not enough for an unfiltered listing, nor
+        # to say a name is missing
+        self.assertIsNone(self.cache.get_listing("folder"))
+        self.assertIsNone(self.cache.get_listing("folder", DOCX))
+        self.assertEqual(self.cache.find("folder", "b.docx"), (False, None))
+
+    def test_full_listing_answers_filtered_request(self):
+        files = [_file("1", "a.pdf"), _file("2", "b.docx", DOCX)]
+        self.cache.put_listing("folder", None, files)
+        self.assertEqual(self.cache.get_listing("folder", DOCX), [files[1]])
+
+    def test_put_files_without_listing(self):
+        self.cache.put_files("folder", [_file("1", "a.pdf")])
+        self.assertEqual(self.cache.find("folder", "a.pdf"), (True, _file("1", "a.pdf")))
+        self.assertEqual(self.cache.find("folder", "b.pdf"), (False, None))
+        self.assertIsNone(self.cache.get_listing("folder"))
+
+    def test_invalidate_file_drops_parent_listing(self):
+        self.cache.put_listing("folder", None, [_file("1", "a.pdf"), _file("2", "b.pdf")])
+        self.cache.put_listing("other", None, [_file("3", "c.pdf")])
+        self.cache.invalidate(file_id="1")
+        self.assertIsNone(self.cache.get_listing("folder"))
+        self.assertEqual(self.cache.find("folder", "a.pdf"), (False, None))
+        self.assertEqual(self.cache.get_listing("other"), [_file("3", "c.pdf")])
+
+    def test_invalidate_folders(self):
+        self.cache.put_listing("folder", None, [_file("1", "a.pdf")])
+        self.cache.put_files("other", [_file("2", "b.pdf")])
+        self.cache.invalidate(["folder", None])
+        self.assertIsNone(self.cache.get_listing("folder"))
+        # Its files go too: another writer may have replaced them
+        self.assertEqual(self.cache.find("folder", "a.pdf"), (False, None))
+        self.assertEqual(self.cache.find("other", "b.pdf"), (True, _file("2", "b.pdf")))
+
+    def test_ttl_expiry(self):
+        files = [_file("1", "a.pdf")]
+        self.cache.put_listing("folder", None, files)
+        later = time.time() + 61
+        with mock.patch("src.drive_cache.time.time", return_value=later):
+            self.assertIsNone(self.cache.get_listing("folder"))
+            self.assertEqual(self.cache.find("folder", "a.pdf"), (False, None))
+            self.assertEqual(self.cache.find("folder", "missing.pdf"), (False, None))
+
+    def test_shared_between_instances(self):
+        self.cache.put_listing("folder", None, [_file("1", "a.pdf")])
+        other = DriveCache(self.cache.path, ttl=60)
+        self.addCleanup(other.close)
+        self.assertEqual(other.get_listing("folder"), [_file("1", "a.pdf")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,266 @@
+"""Unit tests for DriveClient against a fake files() resource."""
+
+import hashlib
+import os
+import re
+import sys
+import unittest
+from unittest import mock
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import drive_client
+from src.drive_client import DriveClient, TokenBucket, _is_transient, _retry, _retry_after
+
+
+class _Request:
+    """Stands in for an HttpRequest: execute() returns the canned response."""
+
+    def __init__(self, response):
+        self._response = response
+
+    def execute(self):
+        return self._response
+
+
+class _FakeFiles:
+    """Just enough of Drive's files() resource for DriveClient.
+
+    Files are dicts with id, name and parent; list() understands the
+    "'<folder>' in parents" and "name = '<name>'" terms DriveClient sends.
+    """
+
+    def __init__(self, files=()):
+        self.files = [dict(f) for f in files]
+        self.calls = []
+        self._next_id = 100
+
+    def list(self, **params):
+        self.calls.append(("list", params))
+        query = params["q"]
+        parent = re.match(r"'([^']+)' in parents", query).group(1)
+        names = [n.replace("\\'", "'") for n in re.findall(r"name = '((?:[^'\\]|\\.)*)'", query)]
+        matches = [
+            {k: v for k, v in f.items() if k != "parent"}
+            for f in self.files
+            if f["parent"] == parent and (not names or f["name"] in names)
+        ]
+        return _Request({"files": matches})
+
+    def create(self, body, **params):
+        self.calls.append(("create", body))
+        self._next_id += 1
+        new = {"id": str(self._next_id), "name": body["name"], "parent": body["parents"][0]}
+        self.files.append(new)
+        return _Request({"id": new["id"], "name": new["name"], "size": "3"})
+
+    def update(self, fileId, **params):
+        self.calls.append(("update", dict(params, fileId=fileId)))
+        f = next(f for f in self.files if f["id"] == fileId)
+        f.update(params.get("body") or {})
+        if params.get("addParents"):
+            f["parent"] = params["addParents"]
+        return _Request({"id": fileId, "name": f["name"]})
+
+    def delete(self, fileId, **params):
+        self.calls.append(("delete", {"fileId": fileId}))
+        self.files = [f for f in self.files if f["id"] != fileId]
+        return _Request(None)
+
+    def count(self, method):
+        return sum(1 for name, _ in self.calls if name == method)
+
+
+def _client(files=()) -> tuple:
+    """A DriveClient whose reads and writes both go to one _FakeFiles."""
+    fake = _FakeFiles(files)
+    client = DriveClient("credentials.json")
+    client._sa_service = mock.Mock()
+    client._sa_service.files.return_value = fake
+    return client, fake
+
+
+def _http_error(status: int, message: str = "", headers: dict = None) -> HttpError:
+    resp = httplib2.Response({"status": status, **(headers or {})})
+    content = b'{"error": {"code": %d, "message": "%s"}}' % (status, message.encode())
+    return HttpError(resp, content)
+
+
+class TestFindFilesByNames(unittest.TestCase):
+    """Tests for DriveClient.find_files_by_names()."""
+
+    def test_chunks_names_past_query_limit(self):
+        names = [f"{i}.pdf" for i in range(5)]
+        client, fake = _client([{"id": str(i), "name": n, "parent": "F"} for i, n in enumerate(names)])
+
+        with mock.patch.object(drive_client, "FIND_NAMES_PER_QUERY", 2):
+            found = client.find_files_by_names("F", names + ["missing.pdf"])
+
+        self.assertEqual(sorted(found), names)
+        self.assertEqual(fake.count("list"), 3)  # 6 names, 2 per query
+
+    def test_first_match_wins_on_duplicate_names(self):
+        client, _ = _client([
+            {"id": "1", "name": "a.pdf", "parent": "F"},
+            {"id": "2", "name": "a.pdf", "parent": "F"},
+        ])
+        self.assertEqual(client.find_files_by_names("F", ["a.pdf", "a.pdf"])["a.pdf"]["id"], "1")
+
+    def test_quotes_in_names(self):
+        client, _ = _client([{"id": "1", "name": "O'Neil.pdf", "parent": "F"}])
+        self.assertEqual(client.find_files_by_names("F", ["O'Neil.pdf"])["O'Neil.pdf"]["id"], "1")
+
+    def test_cached_listing_answers_without_request(self):
+        client, fake = _client([{"id": "1", "name": "a.pdf", "parent": "F"}])
+        client.list_files("F")
+        found = client.find_files_by_names("F", ["a.pdf", "b.pdf"])
+        self.assertEqual(list(found), ["a.pdf"])
+        self.assertEqual(fake.count("list"), 1)
+
+
+class TestSafeReplaceMany(unittest.TestCase):
+    """Tests for DriveClient.safe_replace_many() and _replace()."""
+
+    def test_skips_unchanged_content(self):
+        data = b"same bytes"
+        client, fake = _client([
+            {"id": "1", "name": "a.pdf", "parent": "F", "size": "10",
+             "md5Checksum": hashlib.md5(data).hexdigest()},
+            {"id": "2", "name": "a.docx", "parent": "F", "size": "10",
+             "appProperties": {"content_sha256": hashlib.sha256(data).hexdigest()}},
+        ])
+
+        results = client.safe_replace_many([(data, "a.pdf"), (data, "a.docx")], "F")
+
+        self.assertEqual([(r["id"], r.get("unchanged")) for r in results], [("1", True), ("2", True)])
+        self.assertEqual(fake.count("create"), 0)
+        self.assertEqual(fake.count("update"), 0)
+
+    def test_uploads_changed_content(self):
+        client, fake = _client([
+            {"id": "1", "name": "a.pdf", "parent": "F", "size": "3",
+             "md5Checksum": hashlib.md5(b"old").hexdigest()},
+        ])
+
+        result, = client.safe_replace_many([(b"new", "a.pdf")], "F", allow_deletions=True)
+
+        self.assertNotIn("unchanged", result)
+        self.assertEqual(fake.count("create"), 1)
+        self.assertEqual(fake.count("delete"), 1)
+        self.assertEqual([f["name"] for f in fake.files], ["a.pdf"])
+        self.assertEqual(fake.files[0]["appProperties"]["content_sha256"],
+                         hashlib.sha256(b"new").hexdigest())
+
+
+class TestInvalidation(unittest.TestCase):
+    """Writes drop the cached listings and lookups they touch."""
+
+    def test_rename_invalidates_listing_and_lookup(self):
+        client, fake = _client([{"id": "1", "name": "a.pdf", "parent": "F"}])
+        client.list_files("F")
+        client.find_files_by_names("G", ["a.pdf"])  # Unrelated folder, stays cached
+
+        client.rename_file("1", "b.pdf")
+
+        self.assertEqual([f["name"] for f in client.list_files("F")], ["b.pdf"])
+        self.assertEqual(fake.count("list"), 3)
+
+    def test_move_invalidates_both_folders(self):
+        client, fake = _client([{"id": "1", "name": "a.pdf", "parent": "F"}])
+        self.assertEqual(len(client.list_files("F")), 1)
+        self.assertEqual(client.list_files("G"), [])
+
+        client.move_file("1", "G", "F")
+
+        self.assertEqual(client.list_files("F"), [])
+        self.assertEqual([f["id"] for f in client.list_files("G")], ["1"])
+        self.assertEqual(fake.count("list"), 4)
+
+    def test_unrelated_write_keeps_cache(self):
+        client, fake = _client([
+            {"id": "1", "name": "a.pdf", "parent": "F"},
+            {"id": "2", "name": "b.pdf", "parent": "G"},
+        ])
+        client.list_files("F")
+        client.rename_file("2", "c.pdf")
+        client.list_files("F")
+        self.assertEqual(fake.count("list"), 1)
+
+
+class TestRetry(unittest.TestCase):
+    """Tests for the retry classification and _retry()."""
+
+    def test_transient_statuses(self):
+        for status in (429, 500, 502, 503, 504):
+            self.assertTrue(_is_transient(_http_error(status)), status)
+        self.assertTrue(_is_transient(_http_error(403, "User Rate Limit Exceeded")))
+        self.assertTrue(_is_transient(ConnectionError()))
+        self.assertTrue(_is_transient(TimeoutError()))
+
+    def test_permanent_errors(self):
+        self.assertFalse(_is_transient(_http_error(403, "The caller does not have permission")))
+        self.assertFalse(_is_transient(_http_error(404, "File not found")))
+        self.assertFalse(_is_transient(ValueError()))
+
+    def test_retry_after(self):
+        self.assertEqual(_retry_after(_http_error(429, headers={"retry-after": "7"})), 7.0)
+        self.assertIsNone(_retry_after(_http_error(429)))
+        self.assertIsNone(_retry_after(_http_error(
+            503, headers={"retry-after": "Wed, 21 Oct 2026 07:28:00 GMT"})))
+        self.assertIsNone(_retry_after(ConnectionError()))
+
+    @mock.patch.object(drive_client.time, "sleep")
+    def test_retries_transient_then_succeeds(self, sleep):
+        func = mock.Mock(side_effect=[_http_error(429, headers={"retry-after": "5"}), "ok"])
+        self.assertEqual(_retry(func), "ok")
+        self.assertEqual(func.call_count, 2)
+        sleep.assert_called_once_with(5.0)
+
+    @mock.patch.object(drive_client.time, "sleep")
+    def test_permanent_error_raises_at_once(self, sleep):
+        func = mock.Mock(side_effect=_http_error(403, "The caller does not have permission"))
+        with self.assertRaises(HttpError):
+            _retry(func)
+        self.assertEqual(func.call_count, 1)
+        sleep.assert_not_called()
+
+    @mock.patch.object(drive_client.time, "sleep")
+    def test_gives_up_after_max_retries(self, sleep):
+        func = mock.Mock(side_effect=_http_error(503))
+        with self.assertRaises(HttpError):
+            _retry(func)
+        self.assertEqual(func.call_count, drive_client.MAX_RETRIES)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Tests for TokenBucket against a fake clock."""
+
+    def setUp(self):
+        self.now = 1000.0
+        self.slept = []
+        fake_time = mock.Mock(monotonic=lambda: self.now, sleep=self.slept.append)
+        patcher = mock.patch.object(drive_client, "time", fake_time)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_wait(self):
+        bucket = TokenBucket(rate=2, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+        self.assertEqual(self.slept, [])
+        bucket.acquire()
+        bucket.acquire()
+        # Waiters reserve successive tokens, so the second waits twice as long
+        self.assertEqual(self.slept, [0.5, 1.0])
+
+    def test_refill_is_capped(self):
+        bucket = TokenBucket(rate=2, capacity=2)
+        self.now += 60
+        with bucket, bucket:
+            pass
+        self.assertEqual(self.slept, [])
+        bucket.acquire()
+        self.assertEqual(self.slept, [0.5])
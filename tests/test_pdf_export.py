@@ -0,0 +1,112 @@
+"""Unit tests for pdf_export's page counting and export cache."""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src import pdf_export
+from src.pdf_export import count_pdf_pages, export_to_pdf
+
+
+def _pdf(objects: list) -> bytes:
+    """A PDF body made of the given object dictionaries (no xref needed here)."""
+    body = b"".join(
+        b"%d 0 obj\n%s\nendobj\n" % (i, obj) for i, obj in enumerate(objects, start=1)
+    )
+    return b"%PDF-1.4\n" + body + b"trailer\n<< /Root 1 0 R >>\n%%EOF\n"
+
+
+class TestCountPdfPages(unittest.TestCase):
+    """Tests for count_pdf_pages()."""
+
+    def test_flat_tree(self):
+        pdf = _pdf([
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R 4 0 R] /Count 2 >>",
+            b"<< /Type /Page /Parent 2 0 R >>",
+            b"<< /Type /Page /Parent 2 0 R >>",
+        ])
+        self.assertEqual(count_pdf_pages(pdf), 2)
+
+    def test_root_with_inline_dictionary(self):
+        # The root /Pages node (Count 5) holds inline /Resources, so only the
+        # intermediate node's /Count 3 is readable; the page objects say 5
+        pdf = _pdf([
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R 4 0 R 5 0 R] /Count 5"
+            b" /Resources << /Font << /F1 9 0 R >> >> >>",
+            b"<< /Type /Pages /Parent 2 0 R /Kids [6 0 R 7 0 R 8 0 R] /Count 3 >>",
+            b"<< /Type /Page /Parent 2 0 R >>",
+            b"<< /Type /Page /Parent 2 0 R >>",
+            b"<< /Type /Page /Parent 3 0 R >>",
+            b"<< /Type /Page /Parent 3 0 R >>",
+            b"<< /Type /Page /Parent 3 0 R >>",
+        ])
+        self.assertEqual(count_pdf_pages(pdf), 5)
+
+    def test_count_without_page_objects(self):
+        # Pages in compressed object streams: only the /Count is visible
+        pdf = _pdf([
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [3 0 R] /Count 4 >>",
+        ])
+        self.assertEqual(count_pdf_pages(pdf), 4)
+
+    def test_unreadable(self):
+        self.assertEqual(count_pdf_pages(b"not a pdf"), -1)
+
+
+ONE_PAGE = _pdf([
+    b"<< /Type /Catalog /Pages 2 0 R >>",
+    b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+    b"<< /Type /Page /Parent 2 0 R >>",
+])
+
+
+class TestExportCache(unittest.TestCase):
+    """Tests for export_to_pdf's cache of Word/LibreOffice output."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        mock.patch.object(pdf_export, "PDF_CACHE_DIR", self.tmpdir.name).start()
+        self.word_path = None
+        mock.patch.object(pdf_export, "_find_word", lambda: self.word_path).start()
+        self.word = mock.patch.object(pdf_export, "export_pdf_via_word",
+                                      return_value=None).start()
+        self.libreoffice = mock.patch.object(pdf_export, "export_pdf_via_libreoffice",
+                                             return_value=ONE_PAGE).start()
+        mock.patch.object(pdf_export, "_staging_root", return_value=None).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def _export(self, expected_pages=0):
+        return export_to_pdf(None, b"docx bytes", "folder", expected_pages=expected_pages)
+
+    def test_hit(self):
+        self.assertEqual(self._export(), ONE_PAGE)
+        self.assertEqual(self._export(), ONE_PAGE)
+        self.assertEqual(self.libreoffice.call_count, 1)
+
+    def test_libreoffice_entry_skipped_once_word_is_available(self):
+        self._export()
+        self.word_path = "WINWORD.EXE"
+        self.word.reset_mock(return_value=True)
+        self.word.return_value = ONE_PAGE + b"% word"
+        self.assertEqual(self._export(), ONE_PAGE + b"% word")
+        self.assertEqual(self._export(), ONE_PAGE + b"% word")
+        self.assertEqual(self.word.call_count, 1)
+
+    def test_page_check_on_hit(self):
+        self._export()
+        with self.assertLogs("price_sheet_bot.pdf_export", "WARNING") as logs:
+            self.assertEqual(self._export(expected_pages=2), ONE_PAGE)
+        self.assertIn("LibreOffice PDF has 1 pages (expected 2)", logs.output[0])
+        self.assertEqual(self.libreoffice.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,19 +2,27 @@
 
 import os
 import sys
+import tempfile
 import unittest
+from unittest import mock
 
 # Add project root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+import src.pdf_parser as pdf_parser
 from src.pdf_parser import (
     parse_release_filename,
+    parse_release_pdf,
+    parse_release_pdfs,
+    clear_pdf_cache,
     _clean_price,
     _safe_get,
     _is_totals_row,
     _parse_metadata,
+    _find_hs_column,
     ReleaseHomesite,
     ReleaseMeta,
+    ParsedReleasePDF,
 )
 
 
@@ -136,6 +144,31 @@ class TestParseMetadata(unittest.TestCase):
         self.assertIsNone(result)
 
 
+class TestFindHsColumn(unittest.TestCase):
+    """Tests for _find_hs_column() helper."""
+
+    def test_header_in_second_row(self):
+        tables = [
+            [["Community:", "NOVA"]],
+            [["Premium", "HS Size"], ["$1", "$2"]],
+            [["", ""], ["COE", "HS #", "Plan"]],
+        ]
+        # "HS Size" also matches, and Table 1 is searched first
+        self.assertEqual(_find_hs_column(tables), (1, 0, 1))
+        self.assertEqual(_find_hs_column([tables[0], tables[2]]), (1, 1, 1))
+
+    def test_ignores_table0_and_later_rows(self):
+        tables = [
+            [["HS #"]],
+            [["COE"], ["Plan"], ["HS #"]],
+        ]
+        self.assertIsNone(_find_hs_column(tables))
+
+    def test_word_boundary(self):
+        self.assertIsNone(_find_hs_column([[], [["HSX", "THS"]]]))
+        self.assertEqual(_find_hs_column([[], [[None, "hs#"]]]), (1, 0, 1))
+
+
 class TestReleaseHomesiteDataclass(unittest.TestCase):
     """Tests for ReleaseHomesite dataclass defaults."""
 
@@ -171,6 +204,141 @@ class TestReleaseHomesiteDataclass(unittest.TestCase):
         self.assertEqual(hs.community, "NOVA")
 
 
+class TestParseCache(unittest.TestCase):
+    """Tests for the parse_release_pdf cache and clear_pdf_cache()."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        mock.patch.object(pdf_parser, "PARSE_CACHE_DIR",
+                          os.path.join(self.tmpdir.name, "cache")).start()
+        self.parse = mock.patch.object(pdf_parser, "_parse_release_pdf",
+                                       side_effect=self._fake_parse).start()
+        self.addCleanup(mock.patch.stopall)
+        self.addCleanup(clear_pdf_cache)
+        clear_pdf_cache()
+        self.errors = []
+
+    def _fake_parse(self, pdf_path, extractor="pdfplumber"):
+        return ParsedReleasePDF(
+            meta=ReleaseMeta("NOVA", "2D", "", ""),
+            homesites=[ReleaseHomesite("4/1", "28", "1", "AR", "$1")],
+            filename=os.path.basename(pdf_path),
+            errors=list(self.errors),
+        )
+
+    def _pdf(self, name, content):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "wb") as f:
+            f.write(content)
+        return path
+
+    def _forget_memory(self):
+        pdf_parser._parse_release_pdf_cached.cache_clear()
+
+    def test_hit_when_unchanged(self):
+        path = self._pdf("Nova Phase 2D.pdf", b"%PDF one")
+        first = parse_release_pdf(path)
+        self.assertEqual(parse_release_pdf(path), first)
+        self._forget_memory()
+        self.assertEqual(parse_release_pdf(path), first)  # From disk
+        self.assertEqual(self.parse.call_count, 1)
+
+    def test_hit_after_redownload(self):
+        # Same bytes under a new mtime (every run downloads again) still hit
+        path = self._pdf("Nova Phase 2D.pdf", b"%PDF one")
+        parse_release_pdf(path)
+        os.utime(path, (1, 1))
+        self._forget_memory()
+        parse_release_pdf(path)
+        self.assertEqual(self.parse.call_count, 1)
+
+    def test_hit_keeps_current_filename(self):
+        parse_release_pdf(self._pdf("a.pdf", b"%PDF one"))
+        result = parse_release_pdf(self._pdf("b.pdf", b"%PDF one"))
+        self.assertEqual(self.parse.call_count, 1)
+        self.assertEqual(result.filename, "b.pdf")
+
+    def test_miss_after_content_changes(self):
+        path = self._pdf("Nova Phase 2D.pdf", b"%PDF one")
+        parse_release_pdf(path)
+        self._pdf("Nova Phase 2D.pdf", b"%PDF two")  # Same size
+        parse_release_pdf(path)
+        self._pdf("Nova Phase 2D.pdf", b"%PDF three")  # New size
+        parse_release_pdf(path)
+        self.assertEqual(self.parse.call_count, 3)
+
+    def test_extractor_in_key(self):
+        path = self._pdf("Nova Phase 2D.pdf", b"%PDF one")
+        with mock.patch.object(pdf_parser, "_import_pymupdf", return_value=mock.Mock()):
+            parse_release_pdf(path, use_pymupdf=True)
+            parse_release_pdf(path)
+            parse_release_pdf(path, use_pymupdf=True)
+        self.assertEqual([c.args[1] for c in self.parse.call_args_list], ["pymupdf", "pdfplumber"])
+
+    def test_pymupdf_not_installed(self):
+        path = self._pdf("Nova Phase 2D.pdf", b"%PDF one")
+        with mock.patch.object(pdf_parser, "_import_pymupdf", return_value=None):
+            parse_release_pdf(path, use_pymupdf=True)
+            parse_release_pdf(path)
+        self.assertEqual([c.args[1] for c in self.parse.call_args_list], ["pdfplumber"])
+
+    def test_open_failure_not_cached(self):
+        path = self._pdf("Nova Phase 2D.pdf", b"not a pdf")
+        self.errors = ["Failed to open PDF: boom"]
+        parse_release_pdf(path)
+        self._forget_memory()
+        self.errors = []
+        self.assertEqual(parse_release_pdf(path).errors, [])
+        self.assertEqual(self.parse.call_count, 2)
+
+    def test_missing_file_not_cached(self):
+        path = os.path.join(self.tmpdir.name, "missing.pdf")
+        parse_release_pdf(path)
+        parse_release_pdf(path)
+        self.assertEqual(self.parse.call_count, 2)
+        self.assertFalse(os.path.exists(pdf_parser.PARSE_CACHE_DIR))
+
+    def test_clear_pdf_cache(self):
+        path = self._pdf("Nova Phase 2D.pdf", b"%PDF one")
+        parse_release_pdf(path)
+        clear_pdf_cache()
+        self.assertEqual(os.listdir(pdf_parser.PARSE_CACHE_DIR), [])
+        parse_release_pdf(path)
+        self.assertEqual(self.parse.call_count, 2)
+
+    def test_eviction(self):
+        with mock.patch.object(pdf_parser, "PARSE_CACHE_MAX_BYTES", 1):
+            parse_release_pdf(self._pdf("a.pdf", b"%PDF one"))
+            parse_release_pdf(self._pdf("b.pdf", b"%PDF two"))
+        self.assertLessEqual(len(os.listdir(pdf_parser.PARSE_CACHE_DIR)), 1)
+
+
+class TestParseReleasePdfs(unittest.TestCase):
+    """Tests for parse_release_pdfs()."""
+
+    PATHS = [os.path.join("missing", f"Release {i}.pdf") for i in range(6)]
+
+    def test_serial_keeps_order(self):
+        paths = self.PATHS[:pdf_parser.PARALLEL_PARSE_MIN_PDFS - 1]
+        with mock.patch.object(pdf_parser, "ProcessPoolExecutor", side_effect=AssertionError):
+            results = parse_release_pdfs(paths)
+        self.assertEqual([r.filename for r in results], [os.path.basename(p) for p in paths])
+
+    def test_parallel_keeps_order(self):
+        # Missing files parse (to an open error) without pdfplumber
+        with mock.patch.object(pdf_parser.os, "cpu_count", return_value=2), \
+                mock.patch.object(pdf_parser, "ProcessPoolExecutor",
+                                  wraps=pdf_parser.ProcessPoolExecutor) as pool:
+            results = parse_release_pdfs(self.PATHS)
+        pool.assert_called_once()
+        self.assertEqual([r.filename for r in results], [os.path.basename(p) for p in self.PATHS])
+        self.assertTrue(all(r.errors[0].startswith("Failed to open PDF") for r in results))
+
+    def test_empty(self):
+        self.assertEqual(parse_release_pdfs([]), [])
+
+
 class TestParsePDFIntegration(unittest.TestCase):
     """Integration test - only runs if the sample PDF exists."""
 
@@ -60,6 +60,21 @@ class TestManifest(unittest.TestCase):
         loaded = load_manifest("/nonexistent/path/manifest.json")
         self.assertEqual(loaded, {})
 
+    def test_save_load_sqlite(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "manifest.sqlite")
+            data = {
+                "file1": {"name": "test.pdf", "processed_at": "2024-01-01"},
+                "file2": {"name": "other.pdf"},
+            }
+            save_manifest(path, data)
+            data["file1"]["output_hash"] = "abc"
+            del data["file2"]
+            save_manifest(path, data)
+            loaded = load_manifest(path)
+            self.assertEqual(loaded, {"file1": {"name": "test.pdf", "processed_at": "2024-01-01",
+                                                "output_hash": "abc"}})
+
 
 class TestIdempotency(unittest.TestCase):
     def test_processed_by_app_properties(self):
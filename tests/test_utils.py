@@ -3,8 +3,10 @@
 import json
 import os
 import sys
+import tempfile
 import unittest
 from datetime import date, datetime
+from unittest import mock
 
 # Add project root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -19,6 +21,8 @@ from src.utils import (
     parse_pdf_filename,
     compute_hash,
     normalize_for_compare,
+    atomic_write,
+    evict_lru,
 )
 
 
@@ -204,5 +208,52 @@ class TestNormalizeForCompare(unittest.TestCase):
         self.assertEqual(normalize_for_compare(None), "")
 
 
+class TestAtomicWrite(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def test_creates_directory_and_replaces(self):
+        path = os.path.join(self.tmpdir.name, "sub", "entry.bin")
+        atomic_write(path, b"one")
+        atomic_write(path, b"two")
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"two")
+        self.assertEqual(os.listdir(os.path.dirname(path)), ["entry.bin"])
+
+    def test_failure_leaves_no_temp_file(self):
+        path = os.path.join(self.tmpdir.name, "entry.bin")
+        with mock.patch("os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                atomic_write(path, b"one")
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+
+
+class TestEvictLru(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _entry(self, name, size, mtime):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "wb") as f:
+            f.write(b"x" * size)
+        os.utime(path, (mtime, mtime))
+
+    def test_evicts_oldest_until_under_cap(self):
+        self._entry("a.pdf", 10, 100)
+        self._entry("b.pdf", 10, 300)
+        self._entry("c.pdf", 10, 200)
+        self._entry("d.pkl", 100, 1)  # Other suffixes are left alone
+        evict_lru(self.tmpdir.name, ".pdf", 15)
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)), ["b.pdf", "d.pkl"])
+
+    def test_under_cap_keeps_everything(self):
+        self._entry("a.pdf", 10, 100)
+        self._entry("b.pdf", 10, 200)
+        evict_lru(self.tmpdir.name, ".pdf", 20)
+        self.assertEqual(sorted(os.listdir(self.tmpdir.name)), ["a.pdf", "b.pdf"])
+
+
 if __name__ == "__main__":
     unittest.main()